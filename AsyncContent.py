@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+
+u"""
+AsyncContent.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.1-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    Container を開いた時に プレースホルダー を表示し、content のデータを 別スレッド で取得してから content を作成する
+        - 通称: 非同期コンテント(AsyncContentLoader)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    content_factory は GUIスレッド で呼ばれる為、ファイルの一覧・ローカルキャッシュの検索 など 遅いデータが必要な
+        Container を開くと、データが揃うまで Maya の UI が止まっていました。
+    AsyncContentLoader は、登録した Container の content_factory を差し替え、
+        - 開いた時は、プレースホルダー(既定は 'Loading...' の QLabel)だけを すぐに表示し、
+        - provider(データの取得)を 別スレッド(ThreadPoolExecutor)で実行し、
+        - 結果が届いたら GUIスレッド で プレースホルダー を外し、populate(content の作成)を呼びます。
+    結果が届く前に閉じた場合は、
+        - 開始前の provider は 取り消し(順番待ちから外します)、
+        - 実行中の provider には 取り消しの合図(threading.Event)を送り、結果は捨てます。
+        content は未作成に戻り、再度 開いた時に取得し直します。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from AsyncContent import AsyncContentLoader
+
+        # 以下 e.g.):
+        ############################################################
+        def list_textures(cancelled):  # 別スレッド で実行されます
+            paths = []
+            for entry in os.scandir(texture_dir):
+                if cancelled.is_set():
+                    return None  # 閉じられた為、結果は捨てられます
+                paths.append(entry.path)
+            return paths
+
+        def build(content, paths):  # GUIスレッド で実行されます
+            layout = QtWidgets.QVBoxLayout(content)
+            for path in paths:
+                layout.addWidget(QtWidgets.QLabel(path))
+
+        loader = AsyncContentLoader(parent = window)
+        loader.attach(container, list_textures, build)
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        - 追加箇所1(+)
+            - 概要: loader の破棄時(window の close・Maya の終了時)に、別スレッド を終了させる為
+            - 詳細:
+                ::
+
+                    +   def shutdown(self, wait = False):
+                    +   self.destroyed.connect(lambda *args: _stop_loads(loads, executor))
+
+        version = '-1.1-'
+
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event
+from time import perf_counter
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject, Signal, Qt
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+# ローカルで作成したモジュール
+from Container import profile_sink, report_profile_event
+
+
+# 既定の プレースホルダー を作成する 関数
+def default_placeholder(content):
+    u""" < 既定の プレースホルダー('Loading...' の QLabel)を作成する 関数 です >
+
+    :param QWidget content: Container の content widget(親)
+    :rtype: QWidget
+    """
+    label = QLabel('Loading...', content)
+    label.setAlignment(Qt.AlignCenter)
+    label.setEnabled(False)  # 文字を薄く表示します
+    return label
+
+
+# 追加箇所1
+# 読み込みを取り消し、別スレッド を終了する 関数(loader の破棄時)
+def _stop_loads(loads, executor, wait = False):
+    u""" < 読み込みを取り消し、別スレッド を終了する 関数 です >
+
+    Python 3.7 の shutdown() は 順番待ちの provider を取り消さない為、先に取り消します
+
+    :param Dict[weakref.ref, _Load] loads: loader の登録
+    :param ThreadPoolExecutor executor: loader の executor
+    :param bool wait: 実行中の provider の終了を待つかどうか
+    """
+    for load in list(loads.values()):
+        if load.future is not None:
+            load.cancelled.set()
+            load.future.cancel()
+    executor.shutdown(wait = wait)
+
+
+class _Load(object):
+    u""" < 登録した Container 毎の 読み込みの状況 です > """
+    __slots__ = ('ref', 'provider', 'populate', 'placeholder_factory', 'generation', 'future', 'cancelled',
+                 'placeholder'
+                 )
+
+    def __init__(self, ref, provider, populate, placeholder_factory):
+        self.ref = ref  # weakref.ref(Container)
+        self.provider = provider
+        self.populate = populate
+        self.placeholder_factory = placeholder_factory
+        self.generation = 0  # 読み込みを開始・取り消す度に増やし、古い結果を見分けます
+        self.future = None  # 実行中・順番待ちの Future(読み込み中でない場合は None)
+        self.cancelled = None  # provider に渡す 取り消しの合図(threading.Event)
+        self.placeholder = None  # 表示中の プレースホルダー(読み込み中・失敗時)
+
+
+class AsyncContentLoader(QObject):
+    u""" < content のデータを 別スレッド で取得し、結果が届いてから content を作成する クラス です >
+
+    .. note::
+        provider は 別スレッド で実行される為、ウィジェット や maya.cmds を使用しないでください
+            (Maya のシーンの情報が必要な場合は、GUIスレッド で 必要な値だけを集めてから provider に渡してください)
+        populate は 通常の content_factory と同じく、content widget へ レイアウト・子供Widget を作成します
+        content を作成した後の 閉じる・開く では、取得し直しません(reload() で取得し直せます)
+    """
+    # 読み込みが終わった(content を作成した)Container を通知
+    loaded = Signal(object)
+    # 読み込みに失敗した Container と 例外 を通知(プレースホルダー にメッセージを表示します)
+    failed = Signal(object, object)
+    # 別スレッド から GUIスレッド へ 結果を渡す(_Load, generation, 結果, 例外)
+    _finished = Signal(object, int, object, object)
+
+    def __init__(self, max_workers = 2, placeholder_factory = default_placeholder, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param int max_workers: 同時に実行する provider の最大数
+        :param Callable[[QWidget], QWidget] placeholder_factory: 既定の プレースホルダー を作成する関数
+        :param QObject parent: 親オブジェクト
+        """
+        super(AsyncContentLoader, self).__init__(parent)
+        self.placeholder_factory = placeholder_factory
+        self._executor = ThreadPoolExecutor(max_workers = max_workers)
+        # Container は弱参照で保持し、破棄(destroyed)された Container は自動で忘れます
+        self._loads = {}  # key: weakref.ref(Container), value: _Load
+        self._destroyed_slots = {}  # key: weakref.ref(Container), value: destroyed に接続した関数
+        self._counts = {'started': 0, 'loaded': 0, 'cancelled': 0, 'failed': 0}
+        # 別スレッド から発信しても、GUIスレッド(当オブジェクトのスレッド)で受け取ります
+        self._finished.connect(self._on_finished, Qt.QueuedConnection)
+        # 追加箇所1
+        # loader(親の window)が破棄されたら、読み込みを取り消し、別スレッド を終了させます
+        # (loader を強参照しないよう、登録の dict と executor だけを捕まえます)
+        loads, executor = self._loads, self._executor
+        self.destroyed.connect(lambda *args: _stop_loads(loads, executor))
+
+    # Container を登録する 関数
+    def attach(self, container, provider, populate, placeholder_factory = None):
+        u""" < Container を登録し、content を 非同期 で作成するようにする 関数 です >
+
+        Container の content_factory は差し替えられ、現在の content は破棄されます
+        (展開中の場合は、その場で 読み込み を開始します)
+
+        :param Container container: 対象の Container
+        :param Callable[[threading.Event], Any] provider: データを取得する関数(別スレッド で実行)
+            引数は 取り消しの合図 です(閉じられたら set() されます)
+        :param Callable[[QWidget, Any], None] populate: content widget と provider の戻り値 から
+            content を作成する関数(GUIスレッド で実行)
+        :param Callable[[QWidget], QWidget] placeholder_factory: この Container の プレースホルダー を作成する関数
+            (省略時は loader の placeholder_factory)
+        """
+        ref = weakref.ref(container)
+        if ref in self._loads:
+            self.detach(container)
+        load = self._loads[ref] = _Load(ref, provider, populate, placeholder_factory or self.placeholder_factory)
+        container.toggled.connect(self._on_toggled)
+        # Container を強参照しないよう、弱参照だけを捕まえます
+        slot = self._destroyed_slots[ref] = lambda *args: self._forget(ref)
+        container.destroyed.connect(slot)
+        container.set_content_factory(lambda content: self._start(load, content))
+
+    # Container の登録を解除する 関数
+    def detach(self, container):
+        u""" < Container の登録を解除する 関数 です >
+
+        読み込み中の場合は取り消し、content_factory は外され、content は破棄されます
+
+        :param Container container: 登録済みの Container
+        """
+        ref = weakref.ref(container)
+        load = self._loads.get(ref)
+        if load is None:
+            return
+        slot = self._destroyed_slots.get(ref)
+        self._forget(ref)
+        container.toggled.disconnect(self._on_toggled)
+        if slot is not None:
+            container.destroyed.disconnect(slot)
+        container.set_content_factory(None)
+
+    # 読み込み中かどうかを返す 関数
+    def is_loading(self, container):
+        u""" < 読み込み中(結果が届いていない)かどうかを返す 関数 です >
+
+        :param Container container: 登録済みの Container
+        :rtype: bool
+        """
+        load = self._loads.get(weakref.ref(container))
+        return load is not None and load.future is not None
+
+    # 取得し直す 関数
+    def reload(self, container):
+        u""" < content を破棄し、データを取得し直す 関数 です >
+
+        閉じている場合は、次回 開いた時に取得します
+
+        :param Container container: 登録済みの Container
+        """
+        load = self._loads[weakref.ref(container)]
+        if load.future is not None:
+            self._cancel(load)
+        container.discard_content()
+        if container.is_expanded():
+            container.materialize()
+
+    # 全ての読み込みを取り消す 関数
+    def cancel_all(self):
+        u""" < 読み込み中の全ての Container の 読み込み を取り消す 関数 です >
+
+        取り消した Container の content は未作成に戻り、次回 開いた時に取得し直します
+        window を閉じる時などに使用します
+        """
+        for ref, load in list(self._loads.items()):
+            container = ref()
+            if load.future is not None and container is not None:
+                self._cancel(load)
+                container.discard_content()
+
+    # 追加箇所1
+    # 別スレッド を終了する 関数
+    def shutdown(self, wait = False):
+        u""" < 全ての読み込みを取り消し、別スレッド を終了する 関数 です >
+
+        loader の破棄時にも自動で呼ばれます(以降に開いた Container は、読み込みの失敗として扱います)
+
+        :param bool wait: 実行中の provider の終了を待つかどうか
+        """
+        self.cancel_all()
+        _stop_loads(self._loads, self._executor, wait)
+
+    # 統計を返す 関数
+    def stats(self):
+        u""" < 統計を返す 関数 です >
+
+        :return: {'tracked': 登録数, 'loading': 読み込み中の数, 'started': 開始した回数,
+                  'loaded': 作成した回数, 'cancelled': 取り消した回数, 'failed': 失敗した回数}
+        :rtype: Dict[str, int]
+        """
+        stats = {'tracked': len(self._loads),
+                 'loading': sum(1 for load in self._loads.values() if load.future is not None),
+                 }
+        stats.update(self._counts)
+        return stats
+
+    # 以下、読み込み用の 関数 群
+    # 読み込みを開始する 関数(content_factory)
+    def _start(self, load, content):
+        layout = QVBoxLayout(content)
+        layout.setContentsMargins(0, 0, 0, 0)
+        load.placeholder = load.placeholder_factory(content)
+        layout.addWidget(load.placeholder)
+
+        load.generation += 1
+        load.cancelled = Event()
+        try:
+            load.future = self._executor.submit(load.provider, load.cancelled)
+        except RuntimeError as error:  # 追加箇所1: shutdown() の後は、読み込みの失敗として扱います
+            load.future = Future()
+            load.future.set_exception(error)
+        generation = load.generation
+        load.future.add_done_callback(lambda future: self._on_future_done(load, generation, future))
+        self._counts['started'] += 1
+
+    # provider が終わった時の 関数(別スレッド、もしくは 取り消し時は GUIスレッド)
+    def _on_future_done(self, load, generation, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        try:
+            self._finished.emit(load, generation, None if error is not None else future.result(), error)
+        except RuntimeError:
+            pass  # loader が既に破棄されています
+
+    # 結果が届いた時の 関数(GUIスレッド)
+    def _on_finished(self, load, generation, result, error):
+        if generation != load.generation or load.future is None:
+            return  # 取り消し済み・取得し直し済み の古い結果です
+        container = load.ref()
+        load.future = None
+        load.cancelled = None
+        if container is None:
+            return
+        if error is not None:
+            self._counts['failed'] += 1
+            if hasattr(load.placeholder, 'setText'):
+                load.placeholder.setText(u'Failed: {}'.format(error))
+            self.failed.emit(container, error)
+            return
+
+        start = perf_counter() if profile_sink() is not None else None
+        content = container.contentWidget
+        # プレースホルダー と レイアウト を外し、populate が content へ自由にレイアウトを作成できるようにします
+        load.placeholder.setParent(None)
+        load.placeholder.deleteLater()
+        load.placeholder = None
+        layout = content.layout()
+        if layout is not None:
+            QWidget().setLayout(layout)  # 一時的なウィジェットへ移し、一緒に破棄させます
+        load.populate(content, result)
+        if start is not None:
+            report_profile_event('populate', container.title(), start, len(content.findChildren(QWidget)))
+        self._counts['loaded'] += 1
+        self.loaded.emit(container)
+
+    # Container の折り畳みの状況が変化した時の 関数
+    def _on_toggled(self, expanded):
+        if expanded:
+            return
+        container = self.sender()
+        load = self._loads.get(weakref.ref(container))
+        if load is None:
+            return
+        if load.future is not None:
+            self._cancel(load)
+            container.discard_content()  # 次回 開いた時に取得し直します
+        elif load.placeholder is not None:
+            container.discard_content()  # 失敗した content も、次回 開いた時に取得し直します
+            load.placeholder = None
+
+    # 読み込みを取り消す 関数
+    def _cancel(self, load):
+        load.generation += 1  # 実行中の provider の結果は、届いても捨てます
+        load.cancelled.set()
+        load.future.cancel()  # 開始前の場合は、順番待ちから外します
+        load.future = None
+        load.cancelled = None
+        load.placeholder = None
+        self._counts['cancelled'] += 1
+
+    # 登録を忘れる 関数
+    def _forget(self, ref):
+        load = self._loads.pop(ref, None)
+        self._destroyed_slots.pop(ref, None)
+        if load is not None and load.future is not None:
+            self._cancel(load)
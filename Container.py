@@ -6,8 +6,8 @@ Container.py
 :Author:
     oki yoshihiro
     okiyoshihiro.job@gmail.com
-:Version: -2.2-
-:Date: 2024/03/03
+:Version: -2.20-
+:Date: 2026/10/18
 
 .. note:: 当コード記述時の環境
 
@@ -31,8 +31,7 @@ Container.py
     ::
 
         # ローカルで作成したモジュール
-        import Container
-        reload(Container)
+        # Note: reload(Container) はしません(Container を使用する他のモジュールと、クラスが別物になる為)
         from Container import Container
 
         # 以下 e.g.):
@@ -58,6 +57,255 @@ Container.py
         ##############################
 
 -リマインダ-
+    done: 2026/10/18
+        - 変換箇所21(-/+)
+            - 概要: measure_import_time で、読み込み直す度に イベントの種類(registerEventType)が漏れるのを無くす為
+            - 詳細:
+                ::
+
+                    -   del sys.modules[module_name]; importlib.import_module(module_name)  # 同じプロセス内で読み込み直し
+                    +   subprocess.check_output([executable or sys.executable, '-c', _IMPORT_TIME_CODE, module_name])
+                    -   from PySide2.QtWidgets import QApplication as _QApplication  # noqa: F401  (_main 内、不要)
+
+        version = '-2.20-'
+
+    done: 2026/10/18
+        - 変換箇所20(-/+)
+            - 概要: PaintedHeader の 共有の QFont・QLabel を、Shiboken の型のクラス属性へ 後から代入しない為
+                (環境によっては 代入後も None が返り、初回の作成で AttributeError になっていました)
+            - 詳細:
+                ::
+
+                    -   PaintedHeader._bold_font / PaintedHeader._measure_label
+                    +   def _get_bold_font():  # _get_animation_driver() と同じく モジュールの変数で共有します
+                    +   def _get_measure_label():
+
+        version = '-2.19-'
+
+    done: 2026/10/18
+        - 変換箇所19(-)
+            - 概要: 重複したコードの整理
+            - 詳細:
+                ::
+
+                    -   from PySide2.QtCore import QPointF  # _create_fallback_arrow 内(モジュールの先頭で import 済み)
+                    -   def mousePressEvent(self, *args):  # Header(HeaderBase.mousePressEvent と同じ処理)
+
+        version = '-2.18-'
+
+    done: 2026/10/18
+        - 変換箇所18(-/+)
+            - 概要: PaintedHeader の sizeHint を Header と同じにする為(文字幅 と QLabel の sizeHint が異なっていた)
+            - 詳細:
+                ::
+
+                    -   width = ... + metrics.horizontalAdvance(self._title)
+                    +   width = ... + self._title_size_hint().width()  # Header の QLabel と同じ方法で測ります
+
+        version = '-2.17-'
+
+    done: 2026/10/18
+        - 追加箇所17(+)・変換箇所17(-/+)
+            - 概要: 子供Widget を親無しで作成し、後から付け替える(再ポリッシュされる)のを無くす為(PanelBuilder)
+            - 詳細:
+                ::
+
+                    -   def __init__(self, name, ..., header_class = None):
+                    +   def __init__(self, name, ..., header_class = None, parent = None):
+                    +   Header / PaintedHeader / ContentWidget / ContentClip / HeaderBackground / ClickableWidget: parent
+
+        version = '-2.16-'
+
+    done: 2026/10/18
+        - 追加箇所16(+)
+            - 概要: 長い Maya のセッションで、ツールの 開閉 を繰り返しても オブジェクトが残らないことを 確かめる為
+            - 詳細:
+                ::
+
+                    +   LiveCount = namedtuple('LiveCount', ['objects', 'wrappers'])
+                    +   def set_object_accounting(enabled):  # 無効の間は、作成時のコストはほぼ 0 です
+                    +   def live_object_counts(collect = True):  # {型名: LiveCount}
+
+        version = '-2.15-'
+
+    done: 2026/10/18
+        - 追加箇所15(+)・変換箇所15(-/+)
+            - 概要: Container を数千作成するパネルで、Header 毎のウィジェット・レイアウト数を減らす為
+            - 詳細:
+                ::
+
+                    +   class HeaderBase(QWidget):  # 折り畳みの状況・シグナル・矢印アイコンのキャッシュ を共通化
+                    -   class Header(QWidget):
+                    +   class Header(HeaderBase):
+                    +   class PaintedHeader(HeaderBase):  # 背景・矢印・タイトルを 1つ のウィジェットで描画
+
+                    -   def __init__(self, name, ..., expanded = None):
+                    +   def __init__(self, name, ..., expanded = None, header_class = None):
+
+        version = '-2.14-'
+
+    done: 2026/10/18
+        - 追加箇所14(+)
+            - 概要: 長く閉じたままの Container の content を破棄し、作り直せるかを判定する為(ContainerEviction)
+            - 詳細:
+                ::
+
+                    +   def content_factory(self):
+
+        version = '-2.13-'
+
+    done: 2026/10/18
+        - 追加箇所13(+)
+            - 概要: geometry() を推測で読み直さずに、レイアウト確定後の 正確な高さ で 1回 だけ反応できるようにする為
+            - 詳細:
+                ::
+
+                    +   toggled = Signal(bool)  # その場で発信
+                    +   geometryCommitted = Signal(int, int)  # 変化前の高さ, 変化後の高さ(レイアウトの確定後)
+                    +   animationFinished = Signal()  # ContentClip: アニメーションの終了を通知
+
+        version = '-2.12-'
+
+    done: 2026/10/18
+        - 追加箇所12(+)
+            - 概要: どの Container が Maya の UI を引っかからせているかを、本番環境でも計測する為
+            - 詳細:
+                ::
+
+                    +   ProfileEvent = namedtuple('ProfileEvent', ['kind', 'name', 'duration', 'widgets'])
+                    +   def set_profile_sink(sink):  # None の間は、計測のコストはほぼ 0 です
+                    +   def profile_sink():
+                    +   def report_profile_event(kind, name, start, widgets = 0):
+
+                    +   start = perf_counter() if _profile_sink is not None else None  # expand/collapse/materialize
+
+        version = '-2.11-'
+
+    done: 2026/10/18
+        - 追加箇所11(+)・変換箇所11(-/+)
+            - 概要: Maya の起動時に、当モジュールの import を 静か かつ 軽く する為
+            - 詳細:
+                ::
+
+                    -   print(u'{}.py: loaded as module file'.format(__name__))
+                    -   print('{}'.format(__file__))
+                    -   print(u'モジュール名:{}\n'.format(__name__))
+                    -   from typing import Tuple  # docstring でのみ使用
+
+                    +   def measure_import_time(module_names = ('Container',), repeat = 5):
+                            ...  # python Container.py [module_name ...] で表示
+
+        version = '-2.10-'
+
+    done: 2026/10/18
+        - 追加箇所10(+)
+            - 概要: 復元した状況を 表示前 に適用し、既定の状況でのレイアウトを省く為
+            - 詳細:
+                ::
+
+                    +   def __init__(self, name, ..., expanded = None):  # 初期の折り畳みの状況
+
+        version = '-2.9-'
+
+    done: 2026/10/18
+        - 追加箇所9(+)
+            - 概要: collapse/expand 時に window が跳ねないよう、高さをアニメーションさせる為
+            - 詳細:
+                ::
+
+                    -   def __init__(self, name, color_background = False, content_factory = None):
+                    +   def __init__(self, name, color_background = False, content_factory = None, animated = False):
+
+                    +   class ContentClip(QWidget):  # content をクリップし、高さをアニメーションさせる入れ物
+                            ...
+                    +   class _AnimationDriver(QObject):  # 全てのアニメーションを 1つ のタイマーで進める
+                            ...
+
+        version = '-2.8-'
+
+    done: 2026/10/18
+        - 追加箇所8(+)
+            - 概要: レイアウト確定前に、確定後の高さを知る為
+            - 詳細:
+                ::
+
+                    +   def height_hint(self, expanded = None):  # Header と content の sizeHint から計算
+                            ...
+
+        version = '-2.7-'
+
+    done: 2026/10/18
+        - 追加箇所7(+)・変換箇所7(-/+)
+            - 概要: ContainerList での Container の再利用(リサイクル)の為
+            - 詳細:
+                ::
+
+                    +   toggled = Signal(bool)  # Header の折り畳みの状況の変化を通知
+
+                    -   label = QLabel(name)
+                    +   self.label = QLabel(name)
+                    +   def title(self): / def set_title(self, name):
+                            ...
+
+                    +   def set_content_factory(self, content_factory):
+                            ...
+                    +   def discard_content(self):
+                            ...
+
+        version = '-2.6-'
+
+    done: 2026/10/18
+        - 追加箇所6(+)・変換箇所6(-/+)
+            - 概要: 折り畳まれたままのセクションの、content 作成コスト削減の為
+            - 詳細:
+                ::
+
+                    -   def __init__(self, name, color_background = False):
+                    +   def __init__(self, name, color_background = False, content_factory = None):
+
+                    +   def materialize(self):  # 初回の expand() で content_factory を呼ぶ
+                            ...
+                    +   def is_materialized(self):
+                            ...
+
+                    -   if not self.content.isVisible():  # window 表示前は常に False
+                    +   if not self._expanded:
+
+        version = '-2.5-'
+
+    done: 2026/10/18
+        - 追加箇所5(+)・変換箇所5(-/+)
+            - 概要: スタイルシートの解析とカスケードによる、表示時の再ポリッシュ削減の為
+            - 詳細:
+                ::
+
+                    -   self.background = QLabel()
+                    -   self.background.setStyleSheet("QLabel{ background-color: ...}")
+                    +   self.background = HeaderBackground()  # paintEvent で背景を描画
+
+                    -   self._content_widget = QWidget()
+                    -   self._content_widget.setStyleSheet("QWidget{background-color: ...}")
+                    +   self._content_widget = ContentWidget(color_background)  # paintEvent で背景を描画
+
+        version = '-2.4-'
+
+    done: 2026/10/18
+        - 追加箇所4(+)・変換箇所4(-/+)
+            - 概要: 多数の Header 生成時の、矢印アイコン読み込みコスト削減の為
+            - 詳細:
+                ::
+
+                    -   self.expand_ico = QPixmap(":teDownArrow.png")
+                    -   self.collapse_ico = QPixmap(":teRightArrow.png")
+                    +   self.expand_ico = self.cached_icon(self.expand_icon_path)
+                    +   self.collapse_ico = self.cached_icon(self.collapse_icon_path)
+
+                    +   @classmethod
+                        def cached_icon(cls, path):  # 全 Header 共有のアイコンキャッシュ(代替え矢印付き)
+                            ...
+
+        version = '-2.3-'
+
     done: 2024/03/03
         - 追加箇所3(+)・変換箇所3(-/+)
             - 概要: 当モジュールの読み込み先での、各種操作の実現の為
@@ -127,15 +375,219 @@ Container.py
 """
 
 # 標準ライブラリ
-from typing import Tuple
+import gc
+import weakref
+from collections import namedtuple
+from time import perf_counter
 
 # サードパーティライブラリ
 from PySide2.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QPushButton,
                                QLabel, QSpacerItem, QSizePolicy, QStackedLayout,
-                               QGridLayout
+                               QGridLayout, QApplication, QStyle, QStyleOption
                                )
-from PySide2.QtGui import QPixmap, QFont
-from PySide2.QtCore import QObject, Signal
+from PySide2.QtGui import QPixmap, QFont, QColor, QPainter, QStaticText
+from PySide2.QtCore import QObject, Signal, Qt, QTimer, QEvent, QSize, QRect, QPoint, QPointF
+
+
+# 追加箇所5
+# Maya の frameLayout に似せた配色
+HEADER_BACKGROUND_COLOR = (93, 93, 93)  # Header の背景色
+CONTENT_BACKGROUND_COLOR = (73, 73, 73)  # Container(color_background=True) の背景色
+
+# 追加箇所9
+# QWidget の最大サイズ(QWIDGETSIZE_MAX)
+_QWIDGETSIZE_MAX = (1 << 24) - 1
+
+# 追加箇所13
+# レイアウトの確定後に geometryCommitted を発信する為の、独自のイベントの種類
+_GEOMETRY_COMMIT_EVENT = QEvent.Type(QEvent.registerEventType())
+
+
+# 追加箇所12
+# 計測イベント
+#   kind: 'expand' / 'collapse' / 'materialize' / 'relayout' / 'populate'(AsyncContent で 結果から content を作成)
+#   name: Container のタイトル(relayout の場合は window の objectName)
+#   duration: 経過時間(秒)
+#   widgets: 表示・非表示にしたウィジェット数(relayout の場合は 変化した Container 数)
+ProfileEvent = namedtuple('ProfileEvent', ['kind', 'name', 'duration', 'widgets'])
+
+# 追加箇所12
+# 計測イベントの送り先(None の場合は 計測しません)
+_profile_sink = None
+
+
+# 追加箇所12
+# 計測イベントの送り先を設定する 関数
+def set_profile_sink(sink):
+    u""" < 計測イベントの送り先を設定する 関数 です >
+
+    送り先が無い(None の)間は、collapse/expand などで 時間の取得すら行いません
+
+    :param Callable[[ProfileEvent], None] | None sink: ProfileEvent を受け取る 呼び出し可能オブジェクト
+        (ContainerProfiler の RingBufferSink / JsonLinesSink や、任意の関数)
+    :return: 以前の送り先
+    :rtype: Callable[[ProfileEvent], None] | None
+    """
+    global _profile_sink
+    previous, _profile_sink = _profile_sink, sink
+    return previous
+
+
+# 追加箇所12
+# 計測イベントの送り先を返す 関数
+def profile_sink():
+    u""" < 計測イベントの送り先を返す 関数 です >
+
+    計測する側は、まずこの戻り値が None かどうかだけを調べます
+
+    :rtype: Callable[[ProfileEvent], None] | None
+    """
+    return _profile_sink
+
+
+# 追加箇所12
+# 計測イベントを送る 関数
+def report_profile_event(kind, name, start, widgets = 0):
+    u""" < 計測イベントを送る 関数 です >
+
+    :param str kind: 'expand' / 'collapse' / 'materialize' / 'relayout' / 'populate'
+    :param str name: Container のタイトル、もしくは window の objectName
+    :param float start: 開始時の perf_counter()
+    :param int widgets: 表示・非表示にしたウィジェット数(relayout の場合は 変化した Container 数)
+    """
+    sink = _profile_sink
+    if sink is not None:
+        sink(ProfileEvent(kind, name, perf_counter() - start, widgets))
+
+
+# 追加箇所12
+# 表示・非表示が切り替わるウィジェット数を返す 関数(計測時のみ使用)
+def _count_widgets(widget):
+    return len(widget.findChildren(QWidget)) + 1
+
+
+# 追加箇所16
+# 生存数: 型名毎の C++ オブジェクト数(作成数 - destroyed 数) と、回収されていない Python のラッパー数
+#   objects より wrappers が多い場合は、破棄済みの C++ オブジェクトのラッパーを、どこかが強参照しています
+LiveCount = namedtuple('LiveCount', ['objects', 'wrappers'])
+
+# 追加箇所16
+# 生存数の記録(None の場合は 記録しません)
+#   key: 型名, value: [C++ オブジェクト数, weakref.WeakSet(ラッパー)]
+_live_objects = None
+
+
+# 追加箇所16
+# 生存数の記録を 有効・無効 にする 関数
+def set_object_accounting(enabled):
+    u""" < Container・Header・ClickableWidget などの 生存数の記録を、有効・無効 にする 関数 です >
+
+    有効にした後に作成したものだけを数えます
+    無効にすると、記録は破棄されます(無効の間は、作成時のコストはほぼ 0 です)
+
+    :param bool enabled: True で有効
+    :return: 以前に有効だったかどうか
+    :rtype: bool
+    """
+    global _live_objects
+    previous = _live_objects is not None
+    if not enabled:
+        _live_objects = None
+    elif not previous:
+        _live_objects = {}
+    return previous
+
+
+# 追加箇所16
+# 生存数を返す 関数
+def live_object_counts(collect = True):
+    u""" < 型名毎の 生存数 を返す 関数 です >
+
+    WA_DeleteOnClose や deleteLater() の破棄は、イベントループで行われる為、
+        QApplication.sendPostedEvents(None, QEvent.DeferredDelete) の後に呼んでください
+
+    :param bool collect: True の場合は、先に gc.collect() で循環参照を回収します
+    :return: {型名: LiveCount(objects, wrappers)}(記録が無効の場合は 空)
+    :rtype: Dict[str, LiveCount]
+    """
+    if _live_objects is None:
+        return {}
+    if collect:
+        gc.collect()
+    return {name: LiveCount(entry[0], len(entry[1])) for name, entry in _live_objects.items()}
+
+
+# 追加箇所16
+# 作成したオブジェクトを 生存数 に記録する 関数(記録が有効な場合のみ呼びます)
+def _account(obj):
+    name = type(obj).__name__
+    entry = _live_objects.get(name)
+    if entry is None:
+        entry = _live_objects[name] = [0, weakref.WeakSet()]
+    entry[0] += 1
+    entry[1].add(obj)
+    # obj を強参照しないよう、記録だけを捕まえます
+    obj.destroyed.connect(lambda *args: _discount(entry))
+
+
+# 追加箇所16
+# destroyed 時に 生存数 を減らす 関数
+def _discount(entry):
+    entry[0] -= 1
+
+
+# 追加箇所4
+# 現在のアプリケーションのデバイスピクセル比を返す 関数
+def _device_pixel_ratio():
+    u""" < 現在のアプリケーションのデバイスピクセル比を返す 関数 です >
+
+    QApplication が未作成の場合は 1.0 を返します
+
+    :return: デバイスピクセル比
+    :rtype: float
+    """
+    app = QApplication.instance()
+    if app is None:
+        return 1.0
+    return float(app.devicePixelRatio())
+
+
+# 追加箇所4
+# Maya のリソース(:teDownArrow.png 等)が無い環境用の、代替え矢印アイコンを描画する 関数
+def _create_fallback_arrow(direction, ratio = 1.0, size = 12):
+    u""" < Maya のリソースが無い環境用の、代替え矢印アイコンを描画する 関数 です >
+
+    :param str direction: 矢印の向き 'down' or 'right'
+    :param float ratio: デバイスピクセル比
+    :param int size: 論理ピクセルでのアイコンサイズ
+    :return: 描画済みの矢印アイコン
+    :rtype: QPixmap
+    """
+    # 代替え矢印を描画する時だけ必要なモジュールです
+    from PySide2.QtGui import QPolygonF
+
+    pixmap = QPixmap(int(size * ratio), int(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+
+    if direction == 'right':
+        points = [QPointF(size * 0.3, size * 0.2),
+                  QPointF(size * 0.75, size * 0.5),
+                  QPointF(size * 0.3, size * 0.8),
+                  ]
+    else:
+        points = [QPointF(size * 0.2, size * 0.3),
+                  QPointF(size * 0.8, size * 0.3),
+                  QPointF(size * 0.5, size * 0.75),
+                  ]
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(200, 200, 200))
+    painter.drawPolygon(QPolygonF(points))
+    painter.end()
+    return pixmap
 
 
 # 追加箇所1
@@ -143,56 +595,481 @@ class ClickableWidget(QWidget):  # クリック信号を出すウィジェット
     # カスタムシグナルの定義
     clicked = Signal()
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent = None):  # 追加箇所17: parent
+        super().__init__(parent)
+        if _live_objects is not None:  # 追加箇所16
+            _account(self)
 
     def mouseReleaseEvent(self, event):
         # マウスがリリースされたときに発動する処理
         self.clicked.emit()
 
 
-class Header(QWidget):
-    """Header class for a collapsible group"""
+# 追加箇所5
+class HeaderBackground(QLabel):  # スタイルシートを使わず、自身で背景を描画する Header の背景
+    u""" < スタイルシートを使わず、自身で背景を描画する Header の背景 です >
+
+    QLabel{ background-color: rgb(93, 93, 93); border-radius:2px} と同じ見た目を
+        paintEvent で直接描画し、ウィジェット毎のスタイルシート解析を無くします
+    .. note::
+        background_header から setStyleSheet された場合は、従来通り スタイルシート で描画します
+    """
+
+    def __init__(self, color = HEADER_BACKGROUND_COLOR, radius = 2, parent = None):  # 追加箇所17: parent
+        super(HeaderBackground, self).__init__(parent)
+        self._color = QColor(*color)
+        self._radius = radius
+        if _live_objects is not None:  # 追加箇所16
+            _account(self)
+
+    def color(self):
+        u""" < 背景色を返す 関数 です >
+
+        :rtype: QColor
+        """
+        return QColor(self._color)
+
+    def setColor(self, color):
+        u""" < 背景色を設定する 関数 です >
+
+        :param QColor | Tuple[int, int, int] color: 背景色
+        """
+        self._color = QColor(color) if isinstance(color, QColor) else QColor(*color)
+        self.update()
+
+    def paintEvent(self, event):
+        if self.styleSheet():
+            return super(HeaderBackground, self).paintEvent(event)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._color)
+        painter.drawRoundedRect(self.rect(), self._radius, self._radius)
+        painter.end()
+
+
+# 追加箇所5
+class ContentWidget(QWidget):  # スタイルシートを使わず、自身で背景を描画する Content widget
+    u""" < スタイルシートを使わず、自身で背景を描画する Content widget です >
+
+    QWidget{background-color: rgb(73, 73, 73); margin-left: 2px; margin-right: 2px} と同じ見た目を
+        paintEvent で直接描画します
+    スタイルシートと異なり、子供の ウィジェット へ カスケード しない為、
+        表示や追加の度に、子供全体の再ポリッシュが発生しません
+    """
+
+    def __init__(self, color_background = False, color = CONTENT_BACKGROUND_COLOR, margin = 2,
+                 parent = None  # 追加箇所17
+                 ):
+        super(ContentWidget, self).__init__(parent)
+        self._color_background = color_background
+        self._color = QColor(*color)
+        self._margin = margin
+        if _live_objects is not None:  # 追加箇所16
+            _account(self)
+
+    def colorBackground(self):
+        u""" < 背景色を描画するかどうかを返す 関数 です >
+
+        :rtype: bool
+        """
+        return self._color_background
+
+    def setColorBackground(self, enabled):
+        u""" < 背景色を描画するかどうかを設定する 関数 です >
+
+        :param bool enabled: True で Maya のように明るい背景色を描画します
+        """
+        self._color_background = bool(enabled)
+        self.update()
+
+    def paintEvent(self, event):
+        if not self._color_background:
+            return super(ContentWidget, self).paintEvent(event)
+        painter = QPainter(self)
+        painter.fillRect(self.rect().adjusted(self._margin, 0, -self._margin, 0), self._color)
+        painter.end()
+
+
+# 追加箇所9
+class _AnimationDriver(QObject):  # 全ての ContentClip のアニメーションを、1つ のタイマーで進める
+    u""" < 全ての ContentClip のアニメーションを、1つ のタイマーで進める クラス です >
+
+    同時に collapse/expand された複数の Container は、同じフレームで まとめて 更新されます
+    """
+    interval = 16  # ms (約 60 fps)
+
+    def __init__(self):
+        super(_AnimationDriver, self).__init__()
+        self._clips = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.interval)
+        self._timer.timeout.connect(self._tick)
+
+    def add(self, clip):
+        u""" < アニメーション中の ContentClip を登録する 関数 です >
+
+        :param ContentClip clip: アニメーションを開始した ContentClip
+        """
+        if clip not in self._clips:
+            self._clips.append(clip)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _tick(self):
+        now = perf_counter()
+        running = []
+        for clip in self._clips:
+            try:
+                if clip._step(now):
+                    running.append(clip)
+            except RuntimeError:  # アニメーション中に破棄された ContentClip
+                pass
+        self._clips = running
+        if not running:
+            self._timer.stop()
+
+
+# 追加箇所9
+# 共有の _AnimationDriver
+_animation_driver = None
+
+
+# 追加箇所9
+# 共有の _AnimationDriver を返す 関数
+def _get_animation_driver():
+    u""" < 共有の _AnimationDriver を返す 関数 です >
+
+    :rtype: _AnimationDriver
+    """
+    global _animation_driver
+    if _animation_driver is None:
+        _animation_driver = _AnimationDriver()
+    return _animation_driver
+
+
+# 追加箇所9
+class ContentClip(QWidget):  # content をクリップし、高さをアニメーションさせる入れ物
+    u""" < content をクリップし、高さをアニメーションさせる入れ物 です >
+
+    Container(animated=True) の時に、content widget と Container のレイアウトの間に入ります
+    アニメーション中は、
+        - content の高さは、開始時に 1回 だけ取得した sizeHint に固定し、
+        - ContentClip の高さだけを変化させ、はみ出した部分をクリップします
+    その為、フレーム毎に content の子供の再レイアウトは発生しません
 
-    def __init__(self, name, content_widget):
+    .. note::
+        Header は従来通り setVisible() を呼ぶだけで、アニメーションは ContentClip が行います
+        window が表示されていない時は、アニメーションせずに その場で切り替えます
+    """
+    duration = 150  # ms
+
+    # 追加箇所13
+    # カスタムシグナルの定義: アニメーションの終了を通知
+    animationFinished = Signal()
+
+    def __init__(self, content, duration = None, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param QWidget content: クリップする content widget
+        :param int duration: アニメーションの時間(ms) 省略時はクラス変数 duration
+        :param QWidget parent: 親ウィジェット(追加箇所17)
+        """
+        super(ContentClip, self).__init__(parent)
+        if duration is not None:
+            self.duration = duration
+        self._content = content
+        content.setParent(self)
+        self._easing = None
+        # アニメーション中の情報: (開始時刻, 開始時の高さ, 終了時の高さ, 終了時に表示するかどうか)
+        self._animation = None
+        if _live_objects is not None:  # 追加箇所16
+            _account(self)
+
+    def sizeHint(self):
+        return self._content.sizeHint()
+
+    def minimumSizeHint(self):
+        return self._content.minimumSizeHint()
+
+    # アニメーション中かどうかを返す 関数
+    def is_animating(self):
+        u""" < アニメーション中かどうかを返す 関数 です >
+
+        :rtype: bool
+        """
+        return self._animation is not None
+
+    def setVisible(self, visible):
+        parent = self.parentWidget()
+        if parent is None or not parent.isVisible():
+            # 表示前は、アニメーションせずに その場で切り替えます
+            self._finish()
+            return super(ContentClip, self).setVisible(visible)
+        if visible:
+            start = self.height() if self._animation is not None or not self.isHidden() else 0
+            super(ContentClip, self).setVisible(True)
+        else:
+            if self.isHidden():
+                return
+            start = self.height()
+        self._start(start, visible)
+
+    def event(self, event):
+        # content のレイアウトの変化(updateGeometry)は、レイアウトを持たない親へ LayoutRequest として届きます
+        if event.type() == QEvent.LayoutRequest and self._animation is None:
+            self.updateGeometry()
+            self._content.resize(self.size())
+        return super(ContentClip, self).event(event)
+
+    def resizeEvent(self, event):
+        if self._animation is None:
+            self._content.resize(self.size())
+        else:
+            self._content.resize(self.width(), self._content.height())
+        super(ContentClip, self).resizeEvent(event)
+
+    # アニメーションを開始する 関数
+    def _start(self, start, visible):
+        if self._easing is None:
+            # アニメーションを使用する時だけ必要なモジュールです
+            from PySide2.QtCore import QEasingCurve
+            self._easing = QEasingCurve(QEasingCurve.OutCubic)
+        width = self.width() or self.parentWidget().width()
+        content = self._content
+        # content の目標の高さは、開始時に 1回 だけ取得します
+        if content.hasHeightForWidth():
+            target = content.heightForWidth(width)
+        else:
+            target = content.sizeHint().height()
+        content.setGeometry(0, 0, width, target)
+        end = target if visible else 0
+        self._animation = (perf_counter(), start, end, visible)
+        self.setFixedHeight(start)
+        _get_animation_driver().add(self)
+
+    # アニメーションを 1フレーム 進める 関数
+    def _step(self, now):
+        started, start, end, visible = self._animation
+        progress = min(1.0, (now - started) * 1000.0 / self.duration) if self.duration > 0 else 1.0
+        eased = self._easing.valueForProgress(progress)
+        self.setFixedHeight(int(round(start + (end - start) * eased)))
+        if progress < 1.0:
+            return True
+        self._finish()
+        if not visible:
+            super(ContentClip, self).setVisible(False)
+        return False
+
+    # アニメーションを終了し、高さの固定を解除する 関数
+    def _finish(self):
+        if self._animation is None:
+            return
+        self._animation = None
+        self.setMinimumHeight(0)
+        self.setMaximumHeight(_QWIDGETSIZE_MAX)
+        self._content.resize(self.size())
+        self.animationFinished.emit()  # 追加箇所13
+
+
+# 追加箇所15
+class HeaderBase(QWidget):  # Header と PaintedHeader に共通の、折り畳みの状況とシグナル
+    """Base class for the header of a collapsible group
+
+    Holds the collapsed/expanded state, the signals and the shared arrow icons.
+    Subclasses show the title and the arrow.
+    """
+
+    # 追加箇所4
+    # 矢印アイコンのリソースパス
+    expand_icon_path = ":teDownArrow.png"
+    collapse_icon_path = ":teRightArrow.png"
+    # 全ての Header インスタンスで共有する、矢印アイコンのキャッシュ
+    #   key: (リソースパス, デバイスピクセル比), value: QPixmap
+    _icon_cache = {}
+    # リソースが読み込めなかった時に使用する、代替え矢印の向き
+    _fallback_directions = {":teDownArrow.png": 'down',
+                            ":teRightArrow.png": 'right',
+                            }
+
+    # 追加箇所6
+    # カスタムシグナルの定義: expand() で content を表示する直前に発信
+    aboutToExpand = Signal()
+    # 追加箇所7
+    # カスタムシグナルの定義: 折り畳みの状況が変化した時に発信(True: -expand- / False: -collapse-)
+    toggled = Signal(bool)
+
+    def __init__(self, name, content_widget, parent = None):
         """Header Class Constructor to initialize the object.
 
         Args:
             name (str): Name for the header
             content_widget (QWidget): Widget containing child elements
+            parent (QWidget): parent widget, set at construction (the Container)
         """
-        super(Header, self).__init__()
+        super(HeaderBase, self).__init__(parent)
         self.content = content_widget
-        self.expand_ico = QPixmap(":teDownArrow.png")
-        self.collapse_ico = QPixmap(":teRightArrow.png")
+        # 変換箇所4: インスタンス毎の QPixmap 読み込みから、共有キャッシュの参照へ変更
+        self.expand_ico = self.cached_icon(self.expand_icon_path)
+        self.collapse_ico = self.cached_icon(self.collapse_icon_path)
         self.setSizePolicy(QSizePolicy.Expanding,
                            QSizePolicy.Fixed
                            )
 
+        # 追加箇所6
+        # 折り畳みの状況(bool)
+        #   content.isVisible() は window の表示前には常に False を返す為、状況は自身で保持します
+        self._expanded = True
+        if _live_objects is not None:  # 追加箇所16
+            _account(self)
+
+    # 追加箇所4
+    # 共有キャッシュから矢印アイコンを返す 関数
+    @classmethod
+    def cached_icon(cls, path):
+        u""" < 共有キャッシュから矢印アイコンを返す 関数 です >
+
+        初回のみ path のリソースを読み込み、以降は全ての Header で同じ QPixmap を共有します
+        リソースが読み込めない場合(Maya 外など)は、組み込みの代替え矢印を描画します
+
+        :param str path: アイコンのリソースパス
+        :return: 矢印アイコン
+        :rtype: QPixmap
+        """
+        ratio = _device_pixel_ratio()
+        key = (path, ratio)
+        pixmap = cls._icon_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                direction = cls._fallback_directions.get(path, 'down')
+                pixmap = _create_fallback_arrow(direction, ratio)
+            cls._icon_cache[key] = pixmap
+        return pixmap
+
+    # 追加箇所4
+    # 共有キャッシュを空にする 関数
+    @classmethod
+    def clear_icon_cache(cls):
+        u""" < 共有キャッシュを空にする 関数 です >
+
+        リソースの差し替え時や、デバイスピクセル比の変更時に使用します
+        """
+        cls._icon_cache.clear()
+
+    def mousePressEvent(self, *args):  # ボタンをクリックした時に、発動させたい
+        """Handle mouse events, call the function to toggle groups"""
+        if not self._expanded:  # 変換箇所6: self.content.isVisible() -> self._expanded
+            self.expand()
+        else:
+            self.collapse()
+
+    def expand(self):
+        start = perf_counter() if _profile_sink is not None else None  # 追加箇所12
+        self.aboutToExpand.emit()  # 追加箇所6
+        changed = not self._expanded  # 追加箇所7
+        self._expanded = True  # 追加箇所6
+        self.content.setVisible(True)
+        self._update_arrow()  # 変換箇所15: self.icon.setPixmap(self.expand_ico) -> self._update_arrow()
+        if changed:  # 追加箇所7
+            self.toggled.emit(True)
+        if start is not None and changed:  # 追加箇所12
+            report_profile_event('expand', self.title(), start, _count_widgets(self.content))
+
+    def collapse(self):
+        start = perf_counter() if _profile_sink is not None else None  # 追加箇所12
+        changed = self._expanded  # 追加箇所7
+        self._expanded = False  # 追加箇所6
+        self.content.setVisible(False)
+        self._update_arrow()  # 変換箇所15: self.icon.setPixmap(self.collapse_ico) -> self._update_arrow()
+        if changed:  # 追加箇所7
+            self.toggled.emit(False)
+        if start is not None and changed:  # 追加箇所12
+            report_profile_event('collapse', self.title(), start, _count_widgets(self.content))
+
+    # 追加箇所15
+    # 矢印アイコンを、折り畳みの状況に合わせる 関数(派生クラスで実装します)
+    def _update_arrow(self):
+        raise NotImplementedError
+
+    # 追加箇所6
+    # 折り畳みの状況を返す 関数
+    def is_expanded(self):
+        u""" < 折り畳みの状況を返す 関数 です >
+
+        window の表示前でも、正しい状況を返します
+
+        :return: True: -expand- / False: -collapse-
+        :rtype: bool
+        """
+        return self._expanded
+
+    # 追加箇所7
+    # Header のタイトルを返す 関数(派生クラスで実装します)
+    def title(self):
+        u""" < Header のタイトルを返す 関数 です >
+
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    # 追加箇所7
+    # Header のタイトルを設定する 関数(派生クラスで実装します)
+    def set_title(self, name):
+        u""" < Header のタイトルを設定する 関数 です >
+
+        :param str name: Name for the header
+        """
+        raise NotImplementedError
+
+    # 追加箇所2
+    # 各 Header Widget の折り畳みの状況を調べ、返す 関数
+    def outPut_content_status(self):
+        u""" < 各 Header Widget の折り畳みの状況を調べ、返す 関数 です>
+
+        :return: self._expanded: 折り畳みの状況(bool)
+            , self.content: content_widget name
+        :rtype:  Tuple[bool | None, QWidget]
+        """
+        return self._expanded, self.content  # 変換箇所6: self.content.isVisible() -> self._expanded
+
+
+class Header(HeaderBase):  # 変換箇所15: QWidget -> HeaderBase
+    """Header class for a collapsible group"""
+
+    def __init__(self, name, content_widget, parent = None):
+        """Header Class Constructor to initialize the object.
+
+        Args:
+            name (str): Name for the header
+            content_widget (QWidget): Widget containing child elements
+            parent (QWidget): parent widget, set at construction (the Container)
+        """
+        super(Header, self).__init__(name, content_widget, parent)
+
         # print('execute, Header')
 
         stacked = QStackedLayout(self)
         stacked.setStackingMode(QStackedLayout.StackAll)
         # 変換箇所3
-        self.background = QLabel()  # background -> self.background
-        self.background.setStyleSheet(
-            "QLabel{ background-color: rgb(93, 93, 93); border-radius:2px}"
-            )
+        # 変換箇所5: スタイルシートから、自身で描画する背景へ変更
+        # 変換箇所17: 子供Widget は、作成時に親を設定します(後からの親の付け替えを無くします)
+        self.background = HeaderBackground(parent = self)  # background -> self.background
 
-        self.widget = ClickableWidget()  # 変換箇所1: クリック信号を出すウィジェットへ変更と、コンストラクタ化
+        self.widget = ClickableWidget(self)  # 変換箇所1: クリック信号を出すウィジェットへ変更と、コンストラクタ化
         layout = QHBoxLayout(self.widget)
 
-        self.icon = QLabel()
+        self.icon = QLabel(self.widget)
         self.icon.setPixmap(self.expand_ico)
         layout.addWidget(self.icon)
         layout.setContentsMargins(11, 0, 11, 0)
 
         font = QFont()
         font.setBold(True)
-        label = QLabel(name)
-        label.setFont(font)
+        self.label = QLabel(name, self.widget)  # 変換箇所7: label -> self.label
+        self.label.setFont(font)
 
-        layout.addWidget(label)
+        layout.addWidget(self.label)
         layout.addItem(
             QSpacerItem(0, 0, QSizePolicy.Expanding,
                         QSizePolicy.Expanding
@@ -210,25 +1087,8 @@ class Header(QWidget):
         # testで追加 ################################ end
         # print(self.content)
 
-    def mousePressEvent(self, *args):  # ボタンをクリックした時に、発動させたい
-        """Handle mouse events, call the function to toggle groups"""
-        # print(args)
-        # self.expand() if not self.content.isVisible() else self.collapse()
-        if not self.content.isVisible():
-            self.expand()
-        else:
-            self.collapse()
-        # self.content.isVisible()  # : True -expand-
-        #                           # : False -collapse-
-        # return self.content_, self.toggle_, self.height_
-        # self.outPut_content_status()
-        # print(type(self.height_))
-        # print(self.outPut_content_status)
-        # print(self.height_)
-
     def expand(self):
-        self.content.setVisible(True)
-        self.icon.setPixmap(self.expand_ico)
+        super(Header, self).expand()  # 変換箇所15: 状況の変更とシグナルは HeaderBase で行います
         # testで追加 ################################ start
         height = self.content.geometry().getRect()[3]
         self.height_ = height
@@ -237,14 +1097,36 @@ class Header(QWidget):
         # testで追加 ################################ end
 
     def collapse(self):
-        self.content.setVisible(False)
-        self.icon.setPixmap(self.collapse_ico)
+        super(Header, self).collapse()  # 変換箇所15: 状況の変更とシグナルは HeaderBase で行います
         # testで追加 ################################ start
         self.height_ = 0
         self.content_ = self.content
         self.toggle_ = self.content.isVisible()
         # testで追加 ################################ end
 
+    # 追加箇所15
+    # 矢印アイコンを、折り畳みの状況に合わせる 関数
+    def _update_arrow(self):
+        self.icon.setPixmap(self.expand_ico if self._expanded else self.collapse_ico)
+
+    # 追加箇所7
+    # Header のタイトルを返す 関数
+    def title(self):
+        u""" < Header のタイトルを返す 関数 です >
+
+        :rtype: str
+        """
+        return self.label.text()
+
+    # 追加箇所7
+    # Header のタイトルを設定する 関数
+    def set_title(self, name):
+        u""" < Header のタイトルを設定する 関数 です >
+
+        :param str name: Name for the header
+        """
+        self.label.setText(name)
+
     # 追加箇所1
     # Clickable headerWidget プロパティを準備し、その該当 widget を返し、容易なアクセスを可にします
     @property
@@ -255,17 +1137,6 @@ class Header(QWidget):
         """
         return self.widget
 
-    # 追加箇所2
-    # 各 Header Widget の折り畳みの状況を調べ、返す 関数
-    def outPut_content_status(self):
-        u""" < 各 Header Widget の折り畳みの状況を調べ、返す 関数 です>
-
-        :return: self.content.isVisible(): 折り畳みの状況(bool)
-            , self.content: content_widget name
-        :rtype:  Tuple[bool | None, QWidget]
-        """
-        return self.content.isVisible(), self.content
-
     # 追加箇所3
     # background_header プロパティを準備し、self.background への容易なアクセスを可にする
     # Header の QLabel を返す 関数
@@ -281,6 +1152,233 @@ class Header(QWidget):
         return self.background
 
 
+# 変換箇所20
+# 全ての PaintedHeader で共有する、太字の QFont と 寸法を測る為の QLabel(初回の使用時に作成します)
+_painted_header_font = None
+_painted_header_measure_label = None
+
+
+# 変換箇所20
+# 共有の 太字の QFont を返す 関数
+def _get_bold_font():
+    u""" < 全ての PaintedHeader で共有する、太字の QFont を返す 関数 です >
+
+    :rtype: QFont
+    """
+    global _painted_header_font
+    if _painted_header_font is None:
+        _painted_header_font = QFont()
+        _painted_header_font.setBold(True)
+    return _painted_header_font
+
+
+# 変換箇所20
+# 共有の 寸法を測る為の QLabel を返す 関数
+def _get_measure_label():
+    u""" < タイトルの寸法を Header の QLabel と同じ方法で測る為の、共有の QLabel(表示はしません)を返す 関数 です >
+
+    :rtype: QLabel
+    """
+    global _painted_header_measure_label
+    if _painted_header_measure_label is None:
+        _painted_header_measure_label = QLabel()
+    return _painted_header_measure_label
+
+
+# 追加箇所15
+class PaintedHeader(HeaderBase):  # 背景・矢印・タイトルを、1つ のウィジェットで描画する 軽量な Header
+    u""" < 背景・矢印・太字のタイトル を、子供Widget を持たずに 1つ のウィジェットで描画する Header です >
+
+    Header は QStackedLayout・ClickableWidget・QHBoxLayout・矢印とタイトルの QLabel・背景の QLabel
+        から成る為、Container を数千作成すると、その分の 作成・ポリッシュ・レイアウト が発生します
+    PaintedHeader は、それらを paintEvent で直接描画し、
+        太字の QFont は全ての PaintedHeader で共有、タイトルの文字配置は QStaticText にキャッシュします
+    .. note::
+        clickableHeaderWidget は自身を、background_header は背景色を設定できる 互換用のアダプター を返します
+        背景に setStyleSheet された場合は、スタイルシート(QWidget)で背景を描画します
+    """
+    # カスタムシグナルの定義: Header.clickableHeaderWidget(ClickableWidget)と同じく、リリース時に発信
+    clicked = Signal()
+
+    # Header の QHBoxLayout と同じ、左右の余白と 矢印とタイトルの間隔
+    margin = 11
+    spacing = 6
+
+    def __init__(self, name, content_widget, parent = None, color = HEADER_BACKGROUND_COLOR, radius = 2):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param str name: Name for the header
+        :param QWidget content_widget: Widget containing child elements
+        :param QWidget parent: 親ウィジェット(Container)
+        :param Tuple[int, int, int] color: 背景色
+        :param int radius: 背景の角の丸み
+        """
+        super(PaintedHeader, self).__init__(name, content_widget, parent)
+        self.setFont(_get_bold_font())  # 変換箇所20: クラス属性 -> モジュールの関数
+        self._color = QColor(*color)
+        self._radius = radius
+        self._title = name
+        self._static_text = None  # タイトルの文字配置(キャッシュ)
+        self._size_hint = None  # sizeHint(キャッシュ)
+        self._background = None  # background_header の アダプター(初回のアクセス時に作成します)
+
+    def mouseReleaseEvent(self, event):
+        self.clicked.emit()
+
+    # 矢印アイコンを、折り畳みの状況に合わせる 関数
+    def _update_arrow(self):
+        self.update()
+
+    def title(self):
+        u""" < Header のタイトルを返す 関数 です >
+
+        :rtype: str
+        """
+        return self._title
+
+    def set_title(self, name):
+        u""" < Header のタイトルを設定する 関数 です >
+
+        :param str name: Name for the header
+        """
+        if name == self._title:
+            return
+        self._title = name
+        self._static_text = None
+        self._size_hint = None
+        self.updateGeometry()
+        self.update()
+
+    # 背景色を返す 関数
+    def color(self):
+        u""" < 背景色を返す 関数 です >
+
+        :rtype: QColor
+        """
+        return QColor(self._color)
+
+    # 背景色を設定する 関数
+    def setColor(self, color):
+        u""" < 背景色を設定する 関数 です >
+
+        :param QColor | Tuple[int, int, int] color: 背景色
+        """
+        self._color = QColor(color) if isinstance(color, QColor) else QColor(*color)
+        self.update()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._static_text = None
+            self._size_hint = None
+        super(PaintedHeader, self).changeEvent(event)
+
+    def sizeHint(self):
+        # Header と同じく、幅は 余白 + 矢印 + 間隔 + QLabel の sizeHint、高さは 矢印とタイトルの高い方の 1.5倍 です
+        if self._size_hint is None:
+            label = self._title_size_hint()
+            arrow = self._arrow_size(self.expand_ico)
+            width = self.margin * 2 + arrow.width() + self.spacing + label.width()
+            height = int(max(arrow.height(), label.height()) * 1.5)
+            self._size_hint = QSize(width, height)
+        return QSize(self._size_hint)
+
+    # タイトルの QLabel の sizeHint を返す 関数
+    def _title_size_hint(self):
+        # QLabel の sizeHint は、文字幅 とは異なる(空のタイトルでも 幅と高さ を持つ)為、同じ QLabel で測ります
+        if not self._title:
+            # 空のタイトルは、作成直後の QLabel('') と同じ寸法です(文字を設定した後の QLabel とは異なります)
+            label = QLabel()
+            label.setFont(self.font())
+            return label.sizeHint()
+        label = _get_measure_label()  # 変換箇所20: クラス属性 -> モジュールの関数
+        label.setFont(self.font())
+        label.setText(self._title)
+        return label.sizeHint()
+
+    def minimumSizeHint(self):
+        return QSize(self.margin * 2, self.sizeHint().height())
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.styleSheet():
+            option = QStyleOption()
+            option.initFrom(self)
+            self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        else:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._color)
+            painter.drawRoundedRect(self.rect(), self._radius, self._radius)
+        icon = self.expand_ico if self._expanded else self.collapse_ico
+        arrow = self._arrow_size(icon)
+        x = self.margin
+        painter.drawPixmap(QRect(QPoint(x, (self.height() - arrow.height()) // 2), arrow), icon)
+        if self._static_text is None:
+            self._static_text = QStaticText(self._title)
+            self._static_text.setTextFormat(Qt.PlainText)
+            self._static_text.prepare(font = self.font())
+        x += arrow.width() + self.spacing
+        text_height = self._static_text.size().height()
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(QPointF(x, (self.height() - text_height) / 2.0), self._static_text)
+        painter.end()
+
+    # 矢印アイコンの描画サイズを返す 関数
+    @staticmethod
+    def _arrow_size(pixmap):
+        ratio = pixmap.devicePixelRatio() or 1.0
+        return QSize(int(pixmap.width() / ratio), int(pixmap.height() / ratio))
+
+    # Header と互換の プロパティ
+    @property
+    def clickableHeaderWidget(self):
+        u""" < クリック信号(clicked)を出すウィジェットを返す 関数 です(PaintedHeader 自身です) >
+
+        :rtype: PaintedHeader
+        """
+        return self
+
+    @property
+    def background_header(self):
+        u""" < 背景の アダプター を返す 関数 です >
+
+        Header.background_header(HeaderBackground)と同じく、color() / setColor() / setStyleSheet() が使えます
+
+        :rtype: _PaintedHeaderBackground
+        """
+        if self._background is None:
+            self._background = _PaintedHeaderBackground(self)
+        return self._background
+
+
+# 追加箇所15
+class _PaintedHeaderBackground(object):  # PaintedHeader の背景を、HeaderBackground と同じ操作で扱う アダプター
+    u""" < PaintedHeader の背景を、HeaderBackground と同じ操作で扱う アダプター です >
+
+    背景色・スタイルシート は PaintedHeader 自身に設定し、それ以外の属性は PaintedHeader へ委譲します
+    """
+    __slots__ = ('_header',)
+
+    def __init__(self, header):
+        self._header = header
+
+    def color(self):
+        return self._header.color()
+
+    def setColor(self, color):
+        self._header.setColor(color)
+
+    def styleSheet(self):
+        return self._header.styleSheet()
+
+    def setStyleSheet(self, style_sheet):
+        self._header.setStyleSheet(style_sheet)
+
+    def __getattr__(self, name):
+        return getattr(self._header, name)
+
+
 class Container(QWidget):
     """Class for creating a collapsible group similar to how it is implement in Maya
 
@@ -292,30 +1390,101 @@ class Container(QWidget):
             >>> layout.addWidget(container)
             >>> content_layout = QGridLayout(container.contentWidget)
             >>> content_layout.addWidget(QPushButton("Button"))
+
+            Build the content lazily, the first time the container is expanded
+
+            >>> def build(content_widget):
+            ...     QGridLayout(content_widget).addWidget(QPushButton("Button"))
+            >>> container = Container("Group", content_factory=build)
+            >>> container.is_materialized()
+            False
+
+            Animate collapse/expand
+
+            >>> container = Container("Group", animated=True)
+
+            Start in the restored state, so the first layout is already the final one
+
+            >>> container = Container("Group", expanded=False)
+
+            React once the layout has settled, with the exact heights
+
+            >>> container.geometryCommitted.connect(lambda old, new: print(new - old))
+
+            Draw the header in a single widget, for panels with many containers
+
+            >>> container = Container("Group", header_class=PaintedHeader)
+
+        Signals:
+            toggled (bool): emitted immediately when the container is expanded (True) or collapsed (False)
+            geometryCommitted (int, int): old and new height, emitted once the layout has settled
+                after one or more toggles (after the animation, when animated)
     """
+    # 追加箇所13
+    # カスタムシグナルの定義
+    toggled = Signal(bool)
+    geometryCommitted = Signal(int, int)
 
-    def __init__(self, name, color_background = False):
+    # 追加箇所15
+    # 既定の Header のクラス(PaintedHeader にすると、Container 毎のウィジェット数が減ります)
+    header_class = Header
+
+    def __init__(self, name, color_background = False, content_factory = None, animated = False,
+                 expanded = None, header_class = None, parent = None
+                 ):
         """Container Class Constructor to initialize the object
 
         Args:
             name (str): Name for the header
             color_background (bool): whether or not to color the background lighter like in maya
+            content_factory (Callable[[QWidget], None]): called with the content widget to populate it
+                the first time the container is expanded. The container starts collapsed when given
+            animated (bool): whether or not to animate the height on collapse/expand
+            expanded (bool): initial state. Defaults to expanded, or collapsed when content_factory is given.
+                An expanded container with a content_factory builds its content right away
+            header_class (type): HeaderBase subclass to use. Defaults to Container.header_class (Header).
+                PaintedHeader draws the whole header in a single widget
+            parent (QWidget): parent widget. Passing it at construction avoids reparenting (and re-polishing)
+                the container when it is added to the parent's layout
         """
-        super(Container, self).__init__()
+        super(Container, self).__init__(parent)
 
         # print('execute, Container')
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        self._content_widget = QWidget()
-        if color_background:
-            self._content_widget.setStyleSheet(
-                "QWidget{background-color: rgb(73, 73, 73); "
-                "margin-left: 2px; margin-right: 2px}"
-                )
-        self.header = Header(name, self._content_widget)  # 変換箇所1
+        # 変換箇所5: カスケードするスタイルシートから、自身で背景を描画する Content widget へ変更
+        # 変換箇所17: 子供Widget は、作成時に親を設定します
+        self._content_widget = ContentWidget(color_background, parent = None if animated else self)
+        # 追加箇所9: animated の時は、content widget を ContentClip に入れ、ContentClip の表示を切り替えます
+        self._content_clip = ContentClip(self._content_widget, parent = self) if animated else None
+        revealed = self._content_clip if animated else self._content_widget
+        # 変換箇所15: Header -> header_class
+        self.header = (header_class or self.header_class)(name, revealed, self)  # 変換箇所1
         layout.addWidget(self.header)
-        layout.addWidget(self._content_widget)
+        layout.addWidget(revealed)
+
+        # 追加箇所6
+        # content_factory が渡された場合、初回の expand まで content の作成を遅延させます
+        self._content_factory = content_factory
+        self._materialized = content_factory is None
+        self.header.aboutToExpand.connect(self.materialize)
+        # 追加箇所10: 初期の折り畳みの状況(表示前に決める為、最初のレイアウトが最終的なレイアウトになります)
+        if expanded is None:
+            expanded = self._materialized
+        if expanded:
+            self.materialize()
+        else:
+            self.header.collapse()
+
+        # 追加箇所13
+        # 初期の折り畳みの状況を適用した後に接続します(作成時には発信しません)
+        self._committed_height = None  # 確定待ちの場合は、変化前の高さ
+        self.header.toggled.connect(self._on_header_toggled)
+        if animated:
+            self._content_clip.animationFinished.connect(self._request_geometry_commit)
+        if _live_objects is not None:  # 追加箇所16
+            _account(self)
 
         # assign self.header methods to instance attributes so they can be called outside of this class
         # ヘッダー メソッドをインスタンス属性に割り当てて、このクラスの外部でヘッダー メソッドを呼び出せるようにします。
@@ -362,6 +1531,169 @@ class Container(QWidget):
         """
         return self.header.mousePressEvent()
 
+    # 追加箇所6
+    # content_factory で content を作成する 関数
+    def materialize(self):
+        u""" < content_factory で content を作成する 関数 です >
+
+        初回の expand() / toggle() で自動的に呼ばれます
+        作成済み、もしくは content_factory が無い場合は何もしません
+
+        :return: 今回の呼び出しで作成したかどうか
+        :rtype: bool
+        """
+        if self._materialized:
+            return False
+        start = perf_counter() if _profile_sink is not None else None  # 追加箇所12
+        self._materialized = True  # content_factory 内からの expand() で再度呼ばれないよう、先に立てます
+        self._content_factory(self._content_widget)
+        if start is not None:  # 追加箇所12
+            report_profile_event('materialize', self.title(), start, _count_widgets(self._content_widget))
+        return True
+
+    # 追加箇所13
+    # Header の折り畳みの状況が変化した時の 関数
+    def _on_header_toggled(self, expanded):
+        if self._committed_height is None:
+            self._committed_height = self.height()
+            self._request_geometry_commit()
+        self.toggled.emit(expanded)
+
+    # 追加箇所13
+    # レイアウトの確定後に geometryCommitted を発信する予約をする 関数
+    def _request_geometry_commit(self):
+        # 自身へのポストイベントは、自身が破棄された場合は Qt が捨ててくれます
+        QApplication.postEvent(self, QEvent(_GEOMETRY_COMMIT_EVENT))
+
+    # 追加箇所13
+    # レイアウトを確定させ、geometryCommitted を発信する 関数
+    def _commit_geometry(self):
+        if self._committed_height is None or self.is_animating():
+            return  # アニメーション中は、終了時(animationFinished)に再度呼ばれます
+        # 保留中のレイアウトの要求を、window まで 全て 処理してから高さを読みます
+        QApplication.sendPostedEvents(None, QEvent.LayoutRequest)
+        layout = self.window().layout()
+        if layout is not None:
+            layout.activate()
+        old, self._committed_height = self._committed_height, None
+        self.geometryCommitted.emit(old, self.height())
+
+    def event(self, event):
+        if event.type() == _GEOMETRY_COMMIT_EVENT:  # 追加箇所13
+            self._commit_geometry()
+            return True
+        return super(Container, self).event(event)
+
+    # 追加箇所14
+    # content_factory を返す 関数
+    def content_factory(self):
+        u""" < content_factory を返す 関数 です >
+
+        content_factory がある Container は、content を破棄しても作り直せます
+
+        :rtype: Callable[[QWidget], None] | None
+        """
+        return self._content_factory
+
+    # 追加箇所7
+    # content_factory を差し替える 関数
+    def set_content_factory(self, content_factory):
+        u""" < content_factory を差し替える 関数 です >
+
+        現在の content は破棄され、次回の expand() で新しい content_factory から作成し直します
+        展開中の場合は、その場で作成し直します
+
+        :param Callable[[QWidget], None] | None content_factory: content を作成する関数
+        """
+        self.discard_content()
+        self._content_factory = content_factory
+        self._materialized = content_factory is None
+        if self.is_expanded():
+            self.materialize()
+
+    # 追加箇所7
+    # content の中身(子供ウィジェットとレイアウト)を破棄する 関数
+    def discard_content(self):
+        u""" < content の中身(子供ウィジェットとレイアウト)を破棄する 関数 です >
+
+        content widget 自体は残り、content_factory がある場合は未作成の状態に戻ります
+        """
+        content = self._content_widget
+        layout = content.layout()
+        if layout is not None:
+            QWidget().setLayout(layout)  # 一時的なウィジェットへ移し、一緒に破棄させます
+        for child in content.children():
+            if child.isWidgetType():
+                child.setParent(None)
+            child.deleteLater()
+        self._materialized = self._content_factory is None
+
+    # 追加箇所7
+    # Header のタイトルを返す 関数
+    def title(self):
+        u""" < Header のタイトルを返す 関数 です >
+
+        :rtype: str
+        """
+        return self.header.title()
+
+    # 追加箇所7
+    # Header のタイトルを設定する 関数
+    def set_title(self, name):
+        u""" < Header のタイトルを設定する 関数 です >
+
+        :param str name: Name for the header
+        """
+        self.header.set_title(name)
+
+    # 追加箇所6
+    # content が作成済みかどうかを返す 関数
+    def is_materialized(self):
+        u""" < content が作成済みかどうかを返す 関数 です >
+
+        :return: content_factory が呼ばれたかどうか(content_factory が無い場合は常に True)
+        :rtype: bool
+        """
+        return self._materialized
+
+    # 追加箇所6
+    # 折り畳みの状況を返す 関数
+    def is_expanded(self):
+        u""" < 折り畳みの状況を返す 関数 です >
+
+        :return: True: -expand- / False: -collapse-
+        :rtype: bool
+        """
+        return self.header.is_expanded()
+
+    # 追加箇所9
+    # アニメーション中かどうかを返す 関数
+    def is_animating(self):
+        u""" < アニメーション中かどうかを返す 関数 です >
+
+        :return: animated でない場合は常に False
+        :rtype: bool
+        """
+        return self._content_clip is not None and self._content_clip.is_animating()
+
+    # 追加箇所8
+    # sizeHint から計算した、Container の高さを返す 関数
+    def height_hint(self, expanded = None):
+        u""" < sizeHint から計算した、Container の高さを返す 関数 です >
+
+        Container 自身のレイアウトの確定を待たずに、Header と content の sizeHint から計算します
+        collapse/expand 直後でも、確定後の高さを返します
+
+        :param bool expanded: どちらの状況の高さを返すか(省略時は現在の状況)
+        :rtype: int
+        """
+        if expanded is None:
+            expanded = self.is_expanded()
+        height = self.header.sizeHint().height()
+        if expanded:
+            height += self.layout().spacing() + self._content_widget.sizeHint().height()
+        return height
+
     # Container で定義する Content widget を返す
     @property
     def contentWidget(self):
@@ -387,11 +1719,69 @@ class Container(QWidget):
     #     return self._content_widget.height()
 
 
+# 追加箇所11
+# 新しいプロセスで、モジュールの import にかかる時間を計測する コード(引数: モジュール名)
+_IMPORT_TIME_CODE = ('import sys, importlib, PySide2.QtWidgets\n'  # Maya と同じく PySide2 は読み込み済みにします
+                     'from time import perf_counter\n'
+                     'start = perf_counter()\n'
+                     'importlib.import_module(sys.argv[1])\n'
+                     'print(perf_counter() - start)\n')
+
+
+# 追加箇所11
+# モジュールの import にかかる時間を計測する 関数
+def measure_import_time(module_names = ('Container',), repeat = 5, executable = None):
+    u""" < モジュールの import にかかる時間を計測する 関数 です >
+
+    Maya の起動時(PySide2 は読み込み済み)に相当する、モジュールの import の時間を、
+        計測毎に 新しいプロセス で計測します(ローカルの依存モジュールの import も含みます)
+    変換箇所21: 同じプロセス内で 読み込み直すと、QEvent.registerEventType() などが 毎回 実行され、
+        イベントの種類 が漏れる為、新しいプロセスで計測します
+
+    .. note::
+        PySide2 を含めた、新しいプロセスでの内訳は
+            python -X importtime -c "import Container"
+        で確認できます
+
+    :param Iterable[str] module_names: 計測するモジュール名群
+    :param int repeat: 計測の回数(最小値を採用します)
+    :param str executable: 計測に使用する python(省略時は sys.executable、Maya 内からは mayapy を指定してください)
+    :return: {モジュール名: 秒}
+    :rtype: Dict[str, float]
+    """
+    import os
+    import subprocess
+    import sys
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+    results = {}
+    for module_name in module_names:
+        timings = []
+        for _ in range(repeat):
+            output = subprocess.check_output([executable or sys.executable, '-c', _IMPORT_TIME_CODE, module_name],
+                                             env = env)
+            timings.append(float(output.decode().strip().splitlines()[-1]))
+        results[module_name] = min(timings)
+    return results
+
+
+# 追加箇所11
+# スクリプトとして実行した時の 関数: import にかかる時間を表示します
+def _main(argv):
+    u""" < スクリプトとして実行した時の 関数 です >
+
+    ::
+
+        python Container.py [module_name ...]
+    """
+    module_names = argv or ['Container']
+    for module_name, seconds in measure_import_time(module_names).items():
+        print(u'{}: {:.3f} ms'.format(module_name, seconds * 1000.0))
+
+
+# 変換箇所11: import 時には何も出力しません(Maya の Script Editor への出力は遅い為)
 if __name__ == '__main__':
-    print(u'{}.py: loaded as script file'.format(__name__))
-else:
-    print(u'{}.py: loaded as module file'.format(__name__))
-    print('{}'.format(__file__))  # 実行したモジュールフルパスを表示する
+    import sys
+    _main(sys.argv[1:])
 # pprint.pprint(RT4_UI_PyMel.mro())  # メソッドを呼び出す順番が解ります
-
-print(u'モジュール名:{}\n'.format(__name__))  # 実行したモジュール名を表示する
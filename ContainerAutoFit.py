@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerAutoFit.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    Container の collapse/expand に合わせて、window の高さを自動でフィットさせる
+        - 通称: オートフィット(ContainerAutoFit)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    以前は、クリックされた Container の geometry() を レイアウト確定前に読み、
+        resize → adjustSize → resize(と 固定値 adjust = 20) で帳尻を合わせていました。
+    ContainerAutoFit は、
+        - 各 Container の高さ(Container.height_hint)の 合計 を、変化した Container の分だけ 差分で更新し、
+        - 同じイベントループ内の 複数の変化 を 1回 にまとめて、
+        - sizeHint から計算した最終的な高さで、1回 だけ resize します。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from ContainerGroup import ContainerGroup
+        from ContainerAutoFit import ContainerAutoFit
+
+        # 以下 e.g.):
+        ############################################################
+        group = ContainerGroup()
+        group.add(container_a)
+        group.add(container_b)
+        # Container を window のレイアウトへ追加した後に作成します
+        auto_fit = ContainerAutoFit(window, group)
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+from time import perf_counter
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject, QTimer
+
+# ローカルで作成したモジュール
+from Container import profile_sink, report_profile_event
+
+
+class ContainerAutoFit(QObject):
+    u""" < Container の collapse/expand に合わせて、window の高さを自動でフィットさせる クラス です >
+
+    .. note::
+        window の高さ = Container 以外の部分(chrome) + 各 Container の height_hint の合計
+        chrome は refit() の時点で 1回 だけ計測します
+        Container の追加・削除や、window 内の Container 以外の部分を変更した場合は、refit() を呼んでください
+    """
+
+    def __init__(self, window, group, enabled = True):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param QWidget window: 高さをフィットさせる window
+        :param ContainerGroup group: window 内の Container を登録した グループ
+        :param bool enabled: オートフィットを有効にするかどうか
+        """
+        # window は 親 として参照し、強参照を持ちません(window と一緒に破棄されます)
+        super(ContainerAutoFit, self).__init__(window)
+        self._group = group
+        self._enabled = enabled
+        self._heights = {}  # key: キー, value: Container の height_hint
+        self._total = 0
+        self._chrome = 0
+        self._dirty = set()
+
+        # 同じイベントループ内の変化を、1回 の resize にまとめる為のタイマー
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._apply)
+
+        group.statesChanged.connect(self._on_states_changed)
+        self.refit()
+
+    # オートフィットが有効かどうかを返す 関数
+    def is_enabled(self):
+        u""" < オートフィットが有効かどうかを返す 関数 です >
+
+        :rtype: bool
+        """
+        return self._enabled
+
+    # オートフィットの有効・無効を設定する 関数
+    def set_enabled(self, enabled):
+        u""" < オートフィットの有効・無効を設定する 関数 です >
+
+        有効にした時は、その場で refit() します
+
+        :param bool enabled: True で有効
+        """
+        self._enabled = bool(enabled)
+        if self._enabled:
+            self.refit()
+
+    # フィットさせる高さを返す 関数
+    def fitted_height(self):
+        u""" < フィットさせる高さを返す 関数 です >
+
+        :rtype: int
+        """
+        return self._chrome + self._total
+
+    # 全ての高さを計測し直して、フィットさせる 関数
+    def refit(self):
+        u""" < 全ての高さを計測し直して、フィットさせる 関数 です > """
+        self._heights = {key: container.height_hint()
+                         for key, container in zip(self._group.keys(), self._group.containers())
+                         }
+        self._total = sum(self._heights.values())
+        self._chrome = self.parent().sizeHint().height() - self._total
+        self._dirty.clear()
+        self._resize()
+
+    # 変化した Container を記録し、まとめて反映する予約をする 関数
+    def _on_states_changed(self, states):
+        self._dirty.update(states)
+        if self._enabled and not self._timer.isActive():
+            self._timer.start()
+
+    # 変化した Container の分だけ合計を更新し、1回 だけ resize する 関数
+    def _apply(self):
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty:
+            try:
+                container = self._group.container(key)
+            except KeyError:  # 登録解除・破棄済みの Container は、合計から除きます
+                self._total -= self._heights.pop(key, 0)
+                continue
+            height = container.height_hint()
+            self._total += height - self._heights.get(key, 0)
+            self._heights[key] = height
+        self._resize(len(dirty))
+
+    # window の高さを、フィットさせる高さに resize する 関数
+    def _resize(self, changed = 0):
+        if not self._enabled:
+            return
+        # 計測イベントの送り先がある場合のみ、レイアウトの確定と resize にかかった時間を送ります
+        start = perf_counter() if profile_sink() is not None else None
+        window = self.parent()
+        # window の最小サイズは、レイアウトの確定時に更新される為、先に確定させておきます
+        # (確定前の 古い最小サイズ で resize が切り詰められるのを防ぎます)
+        layout = window.layout()
+        if layout is not None:
+            layout.activate()
+        height = self.fitted_height()
+        if window.height() != height:
+            window.resize(window.width(), height)
+        if start is not None:
+            report_profile_event('relayout', window.objectName(), start, changed)
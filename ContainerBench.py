@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerBench.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    Container の 作成・collapse/expand・リセット・保存/復元 の性能を計測する ベンチマーク
+        - 通称: コンテナベンチ(ContainerBench)
+詳細(details):
+    test2.py は Maya の中でしか動かない為、これまで性能を計測する方法がありませんでした。
+    ContainerBench は、Maya 無しの Linux 上でも offscreen の Qt プラットフォームで動作し、
+        - N 個(既定: 10, 100, 1000)の 中身のある Container の作成
+        - toggle() と Header のクリック
+        - ContainerGroup での 全て collapse / 全て expand
+        - FormResetter でのリセット
+        - StatePersister / StateSchema での保存と復元
+    について、
+        - 経過時間(wall time)
+        - レイアウトの要求回数(QEvent.LayoutRequest の回数)
+        - Python のメモリ使用量のピーク(tracemalloc)
+    を計測し、JSON ファイル へ書き出します。
+    バージョン間で JSON を比較することで、性能の劣化(リグレッション)が見えるようにします。
+使用法(usage):
+    ::
+
+        # シェル から
+        python ContainerBench.py --sizes 10 100 1000 --repeat 3 --output bench.json
+        python ContainerBench.py --compare old_bench.json --output new_bench.json
+
+        # Maya の Script Editor から(既存の QApplication を使用します)
+        import ContainerBench
+        results = ContainerBench.run_benchmarks(sizes = (10, 100))
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from collections import OrderedDict
+from time import perf_counter
+
+
+# ベンチマークの既定値
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_REPEAT = 3
+CLICK_SAMPLES = 20  # Header のクリックは 1回 毎にレイアウトが走る為、この数だけクリックします
+
+
+# Container のバージョンを返す 関数
+def container_version():
+    u""" < Container.py の docstring に書かれたバージョンを返す 関数 です >
+
+    :rtype: str
+    """
+    import Container
+    match = re.search(r':Version:\s*(\S+)', Container.__doc__ or '')
+    return match.group(1) if match else 'unknown'
+
+
+# QEvent.LayoutRequest の回数を数える イベントフィルター を作成する 関数
+def _create_layout_counter():
+    from PySide2.QtCore import QObject, QEvent
+
+    class _LayoutRequestCounter(QObject):  # QApplication の全ての LayoutRequest を数える
+        def __init__(self):
+            super(_LayoutRequestCounter, self).__init__()
+            self.count = 0
+
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.LayoutRequest:
+                self.count += 1
+            return False
+
+    return _LayoutRequestCounter()
+
+
+# 保留中のイベント(レイアウト・破棄)を全て処理する 関数
+def _settle():
+    from PySide2.QtCore import QCoreApplication, QEvent
+    QCoreApplication.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+class _Fixture(object):
+    u""" < 計測用の window と、N 個 の中身のある Container です > """
+
+    def __init__(self, n, show = True):
+        from PySide2.QtWidgets import (QWidget, QVBoxLayout, QGridLayout, QLabel, QLineEdit,
+                                       QSpinBox, QCheckBox
+                                       )
+        from Container import Container
+        from ContainerGroup import ContainerGroup
+
+        self.window = QWidget()
+        self.window.setObjectName('ContainerBench_ui')
+        layout = QVBoxLayout(self.window)
+        self.group = ContainerGroup(self.window)
+        self.containers = []
+        for index in range(n):
+            container = Container('Group{}'.format(index), color_background = True)
+            content_layout = QGridLayout(container.contentWidget)
+            content_layout.addWidget(QLabel('Name'), 0, 0)
+            content_layout.addWidget(QLineEdit('value{}'.format(index)), 0, 1)
+            content_layout.addWidget(QLabel('Count'), 1, 0)
+            spin_box = QSpinBox()
+            spin_box.setValue(index % 100)
+            content_layout.addWidget(spin_box, 1, 1)
+            check_box = QCheckBox('Enabled')
+            check_box.setChecked(True)
+            content_layout.addWidget(check_box, 2, 1)
+            layout.addWidget(container)
+            self.group.add(container, 'cont{}_QWid'.format(index))
+            self.containers.append(container)
+        if show:
+            self.window.show()
+            _settle()
+
+    # window を破棄する 関数
+    def close(self):
+        self.window.close()
+        self.window.deleteLater()
+        _settle()
+
+
+# 以下、シナリオ 関数 群
+#   setup(n) で 計測しない準備 を行い、(計測する 関数, 後片付けの 関数) を返します
+def _scenario_construct(n):
+    fixtures = []
+
+    def body():
+        fixtures.append(_Fixture(n))
+
+    def teardown():
+        for fixture in fixtures:
+            fixture.close()
+
+    return body, teardown
+
+
+def _scenario_toggle(n):
+    fixture = _Fixture(n)
+
+    def body():
+        for container in fixture.containers:
+            container.toggle()
+        _settle()
+        for container in fixture.containers:
+            container.toggle()
+        _settle()
+
+    return body, fixture.close
+
+
+def _scenario_header_click(n):
+    from PySide2.QtCore import Qt, QEvent, QPointF
+    from PySide2.QtGui import QMouseEvent
+    from PySide2.QtWidgets import QApplication
+
+    fixture = _Fixture(n)
+    targets = fixture.containers[:CLICK_SAMPLES]
+
+    def click(widget):
+        position = QPointF(widget.rect().center())
+        for event_type in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            event = QMouseEvent(event_type, position, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+            QApplication.sendEvent(widget, event)
+
+    def body():
+        # 1回 のクリック毎に、画面の更新(レイアウト)まで進めます
+        for _ in range(2):
+            for container in targets:
+                click(container.contentHeader.clickableHeaderWidget)
+                _settle()
+
+    return body, fixture.close
+
+
+def _scenario_collapse_expand_all(n):
+    fixture = _Fixture(n)
+
+    def body():
+        fixture.group.collapse_all()
+        _settle()
+        fixture.group.expand_all()
+        _settle()
+
+    return body, fixture.close
+
+
+def _scenario_reset(n):
+    from FormResetter import FormResetter
+
+    fixture = _Fixture(n)
+    resetter = FormResetter()
+
+    def body():
+        resetter.reset(fixture.window)
+        _settle()
+
+    return body, fixture.close
+
+
+def _scenario_save_restore(n):
+    from PySide2.QtCore import QSettings
+    from StatePersister import StatePersister
+    from StateSchema import StateSchema
+
+    fixture = _Fixture(n)
+    directory = tempfile.mkdtemp(prefix = 'ContainerBench_')
+    filename = os.path.join(directory, 'ContainerBench_ui.ini')
+    preset = os.path.join(directory, 'ContainerBench_preset.ini')
+    schema = StateSchema()
+    for key in fixture.group.keys():
+        schema.add(key, default = True)
+    # 復元する状況(全て閉じた状態)を 別のファイルへ保存し、全て開いた状態から計測を始めます
+    settings = QSettings(preset, QSettings.IniFormat)
+    settings.setIniCodec('utf-8')
+    schema.save(settings, dict.fromkeys(fixture.group.keys(), False))
+    settings.sync()
+    fixture.group.expand_all()
+    _settle()
+    persister = StatePersister(fixture.window, fixture.group, filename)
+
+    def body():
+        # 現在の状況(全て開いた状態)を保存し、異なる状況(全て閉じた状態)を復元します
+        persister.mark_all_dirty()
+        persister.flush(wait_for_write = True)
+        settings = QSettings(preset, QSettings.IniFormat)
+        settings.setIniCodec('utf-8')
+        schema.apply(fixture.group, schema.load(settings))
+        _settle()
+
+    def teardown():
+        fixture.close()
+        shutil.rmtree(directory, ignore_errors = True)
+
+    return body, teardown
+
+
+# シナリオ名 と シナリオ 関数
+SCENARIOS = OrderedDict([('construct', _scenario_construct),
+                         ('toggle', _scenario_toggle),
+                         ('header_click', _scenario_header_click),
+                         ('collapse_expand_all', _scenario_collapse_expand_all),
+                         ('reset', _scenario_reset),
+                         ('save_restore', _scenario_save_restore),
+                         ])
+
+
+# 1つ のシナリオを計測する 関数
+def measure(scenario, n, repeat = DEFAULT_REPEAT):
+    u""" < 1つ のシナリオを計測する 関数 です >
+
+    経過時間は、計測の邪魔をしない様に イベントフィルター も tracemalloc も無しで repeat 回 計測します
+    レイアウトの要求回数 と メモリ使用量のピーク は、別の 1回 で計測します
+
+    :param str scenario: シナリオ名(SCENARIOS のキー)
+    :param int n: Container の数
+    :param int repeat: 経過時間の計測回数
+    :return: 計測結果
+    :rtype: Dict[str, Any]
+    """
+    from PySide2.QtWidgets import QApplication
+
+    setup = SCENARIOS[scenario]
+    timings = []
+    for _ in range(repeat):
+        body, teardown = setup(n)
+        try:
+            start = perf_counter()
+            body()
+            timings.append(perf_counter() - start)
+        finally:
+            teardown()
+
+    app = QApplication.instance()
+    counter = _create_layout_counter()
+    body, teardown = setup(n)
+    try:
+        app.installEventFilter(counter)
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9 以降
+            tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            body()
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+            app.removeEventFilter(counter)
+    finally:
+        teardown()
+
+    timings.sort()
+    return OrderedDict([('scenario', scenario),
+                        ('n', n),
+                        ('repeat', repeat),
+                        ('wall_ms_min', round(timings[0] * 1000.0, 3)),
+                        ('wall_ms_median', round(timings[len(timings) // 2] * 1000.0, 3)),
+                        ('layout_requests', counter.count),
+                        ('peak_kib', round(max(peak, 0) / 1024.0, 1)),
+                        ])
+
+
+# 全てのシナリオを計測する 関数
+def run_benchmarks(sizes = DEFAULT_SIZES, scenarios = None, repeat = DEFAULT_REPEAT, verbose = True):
+    u""" < 全てのシナリオを計測する 関数 です >
+
+    QApplication が無い場合は作成します(Maya の中では、既存のものを使用します)
+
+    :param Iterable[int] sizes: Container の数 群
+    :param Iterable[str] scenarios: シナリオ名 群(None の場合は全て)
+    :param int repeat: 経過時間の計測回数
+    :param bool verbose: 1行 ずつ結果を表示するかどうか
+    :return: {'meta': 環境の情報, 'results': 計測結果 群}
+    :rtype: Dict[str, Any]
+    """
+    import PySide2
+    from PySide2.QtCore import qVersion
+    from PySide2.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841  計測中は生かしておきます
+    results = []
+    for n in sizes:
+        for scenario in (scenarios or SCENARIOS):
+            result = measure(scenario, n, repeat)
+            results.append(result)
+            if verbose:
+                print(format_result(result))
+
+    meta = OrderedDict([('container_version', container_version()),
+                        ('python', platform.python_version()),
+                        ('pyside2', PySide2.__version__),
+                        ('qt', qVersion()),
+                        ('platform', platform.platform()),
+                        ('qpa', QApplication.platformName()),
+                        ])
+    return OrderedDict([('meta', meta), ('results', results)])
+
+
+# 計測結果を 1行 の文字列にする 関数
+def format_result(result):
+    u""" < 計測結果を 1行 の文字列にする 関数 です >
+
+    :param Dict[str, Any] result: measure() の戻り値
+    :rtype: str
+    """
+    return u'{scenario:<20} n={n:<5} min={wall_ms_min:>10.3f} ms  median={wall_ms_median:>10.3f} ms  ' \
+           u'layout={layout_requests:>6}  peak={peak_kib:>9.1f} KiB'.format(**result)
+
+
+# 2つ の計測結果を比較する 関数
+def compare(old, new):
+    u""" < 2つ の計測結果を比較し、経過時間の比(new / old)を返す 関数 です >
+
+    :param Dict[str, Any] old: 以前の run_benchmarks() の戻り値(JSON)
+    :param Dict[str, Any] new: 今回の run_benchmarks() の戻り値(JSON)
+    :return: [(シナリオ名, n, 比)] 比が 1.0 より大きい場合は、遅くなっています
+    :rtype: List[Tuple[str, int, float]]
+    """
+    previous = {(result['scenario'], result['n']): result for result in old['results']}
+    ratios = []
+    for result in new['results']:
+        before = previous.get((result['scenario'], result['n']))
+        if before is None or not before['wall_ms_min']:
+            continue
+        ratios.append((result['scenario'], result['n'], result['wall_ms_min'] / before['wall_ms_min']))
+    return ratios
+
+
+# スクリプトとして実行した時の 関数
+def main(argv = None):
+    u""" < スクリプトとして実行した時の 関数 です >
+
+    :param List[str] argv: コマンドライン引数(None の場合は sys.argv[1:])
+    :return: 終了コード
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description = u'Container benchmark (headless)')
+    parser.add_argument('--sizes', type = int, nargs = '+', default = list(DEFAULT_SIZES))
+    parser.add_argument('--scenarios', nargs = '+', choices = list(SCENARIOS), default = None)
+    parser.add_argument('--repeat', type = int, default = DEFAULT_REPEAT)
+    parser.add_argument('--output', default = None, help = u'JSON file to write the results to')
+    parser.add_argument('--compare', default = None, help = u'previous JSON file to compare with')
+    args = parser.parse_args(argv)
+
+    # Maya も ディスプレイ も無い環境で動かす為、offscreen を既定にします
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    data = run_benchmarks(args.sizes, args.scenarios, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent = 2)
+        print(u'Save a JSON file, at \n\t\t{}'.format(args.output))
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        print(u'Compare with {} ({})'.format(args.compare, old['meta'].get('container_version')))
+        for scenario, n, ratio in compare(old, data):
+            print(u'{:<20} n={:<5} x{:.2f}'.format(scenario, n, ratio))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerEviction.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    長く閉じたままの Container の content を破棄し、再度 開いた時に作り直す メモリ管理
+        - 通称: コンテナイビクション(ContainerEviction)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    一度作成した content は、閉じても(setVisible(False))子供Widget・モデル・QPixmap などを保持し続けます。
+    アセット毎の インスペクター などでは、長い Maya のセッションで 数百MB になります。
+    ContainerEviction は、content_factory で作り直せる Container について、
+        - 最後に 開いた(expand)順 を記録し、
+        - 閉じていて content が作成済みの Container が 予算(budget)を超えた分を、古い順に破棄します。
+    破棄する前に入力フィールドの値を FormState で取得しておき、
+        再度 開いた時に content_factory で作り直した content へ戻します。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from ContainerEviction import ContainerEviction
+
+        # 以下 e.g.):
+        ############################################################
+        eviction = ContainerEviction(budget = 8, parent = window)
+        for container in inspector_containers:  # content_factory を持つ Container
+            eviction.add(container)
+
+        eviction.stats()  # {'budget': 8, 'tracked': 40, 'resident': 8, 'evicted': 12, 'rebuilt': 3}
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import weakref
+from collections import OrderedDict
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject
+
+# ローカルで作成したモジュール
+from FormState import FormState
+
+
+class ContainerEviction(QObject):
+    u""" < 閉じた Container の content を、最後に開いた順(LRU)で 予算 を超えた分だけ破棄する クラス です >
+
+    .. note::
+        開いている Container と、アニメーション中の Container は破棄しません
+        破棄は Container の高さの確定後(geometryCommitted)に行う為、閉じるアニメーションの邪魔をしません
+    """
+
+    def __init__(self, budget = 8, form_state = None, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param int budget: 閉じた状態で content を保持し続ける Container の最大数
+        :param FormState form_state: 入力フィールドの値の 取得・復元 に使用します(省略時は既定の FormState)
+        :param QObject parent: 親オブジェクト
+        """
+        super(ContainerEviction, self).__init__(parent)
+        self._budget = budget
+        self.form_state = form_state if form_state is not None else FormState()
+        # Container は弱参照で保持し、破棄(destroyed)された Container は自動で忘れます
+        self._order = OrderedDict()  # key: weakref.ref(Container), value: None (最後に開いた順、古い順)
+        self._saved = {}  # key: weakref.ref(破棄した Container), value: 入力フィールドの値
+        self._destroyed_slots = {}  # key: weakref.ref(Container), value: destroyed に接続した関数
+        self._evicted = 0
+        self._rebuilt = 0
+
+    # Container を登録する 関数
+    def add(self, container):
+        u""" < Container を登録する 関数 です >
+
+        :param Container container: content_factory を持つ Container
+        :raises ValueError: content_factory が無い(content を作り直せない)場合
+        """
+        if container.content_factory() is None:
+            raise ValueError(u'"{}" has no content_factory to rebuild its content'.format(container.title()))
+        ref = weakref.ref(container)
+        if ref in self._order:
+            return
+        self._order[ref] = None
+        container.toggled.connect(self._on_toggled)
+        container.geometryCommitted.connect(self._on_geometry_committed)
+        container.header.aboutToExpand.connect(self._on_about_to_expand)
+        # Container を強参照しないよう、弱参照だけを捕まえます
+        slot = self._destroyed_slots[ref] = lambda *args: self._forget(ref)
+        container.destroyed.connect(slot)
+        self.trim()
+
+    # Container の登録を解除する 関数
+    def remove(self, container):
+        u""" < Container の登録を解除する 関数 です >
+
+        破棄済みの content は、次回の expand() で content_factory から作り直されます(値は戻りません)
+
+        :param Container container: 登録済みの Container
+        """
+        ref = weakref.ref(container)
+        slot = self._destroyed_slots.get(ref)
+        self._forget(ref)
+        container.toggled.disconnect(self._on_toggled)
+        container.geometryCommitted.disconnect(self._on_geometry_committed)
+        container.header.aboutToExpand.disconnect(self._on_about_to_expand)
+        if slot is not None:
+            container.destroyed.disconnect(slot)
+
+    # 予算を返す 関数
+    def budget(self):
+        u""" < 閉じた状態で content を保持し続ける Container の最大数を返す 関数 です >
+
+        :rtype: int
+        """
+        return self._budget
+
+    # 予算を設定する 関数
+    def set_budget(self, budget):
+        u""" < 閉じた状態で content を保持し続ける Container の最大数を設定する 関数 です >
+
+        超えた分は、その場で破棄します
+
+        :param int budget: 最大数
+        """
+        self._budget = budget
+        self.trim()
+
+    # content を保持している、閉じた Container 群を返す 関数
+    def resident(self):
+        u""" < content を保持している、閉じた Container 群を、最後に開いた順(古い順)に返す 関数 です >
+
+        :rtype: List[Container]
+        """
+        containers = (ref() for ref in self._order)
+        return [container for container in containers
+                if container is not None and container.is_materialized() and not container.is_expanded()
+                ]
+
+    # 予算を超えた分の content を破棄する 関数
+    def trim(self):
+        u""" < 予算を超えた分の content を、最後に開いたのが古い順に破棄する 関数 です >
+
+        :return: 破棄した Container 数
+        :rtype: int
+        """
+        resident = self.resident()
+        excess = len(resident) - self._budget
+        evicted = 0
+        for container in resident:
+            if evicted >= excess:
+                break
+            if self.evict(container):
+                evicted += 1
+        return evicted
+
+    # content を破棄する 関数
+    def evict(self, container):
+        u""" < 入力フィールドの値を取得してから、content を破棄する 関数 です >
+
+        :param Container container: 登録済みの Container
+        :return: 破棄したかどうか(開いている・アニメーション中・未作成 の場合は破棄しません)
+        :rtype: bool
+        """
+        if container.is_expanded() or container.is_animating() or not container.is_materialized():
+            return False
+        self._saved[weakref.ref(container)] = self.form_state.capture(container.contentWidget)
+        container.discard_content()
+        self._evicted += 1
+        return True
+
+    # 統計を返す 関数
+    def stats(self):
+        u""" < 統計を返す 関数 です >
+
+        :return: {'budget': 予算, 'tracked': 登録数, 'resident': 閉じて content を保持している数,
+                  'evicted': 破棄した回数, 'rebuilt': 破棄した content を作り直した回数}
+        :rtype: Dict[str, int]
+        """
+        return {'budget': self._budget,
+                'tracked': len(self._order),
+                'resident': len(self.resident()),
+                'evicted': self._evicted,
+                'rebuilt': self._rebuilt,
+                }
+
+    # 登録を忘れる 関数
+    def _forget(self, ref):
+        self._order.pop(ref, None)
+        self._saved.pop(ref, None)
+        self._destroyed_slots.pop(ref, None)
+
+    # Container の折り畳みの状況が変化した時の 関数
+    def _on_toggled(self, expanded):
+        if expanded:
+            self._order.move_to_end(weakref.ref(self.sender()))  # 最後に開いた Container を、一番新しくします
+
+    # Container の高さが確定した時の 関数
+    def _on_geometry_committed(self, old_height, new_height):
+        if not self.sender().is_expanded():
+            self.trim()
+
+    # Container が開く直前の 関数
+    def _on_about_to_expand(self):
+        # Container 自身の materialize() が先に接続されている為、content は作り直された後です
+        container = self.sender().parent()
+        values = self._saved.pop(weakref.ref(container), None)
+        if values is None:
+            return
+        self.form_state.restore(container.contentWidget, values)
+        self._rebuilt += 1
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerGroup.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    複数の Container を、キー付きで まとめて 操作する グループ
+        - 通称: コンテナーグループ(ContainerGroup)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    Container を1つずつ collapse() / expand() し、その度に window をリサイズすると、
+        Container の数だけ レイアウト と 再描画 が走り、ちらつきます。
+    ContainerGroup は、window の更新を止めた状態で 全ての変更を適用し、
+        最後に 1回 だけ レイアウト を確定させ、変更をまとめた 1つ のシグナルを発信します。
+    登録した Container は 弱参照 で保持し、Container が破棄(destroyed)されると、自動で登録が解除されます。
+        (WA_DeleteOnClose で閉じた window の Container を、グループが生かし続けません)
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from Container import Container
+        from ContainerGroup import ContainerGroup
+
+        # 以下 e.g.):
+        ############################################################
+        group = ContainerGroup(window)
+        container_a = Container("GroupA")
+        layout.addWidget(container_a)  # Container は レイアウト(親) が保持します
+        group.add(container_a)
+        container_b = Container("GroupB")
+        layout.addWidget(container_b)
+        group.add(container_b, key='contB')
+        group.statesChanged.connect(print)  # {'GroupA': False, 'contB': False}
+
+        group.collapse_all()
+        group.set_states({'GroupA': True})
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import weakref
+from contextlib import contextmanager
+from time import perf_counter
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject, Signal
+
+# ローカルで作成したモジュール
+from Container import profile_sink, report_profile_event
+
+
+class ContainerGroup(QObject):
+    u""" < 複数の Container を、キー付きで まとめて 操作する グループ です >
+
+    .. note::
+        statesChanged(dict) は、折り畳みの状況が変化した Container の {キー: 状況} を発信します
+        batch() 内の変更は、まとめて 1回 だけ発信されます
+        Container は弱参照で保持する為、親(レイアウト)に入れるなどして、別途 生かしておいてください
+    """
+    # カスタムシグナルの定義
+    statesChanged = Signal(dict)
+
+    def __init__(self, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param QObject parent: 親オブジェクト
+        """
+        super(ContainerGroup, self).__init__(parent)
+        self._containers = {}  # key: キー, value: weakref.ref(Container) (登録順)
+        self._keys = weakref.WeakKeyDictionary()  # key: Container, value: キー
+        self._destroyed_slots = {}  # key: キー, value: destroyed に接続した関数(登録解除時に切断します)
+        self._batch_depth = 0
+        self._pending = {}  # key: キー, value: (変化前の状況, 現在の状況)
+
+    # Container を登録する 関数
+    def add(self, container, key = None):
+        u""" < Container を登録する 関数 です >
+
+        :param Container container: 登録する Container
+        :param str key: 保存・復元などで使用する、安定したキー(省略時は Header のタイトル)
+        :return: 登録したキー
+        :rtype: str
+        """
+        if key is None:
+            key = container.title()
+        if key in self._containers:
+            raise ValueError(u'key "{}" is already registered'.format(key))
+        ref = weakref.ref(container)
+        self._containers[key] = ref
+        self._keys[container] = key
+        container.header.toggled.connect(self._on_container_toggled)
+        # Container を強参照しないよう、キーと弱参照だけを捕まえます
+        slot = self._destroyed_slots[key] = lambda *args: self._discard(key, ref)
+        container.destroyed.connect(slot)
+        return key
+
+    # Container の登録を解除する 関数
+    def remove(self, key):
+        u""" < Container の登録を解除する 関数 です >
+
+        :param str key: 登録時のキー
+        """
+        container = self._containers.pop(key)()
+        slot = self._destroyed_slots.pop(key)
+        self._pending.pop(key, None)
+        if container is None:
+            return  # Python のラッパーは回収済み
+        self._keys.pop(container, None)
+        try:
+            container.header.toggled.disconnect(self._on_container_toggled)
+            container.destroyed.disconnect(slot)
+        except RuntimeError:  # C++ オブジェクトは破棄済み(destroyed からの解除)
+            pass
+
+    # キーから Container を返す 関数
+    def container(self, key):
+        u""" < キーから Container を返す 関数 です >
+
+        :param str key: 登録時のキー
+        :raises KeyError: 未登録、もしくは破棄済みの場合
+        :rtype: Container
+        """
+        container = self._containers[key]()
+        if container is None:
+            raise KeyError(key)
+        return container
+
+    # Container のキーを返す 関数
+    def key(self, container):
+        u""" < Container のキーを返す 関数 です >
+
+        :param Container container: 登録済みの Container
+        :rtype: str
+        """
+        return self._keys[container]
+
+    # 登録済みのキー群を返す 関数
+    def keys(self):
+        u""" < 登録済みのキー群を、登録順に返す 関数 です >
+
+        :rtype: List[str]
+        """
+        return [key for key, container in self._items()]
+
+    # 登録済みの Container 群を返す 関数
+    def containers(self):
+        u""" < 登録済みの Container 群を、登録順に返す 関数 です >
+
+        :rtype: List[Container]
+        """
+        return [container for key, container in self._items()]
+
+    # 全ての折り畳みの状況を返す 関数
+    def states(self):
+        u""" < 全ての折り畳みの状況を返す 関数 です >
+
+        :return: {キー: True(-expand-) / False(-collapse-)}
+        :rtype: Dict[str, bool]
+        """
+        return {key: container.is_expanded() for key, container in self._items()}
+
+    # 全ての Container を閉じる 関数
+    def collapse_all(self):
+        u""" < 全ての Container を、1回 のレイアウトで閉じる 関数 です > """
+        self.set_states(dict.fromkeys(self.keys(), False))
+
+    # 全ての Container を開く 関数
+    def expand_all(self):
+        u""" < 全ての Container を、1回 のレイアウトで開く 関数 です > """
+        self.set_states(dict.fromkeys(self.keys(), True))
+
+    # 複数の Container の折り畳みの状況を、まとめて設定する 関数
+    def set_states(self, mapping):
+        u""" < 複数の Container の折り畳みの状況を、まとめて設定する 関数 です >
+
+        状況が変わらない Container には触れません
+
+        :param Dict[str, bool] mapping: {キー: True(-expand-) / False(-collapse-)}
+            未登録のキーは無視します
+        """
+        with self.batch():
+            for key, expanded in mapping.items():
+                ref = self._containers.get(key)
+                container = ref() if ref is not None else None
+                if container is None or container.is_expanded() == bool(expanded):
+                    continue
+                if expanded:
+                    container.expand()
+                else:
+                    container.collapse()
+
+    # 変更をまとめる コンテキストマネージャー
+    @contextmanager
+    def batch(self):
+        u""" < 変更をまとめる コンテキストマネージャー です >
+
+        with ブロック内では window の更新と、Container を持つ親のレイアウトを止め、抜けた時に
+            1回 だけ レイアウト を確定させ、statesChanged を 1回 だけ発信します
+        入れ子にした場合は、一番外側を抜けた時に まとめて 行います
+
+        .. note::
+            QWidget.setVisible(True) は、親のレイアウトを window まで その場で確定させる為、
+                レイアウトを止めないと、expand() の度に 全ての Container が移動(Move)します
+        """
+        windows = []
+        layouts = []
+        if self._batch_depth == 0:
+            windows = self._top_windows()
+            for window in windows:
+                window.setUpdatesEnabled(False)
+            layouts = self._host_layouts()
+            for layout in layouts:
+                layout.setEnabled(False)
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                # window のレイアウトの確定で、外側から順に 全て確定されます
+                for layout in layouts:
+                    layout.setEnabled(True)
+                for window in windows:
+                    # 計測イベントの送り先がある場合のみ、レイアウトの確定にかかった時間を送ります
+                    start = perf_counter() if profile_sink() is not None else None
+                    self._activate_layout(window)
+                    window.setUpdatesEnabled(True)
+                    if start is not None:
+                        report_profile_event('relayout', window.objectName(), start, len(self._pending))
+                self._flush_pending()
+
+    # 登録済みの Container が属する window 群を返す 関数
+    def _top_windows(self):
+        windows = []
+        for key, container in self._items():
+            window = container.window()
+            if window not in windows:
+                windows.append(window)
+        return windows
+
+    # 登録済みの Container を持つ親の レイアウト 群を、内側から順に返す 関数
+    def _host_layouts(self):
+        depths = {}  # key: 親, value: (window からの深さ, レイアウト)
+        for key, container in self._items():
+            chain = []
+            parent = container.parentWidget()
+            while parent is not None and parent not in depths:
+                chain.append(parent)
+                if parent.isWindow():
+                    break
+                parent = parent.parentWidget()
+            # 既に深さの分かっている親(もしくは window)から、外側 → 内側 の順に深さを決めます
+            depth = depths[parent][0] + 1 if parent is not None and parent in depths else 0
+            for widget in reversed(chain):
+                depths[widget] = (depth, widget.layout())
+                depth += 1
+        # 入れ子の Container でも、内側のレイアウトを先に確定させる為、深い順に並べます
+        ordered = sorted(depths.values(), key = lambda item: item[0], reverse = True)
+        # 隠れている(閉じた content の中など)レイアウトは、表示される時に確定される為 含めません
+        return [layout for depth, layout in ordered
+                if layout is not None and layout.isEnabled() and layout.parentWidget().isVisible()
+                ]
+
+    # window の レイアウト を確定させる 関数
+    @staticmethod
+    def _activate_layout(window):
+        layout = window.layout()
+        if layout is not None:
+            layout.activate()
+
+    # 生きている (キー, Container) 群を、登録順に返す 関数
+    def _items(self):
+        items = []
+        for key, ref in self._containers.items():
+            container = ref()
+            if container is not None:
+                items.append((key, container))
+        return items
+
+    # 登録を解除する 関数(destroyed 時)
+    def _discard(self, key, ref):
+        # 同じキーで新しい Container が登録し直されている場合は、解除しません
+        if self._containers.get(key) is ref:
+            self.remove(key)
+
+    # 溜めていた変化を発信する 関数
+    def _flush_pending(self):
+        pending, self._pending = self._pending, {}
+        # batch() 内で 開いて 閉じた など、元に戻った Container は含めません
+        changed = {key: current for key, (original, current) in pending.items() if original != current}
+        if changed:
+            self.statesChanged.emit(changed)
+
+    # Container の折り畳みの状況が変化した時の 関数
+    def _on_container_toggled(self, expanded):
+        key = self._keys.get(self.sender().parent())
+        if key is None:
+            return
+        original = self._pending[key][0] if key in self._pending else not expanded
+        self._pending[key] = (original, expanded)
+        if self._batch_depth == 0:
+            self._flush_pending()
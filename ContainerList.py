@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerList.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    表示範囲付近の Container のみを実体化する、仮想化された Container のリスト
+        - 通称: コンテナーリスト(ContainerList)
+        - 型: QScrollArea の派生クラス(サブクラス)
+詳細(details):
+    シーンのノード毎など、数千のセクションを Container で並べると、
+        全てが QWidget ツリーとして作成される為、実用になりません。
+    ContainerList は、セクション毎の 折り畳みの状況 と 高さ のみを保持し、
+        表示範囲(+ overscan)に入ったセクションだけに、Container を割り当てます。
+    範囲外に出た Container はプールへ戻し、別のセクションへ再利用します。
+        - content_binder を渡した場合は、作成済みの content も そのまま再利用し、
+            content_binder で 新しいセクションの値へ更新します(content widget と子供Widget も再利用されます)
+        - 渡さない場合は、content を破棄し、表示された時に content_factory で作り直します
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from ContainerList import ContainerList
+
+        # 以下 e.g.):
+        ############################################################
+        nodes = ['pCube{}'.format(i) for i in range(5000)]
+
+        def build(index, content_widget):
+            content_layout = QtWidgets.QGridLayout(content_widget)
+            content_layout.addWidget(QtWidgets.QLabel(nodes[index]))
+
+        container_list = ContainerList(build)
+        container_list.set_titles(nodes)
+        ##############################
+
+        # or
+
+        ############################################################
+        def build(index, content_widget):  # Container 毎に 初回のみ
+            label = QtWidgets.QLabel(nodes[index], objectName = 'node')
+            QtWidgets.QGridLayout(content_widget).addWidget(label)
+
+        def bind(index, content_widget):  # 再利用の度に、値だけを更新します
+            content_widget.findChild(QtWidgets.QLabel, 'node').setText(nodes[index])
+
+        container_list = ContainerList(build, content_binder = bind)
+        container_list.set_titles(nodes)
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+from bisect import bisect_right
+
+# サードパーティライブラリ
+from PySide2.QtWidgets import QScrollArea, QWidget, QFrame
+from PySide2.QtCore import Qt
+
+# ローカルで作成したモジュール
+from Container import Container
+
+
+class ContainerList(QScrollArea):
+    u""" < 表示範囲付近の Container のみを実体化する、仮想化された Container のリスト です >
+
+    .. note::
+        content_binder が無い場合、content_factory(index, content_widget) は、
+            セクションが表示範囲で展開される度に呼ばれ、範囲外へスクロールした content は破棄されます
+        content_binder が在る場合、content_factory は Container 毎に 初回のみ呼ばれ、
+            以降は content_binder(index, content_widget) で 別のセクションへ更新されます
+        どちらの場合も、入力値などはデータ側に保持してください
+    """
+
+    def __init__(self, content_factory, parent = None, color_background = False,
+                 overscan = 200, estimated_content_height = 80, content_binder = None
+                 ):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param Callable[[int, QWidget], None] content_factory: セクションの content を作成する関数
+        :param QWidget parent: 親ウィジェット
+        :param bool color_background: 各 Container の color_background
+        :param int overscan: 表示範囲の上下に、余分に実体化するピクセル数
+        :param int estimated_content_height: 一度も展開されていないセクションの、content の推定高さ
+        :param Callable[[int, QWidget], None] content_binder: 作成済みの content を、
+            別のセクションの値へ更新する関数(省略時は、content を破棄して作り直します)
+        """
+        super(ContainerList, self).__init__(parent)
+        self._content_factory = content_factory
+        self._content_binder = content_binder
+        self._color_background = color_background
+        self.overscan = overscan
+        self.estimated_content_height = estimated_content_height
+
+        # セクション毎の情報
+        self._titles = []
+        self._expanded = []
+        self._expanded_heights = []  # 展開時の高さ(実測値、未計測は None)
+        self._offsets = [0]  # 各セクションの y 座標の累積和(len: セクション数 + 1)
+        self._dirty_from = None  # 累積和を計算し直す 最初のセクション番号(None: 計算し直し不要)
+
+        # 実体化している Container
+        self._active = {}  # key: index, value: Container
+        self._indexes = {}  # key: Container, value: index
+        self._pool = []
+        self._collapsed_height = None
+        self._binding = False
+
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setWidgetResizable(False)
+        self._canvas = QWidget()
+        self.setWidget(self._canvas)
+        self.verticalScrollBar().valueChanged.connect(self._update_visible)
+
+    # セクションのタイトル群を設定する 関数
+    def set_titles(self, titles, expanded = False):
+        u""" < セクションのタイトル群を設定する 関数 です >
+
+        既存のセクションは全て置き換えられます
+
+        :param List[str] titles: セクションのタイトル群(個数がセクション数になります)
+        :param bool expanded: 初期の折り畳みの状況
+        """
+        for index in list(self._active):
+            self._release(index)
+        self._titles = list(titles)
+        self._expanded = [bool(expanded)] * len(self._titles)
+        self._expanded_heights = [None] * len(self._titles)
+        self._invalidate_offsets(0)
+        self._relayout()
+
+    # セクション数を返す 関数
+    def count(self):
+        u""" < セクション数を返す 関数 です >
+
+        :rtype: int
+        """
+        return len(self._titles)
+
+    # セクションの折り畳みの状況を返す 関数
+    def is_expanded(self, index):
+        u""" < セクションの折り畳みの状況を返す 関数 です >
+
+        :param int index: セクション番号
+        :rtype: bool
+        """
+        return self._expanded[index]
+
+    # セクションの折り畳みの状況を設定する 関数
+    def set_expanded(self, index, expanded):
+        u""" < セクションの折り畳みの状況を設定する 関数 です >
+
+        実体化されていないセクションは、状況の記録と高さの更新のみ行います
+
+        :param int index: セクション番号
+        :param bool expanded: True: -expand- / False: -collapse-
+        """
+        container = self._active.get(index)
+        if container is not None:
+            container.expand() if expanded else container.collapse()
+            return
+        if self._expanded[index] != bool(expanded):
+            self._expanded[index] = bool(expanded)
+            self._invalidate_offsets(index)
+            self._relayout()
+
+    # セクションの折り畳みを切り替える 関数
+    def toggle(self, index):
+        u""" < セクションの折り畳みを切り替える 関数 です >
+
+        :param int index: セクション番号
+        """
+        self.set_expanded(index, not self._expanded[index])
+
+    # 実体化している Container を返す 関数
+    def container_at(self, index):
+        u""" < 実体化している Container を返す 関数 です >
+
+        :param int index: セクション番号
+        :return: 表示範囲外の場合は None
+        :rtype: Container | None
+        """
+        return self._active.get(index)
+
+    # 実体化しているセクション番号群を返す 関数
+    def visible_indexes(self):
+        u""" < 実体化しているセクション番号群を返す 関数 です >
+
+        :rtype: List[int]
+        """
+        return sorted(self._active)
+
+    # セクションを表示範囲へスクロールする 関数
+    def scroll_to(self, index):
+        u""" < セクションを表示範囲へスクロールする 関数 です >
+
+        :param int index: セクション番号
+        """
+        self._ensure_offsets()
+        self.verticalScrollBar().setValue(self._offsets[index])
+
+    # セクションの高さを返す 関数
+    def section_height(self, index):
+        u""" < セクションの高さを返す 関数 です >
+
+        未計測の展開時の高さは、estimated_content_height からの推定値です
+
+        :param int index: セクション番号
+        :rtype: int
+        """
+        collapsed = self._measure_collapsed_height()
+        if not self._expanded[index]:
+            return collapsed
+        height = self._expanded_heights[index]
+        if height is None:
+            return collapsed + self.estimated_content_height
+        return height
+
+    def resizeEvent(self, event):
+        super(ContainerList, self).resizeEvent(event)
+        self._relayout()
+
+    # 折り畳み時の高さ(全セクション共通)を計測する 関数
+    def _measure_collapsed_height(self):
+        if self._collapsed_height is None:
+            probe = self._acquire()
+            probe.collapse()
+            self._collapsed_height = probe.sizeHint().height()
+            self._pool.append(probe)
+        return self._collapsed_height
+
+    # 累積和を、セクション番号 index 以降から計算し直す予約をする 関数
+    def _invalidate_offsets(self, index):
+        if self._dirty_from is None or index < self._dirty_from:
+            self._dirty_from = index
+
+    # 各セクションの y 座標の累積和を更新する 関数
+    def _ensure_offsets(self):
+        start = self._dirty_from
+        if start is None:
+            return
+        # index より前のセクションの座標は変わらない為、index 以降だけを計算し直します
+        offsets = self._offsets
+        del offsets[start + 1:]
+        total = offsets[start]
+        for index in range(start, len(self._titles)):
+            total += self.section_height(index)
+            offsets.append(total)
+        self._dirty_from = None
+
+    # canvas のサイズを更新し、表示範囲の Container を並べ直す 関数
+    def _relayout(self):
+        self._ensure_offsets()
+        self._canvas.resize(self.viewport().width(), self._offsets[-1])
+        self._update_visible()
+
+    # 表示範囲(+ overscan)のセクションに Container を割り当てる 関数
+    def _update_visible(self, *args):
+        self._ensure_offsets()
+        count = len(self._titles)
+        top = max(0, self.verticalScrollBar().value() - self.overscan)
+        bottom = self.verticalScrollBar().value() + self.viewport().height() + self.overscan
+
+        wanted = set()
+        index = max(0, bisect_right(self._offsets, top) - 1)
+        while index < count and self._offsets[index] < bottom:
+            wanted.add(index)
+            index += 1
+
+        for index in [i for i in self._active if i not in wanted]:
+            self._release(index)
+
+        width = self.viewport().width()
+        remeasured = None  # 推定値と実測値が異なった 最初のセクション番号
+        for index in sorted(wanted):
+            container = self._active.get(index)
+            if container is None:
+                container = self._bind(index)
+                if self._store_height(index, container) and remeasured is None:
+                    remeasured = index
+            container.setGeometry(0, self._offsets[index], width, self.section_height(index))
+        # 推定値と実測値が異なった場合は、座標を計算し直して並べ直します
+        if remeasured is not None:
+            self._invalidate_offsets(remeasured)
+            self._relayout()
+
+    # 展開時の実測の高さを記録する 関数
+    def _store_height(self, index, container):
+        if not self._expanded[index]:
+            return False
+        height = container.sizeHint().height()
+        if self._expanded_heights[index] == height:
+            return False
+        self._expanded_heights[index] = height
+        return True
+
+    # Container をプールから取得、もしくは新規作成する 関数
+    def _acquire(self):
+        if self._pool:
+            return self._pool.pop()
+        container = Container('', self._color_background, content_factory = self._unbound_factory)
+        container.setParent(self._canvas)
+        container.header.toggled.connect(self._on_container_toggled)
+        return container
+
+    # セクションへ Container を割り当てる 関数
+    def _bind(self, index):
+        container = self._acquire()
+        self._binding = True
+        try:
+            container.set_title(self._titles[index])
+            container.collapse()
+            if self._content_binder is not None and container.is_materialized():
+                # 作成済みの content を、新しいセクションの値へ更新して再利用します
+                self._content_binder(index, container.contentWidget)
+            else:
+                container.set_content_factory(
+                    lambda content_widget, index = index: self._content_factory(index, content_widget)
+                    )
+            if self._expanded[index]:
+                container.expand()
+        finally:
+            self._binding = False
+        self._active[index] = container
+        self._indexes[container] = index
+        container.show()
+        return container
+
+    # セクションから Container を外し、プールへ戻す 関数
+    def _release(self, index):
+        container = self._active.pop(index)
+        del self._indexes[container]
+        container.hide()
+        if self._content_binder is None or not container.is_materialized():
+            # content_binder が無い場合は、content を破棄します
+            self._binding = True
+            try:
+                container.set_content_factory(self._unbound_factory)
+            finally:
+                self._binding = False
+        self._pool.append(container)
+
+    # 割り当て前の Container 用の、何もしない content_factory
+    @staticmethod
+    def _unbound_factory(content_widget):
+        pass
+
+    # Header のクリックなどで、実体化している Container の折り畳みの状況が変化した時の 関数
+    def _on_container_toggled(self, expanded):
+        if self._binding:
+            return
+        container = self.sender().parent()
+        index = self._indexes.get(container)
+        if index is None:
+            return
+        self._expanded[index] = expanded
+        self._store_height(index, container)
+        self._invalidate_offsets(index)
+        self._relayout()
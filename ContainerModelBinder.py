@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerModelBinder.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    QAbstractItemModel の 最上位の行 を Container に、その 子の行 を content 内の 入力フィールド に結び付ける
+        - 通称: コンテナモデルバインダー(ContainerModelBinder)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    content は手作りのウィジェットの為、データを更新するには レイアウトを空にして 作り直していました。
+    Maya の選択が変わる度に更新されるアトリビュートパネルでは、この作り直しが一番のコストです。
+    ContainerModelBinder は、
+        - 最上位の行 毎に Container を作成し(タイトル: label_column の DisplayRole)、
+        - 子の行 毎に QFormLayout の 1行(ラベル: label_column、入力フィールド: value_column の EditRole)を作成し、
+        - rowsInserted / rowsRemoved / dataChanged では、該当する Container・入力フィールド だけを更新します。
+    入力フィールドの値は、ウィジェットの ユーザープロパティ(QLineEdit.text, QSpinBox.value など)で 読み書きし、
+        変更は model.setData() でモデルへ戻します。
+    子の行の 入力フィールド は、Container を初めて開いた時に作成します(content_factory)。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from ContainerModelBinder import ContainerModelBinder
+
+        # 以下 e.g.):
+        ############################################################
+        # model: 最上位の行 = ノード、子の行 = アトリビュート(列0: 名前, 列1: 値)
+        binder = ContainerModelBinder(model, window_layout, group = group, parent = window)
+        binder.containers()  # 最上位の行 と同じ並びの Container 群
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject, Qt, QModelIndex, QPersistentModelIndex
+from PySide2.QtWidgets import (QFormLayout, QLabel, QLineEdit, QCheckBox, QSpinBox,
+                               QDoubleSpinBox
+                               )
+
+# ローカルで作成したモジュール
+from Container import Container
+
+
+# 値の型から 入力フィールド を作成する、既定の 関数
+def default_editor(value):
+    u""" < 値の型から 入力フィールド を作成する、既定の 関数 です >
+
+    :param value: value_column の EditRole の値
+    :return: 入力フィールド(値を編集できない型の場合は QLabel)
+    :rtype: QWidget
+    """
+    if isinstance(value, bool):
+        return QCheckBox()
+    if isinstance(value, int):
+        editor = QSpinBox()
+        editor.setRange(-2147483647 - 1, 2147483647)
+        return editor
+    if isinstance(value, float):
+        editor = QDoubleSpinBox()
+        editor.setRange(-1e12, 1e12)
+        editor.setDecimals(3)
+        return editor
+    if isinstance(value, str):
+        return QLineEdit()
+    return QLabel()
+
+
+class _Section(object):
+    u""" < 最上位の行 と Container の組 です > """
+    __slots__ = ('container', 'index', 'key', 'form', 'fields')
+
+    def __init__(self, container, index, key):
+        self.container = container
+        self.index = index  # QPersistentModelIndex: 最上位の行
+        self.key = key  # ContainerGroup のキー
+        self.form = None  # QFormLayout(content の作成前は None)
+        self.fields = None  # 子の行 と同じ並びの (ラベル, 入力フィールド) 群(content の作成前は None)
+
+
+class ContainerModelBinder(QObject):
+    u""" < QAbstractItemModel の行を、Container と 入力フィールド に結び付ける クラス です >
+
+    .. note::
+        ContainerGroup のキーは、最上位の行の タイトル です
+            同じタイトルが既にある場合は 'タイトル[番号]' とし、タイトルが変わった場合は 登録し直します
+        modelReset / layoutChanged / rowsMoved の場合は、全て作り直します
+    """
+    # 入力フィールドの変更を モデル へ戻す シグナル の名前(未登録の型は ユーザープロパティ の通知シグナル)
+    commit_signals = {QLineEdit: 'editingFinished'}
+
+    def __init__(self, model, host_layout, group = None, root = QModelIndex(), label_column = 0,
+                 value_column = 1, editor_factory = default_editor, parent = None
+                 ):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param QAbstractItemModel model: 結び付けるモデル
+        :param QBoxLayout host_layout: Container を追加するレイアウト(現在の末尾から、行の順に追加します)
+        :param ContainerGroup group: Container を登録する グループ(省略可)
+        :param QModelIndex root: 最上位の行 の親
+        :param int label_column: タイトル・ラベル の列
+        :param int value_column: 値 の列
+        :param Callable[[Any], QWidget] editor_factory: 値から 入力フィールド を作成する関数
+        :param QObject parent: 親オブジェクト
+        """
+        super(ContainerModelBinder, self).__init__(parent)
+        self._model = model
+        self._host_layout = host_layout
+        self._offset = host_layout.count()
+        self._group = group
+        self._root = QPersistentModelIndex(root)
+        self.label_column = label_column
+        self.value_column = value_column
+        self.editor_factory = editor_factory
+        self._sections = []  # 最上位の行 と同じ並びの _Section 群
+        self._committing = False
+
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.dataChanged.connect(self._on_data_changed)
+        model.modelReset.connect(self.rebuild)
+        model.layoutChanged.connect(self.rebuild)
+        model.rowsMoved.connect(self.rebuild)
+        self._insert_sections(0, model.rowCount(root) - 1)
+
+    # Container 群を返す 関数
+    def containers(self):
+        u""" < 最上位の行 と同じ並びの Container 群を返す 関数 です >
+
+        :rtype: List[Container]
+        """
+        return [section.container for section in self._sections]
+
+    # 行の Container を返す 関数
+    def container(self, row):
+        u""" < 最上位の行 の Container を返す 関数 です >
+
+        :param int row: 最上位の行
+        :rtype: Container
+        """
+        return self._sections[row].container
+
+    # 入力フィールドを返す 関数
+    def editor(self, row, child_row):
+        u""" < 子の行 の 入力フィールド を返す 関数 です >
+
+        :param int row: 最上位の行
+        :param int child_row: 子の行
+        :return: content の作成前は None
+        :rtype: QWidget | None
+        """
+        fields = self._sections[row].fields
+        return fields[child_row][1] if fields is not None else None
+
+    # 全て作り直す 関数
+    def rebuild(self):
+        u""" < 全ての Container を作り直す 関数 です > """
+        self._remove_sections(0, len(self._sections) - 1)
+        self._insert_sections(0, self._model.rowCount(QModelIndex(self._root)) - 1)
+
+    # 以下、モデルのシグナル用の 関数 群
+    def _on_rows_inserted(self, parent, first, last):
+        if self._root == parent:
+            self._insert_sections(first, last)
+            return
+        section = self._section_for(parent)
+        if section is not None and section.fields is not None:
+            for row in range(first, last + 1):
+                self._insert_field(section, row)
+
+    def _on_rows_removed(self, parent, first, last):
+        if self._root == parent:
+            self._remove_sections(first, last)
+            return
+        section = self._section_for(parent)
+        if section is not None and section.fields is not None:
+            for row in range(last, first - 1, -1):
+                del section.fields[row]
+                section.form.removeRow(row)
+
+    def _on_data_changed(self, top_left, bottom_right, roles = ()):
+        if self._committing:
+            return  # 入力フィールドからの変更は、既に反映済みです
+        parent = top_left.parent()
+        columns = range(top_left.column(), bottom_right.column() + 1)
+        if self._root == parent:
+            if self.label_column in columns:
+                for row in range(top_left.row(), bottom_right.row() + 1):
+                    section = self._sections[row]
+                    title = self._label(self._model.index(row, self.label_column, parent))
+                    section.container.set_title(title)
+                    self._rekey(section, title)
+            return
+        section = self._section_for(parent)
+        if section is None or section.fields is None:
+            return  # content の作成前は、作成時に最新の値を読みます
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            label, editor = section.fields[row]
+            if self.label_column in columns:
+                label.setText(self._label(self._model.index(row, self.label_column, parent)))
+            if self.value_column in columns:
+                self._write_editor(editor, self._model.index(row, self.value_column, parent).data(Qt.EditRole))
+
+    # 最上位の行 の _Section を返す 関数
+    def _section_for(self, index):
+        if not index.isValid() or self._root != index.parent():
+            return None  # 孫以下の行は扱いません
+        return self._sections[index.row()]
+
+    # Container を作成する 関数
+    def _insert_sections(self, first, last):
+        root = QModelIndex(self._root)
+        for row in range(first, last + 1):
+            index = self._model.index(row, self.label_column, root)
+            title = self._label(index)
+            section = _Section(None, QPersistentModelIndex(index), self._unique_key(title))
+            # 子の行の 入力フィールド は、初めて開いた時に作成します
+            section.container = Container(title, content_factory = lambda content, section = section:
+                                          self._build_fields(section, content)
+                                          )
+            # _sections・レイアウト を変更する前に登録し、失敗した場合に 中途半端な状態 を残さないようにします
+            if self._group is not None:
+                try:
+                    self._group.add(section.container, section.key)
+                except ValueError:
+                    section.container.deleteLater()
+                    raise
+            self._sections.insert(row, section)
+            self._host_layout.insertWidget(self._offset + row, section.container)
+
+    # タイトルから、重複しないキーを返す 関数
+    def _unique_key(self, title, section = None):
+        used = {other.key for other in self._sections if other is not section}
+        if self._group is not None:
+            used.update(self._group.keys())
+            if section is not None:
+                used.discard(section.key)
+        key = title
+        index = 1
+        while key in used:
+            key = '{}[{}]'.format(title, index)
+            index += 1
+        return key
+
+    # タイトルが変わった Container を、新しいキーで登録し直す 関数
+    def _rekey(self, section, title):
+        key = self._unique_key(title, section)
+        if key == section.key:
+            return
+        if self._group is not None:
+            self._group.remove(section.key)
+            self._group.add(section.container, key)
+        section.key = key
+
+    # Container を破棄する 関数
+    def _remove_sections(self, first, last):
+        for row in range(last, first - 1, -1):
+            section = self._sections.pop(row)
+            if self._group is not None:
+                self._group.remove(section.key)
+            section.container.setParent(None)
+            section.container.deleteLater()
+
+    # content に 子の行 の 入力フィールド を作成する 関数(content_factory)
+    def _build_fields(self, section, content):
+        section.form = QFormLayout(content)
+        section.fields = []
+        parent = QModelIndex(section.index)
+        for row in range(self._model.rowCount(parent)):
+            self._insert_field(section, row)
+
+    # 子の行 の 入力フィールド を作成する 関数
+    def _insert_field(self, section, row):
+        parent = QModelIndex(section.index)
+        value_index = self._model.index(row, self.value_column, parent)
+        value = value_index.data(Qt.EditRole)
+        label = QLabel(self._label(self._model.index(row, self.label_column, parent)))
+        editor = self.editor_factory(value)
+        self._write_editor(editor, value)
+        self._connect_editor(editor, QPersistentModelIndex(value_index))
+        section.fields.insert(row, (label, editor))
+        section.form.insertRow(row, label, editor)
+
+    # 入力フィールドの変更を モデル へ戻す 接続をする 関数
+    def _connect_editor(self, editor, value_index):
+        name = None
+        for base in type(editor).__mro__:
+            if base in self.commit_signals:
+                name = self.commit_signals[base]
+                break
+        if name is None:
+            prop = editor.metaObject().userProperty()
+            if not prop.isValid() or not prop.hasNotifySignal() or isinstance(editor, QLabel):
+                return  # 読み取り専用
+            name = bytes(prop.notifySignal().methodSignature()).decode().split('(')[0]
+        getattr(editor, name).connect(lambda *args: self._commit(editor, value_index))
+
+    # 入力フィールドの値を モデル へ戻す 関数
+    def _commit(self, editor, value_index):
+        if not value_index.isValid():
+            return
+        value = editor.metaObject().userProperty().read(editor)
+        self._committing = True
+        try:
+            self._model.setData(QModelIndex(value_index), value, Qt.EditRole)
+        finally:
+            self._committing = False
+
+    # 入力フィールドへ値を書き込む 関数(シグナルを止めて)
+    @staticmethod
+    def _write_editor(editor, value):
+        if isinstance(editor, QLabel):
+            editor.setText('' if value is None else str(value))
+            return
+        if value is None:
+            return
+        blocked = editor.blockSignals(True)
+        try:
+            editor.metaObject().userProperty().write(editor, value)
+        finally:
+            editor.blockSignals(blocked)
+
+    # タイトル・ラベル の文字列を返す 関数
+    @staticmethod
+    def _label(index):
+        value = index.data(Qt.DisplayRole)
+        return '' if value is None else str(value)
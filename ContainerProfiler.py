@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerProfiler.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    Container の 計測イベント(ProfileEvent)の 送り先(シンク) 群
+        - 通称: コンテナプロファイラー(ContainerProfiler)
+詳細(details):
+    これまでの計測は、test2.py の check_domain デコレーターで 開始・終了 を表示するだけでした。
+    Container / Header は、
+        - expand / collapse / content の作成(materialize)
+        - ContainerGroup・ContainerAutoFit による window のレイアウトの確定(relayout)
+    の度に、Container のタイトル・経過時間・表示を切り替えたウィジェット数 を 送り先 へ送ります。
+    送り先が無い間は 時間の取得すら行わない為、本番環境で常に有効にしておけます。
+    当モジュールは、その送り先として
+        - メモリ上のリングバッファ(RingBufferSink)
+        - 任意の関数の呼び出し(CallbackSink)
+        - JSON Lines 形式のファイル(JsonLinesSink)
+    を提供します。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from ContainerProfiler import RingBufferSink, JsonLinesSink, profiling
+        from Container import set_profile_sink
+
+        # 以下 e.g.):
+        ############################################################
+        sink = RingBufferSink(maxlen = 500)
+        set_profile_sink(sink)
+        # ... UI を操作 ...
+        sink.slowest(5)  # 時間のかかった 計測イベント 上位5件
+
+        # 一時的に ファイル へ(16ms 以上かかったものだけ)
+        with profiling(JsonLinesSink('/tmp/container_profile.jsonl', threshold = 0.016)):
+            ...
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import json
+from collections import deque, OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from time import time
+
+# ローカルで作成したモジュール
+from Container import set_profile_sink
+
+
+class RingBufferSink(object):
+    u""" < 最新の 計測イベント を、メモリ上に決まった数だけ保持する 送り先 です >
+
+    .. note::
+        maxlen を超えると、古い 計測イベント から捨てられます
+    """
+
+    def __init__(self, maxlen = 1000, threshold = 0.0):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param int maxlen: 保持する 計測イベント の最大数
+        :param float threshold: この秒数 未満 の 計測イベント は保持しません
+        """
+        self.threshold = threshold
+        self._events = deque(maxlen = maxlen)
+
+    def __call__(self, event):
+        if event.duration >= self.threshold:
+            self._events.append(event)
+
+    # 保持している 計測イベント 群を返す 関数
+    def events(self):
+        u""" < 保持している 計測イベント 群を、古い順に返す 関数 です >
+
+        :rtype: List[ProfileEvent]
+        """
+        return list(self._events)
+
+    # 保持している 計測イベント を空にする 関数
+    def clear(self):
+        u""" < 保持している 計測イベント を空にする 関数 です > """
+        self._events.clear()
+
+    # 時間のかかった 計測イベント 群を返す 関数
+    def slowest(self, count = 10):
+        u""" < 時間のかかった 計測イベント 群を、遅い順に返す 関数 です >
+
+        :param int count: 返す数
+        :rtype: List[ProfileEvent]
+        """
+        return sorted(self._events, key = lambda event: event.duration, reverse = True)[:count]
+
+    # (種類, 名前) 毎に集計する 関数
+    def summary(self):
+        u""" < 保持している 計測イベント を、(種類, 名前) 毎に集計する 関数 です >
+
+        :return: {(kind, name): {'count': 回数, 'total': 合計秒, 'max': 最大秒}} 合計の多い順
+        :rtype: OrderedDict[Tuple[str, str], Dict[str, float]]
+        """
+        totals = {}
+        for event in self._events:
+            entry = totals.setdefault((event.kind, event.name), {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += event.duration
+            entry['max'] = max(entry['max'], event.duration)
+        return OrderedDict(sorted(totals.items(), key = lambda item: item[1]['total'], reverse = True))
+
+
+class CallbackSink(object):
+    u""" < 計測イベント 毎に、任意の関数を呼び出す 送り先 です >
+
+    .. note::
+        関数を そのまま set_profile_sink() へ渡すこともできます
+        閾値で絞り込みたい場合に使用します
+    """
+
+    def __init__(self, callback, threshold = 0.0):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param Callable[[ProfileEvent], None] callback: 計測イベント を受け取る関数
+        :param float threshold: この秒数 未満 の 計測イベント は送りません
+        """
+        self.callback = callback
+        self.threshold = threshold
+
+    def __call__(self, event):
+        if event.duration >= self.threshold:
+            self.callback(event)
+
+
+class JsonLinesSink(object):
+    u""" < 計測イベント を、JSON Lines 形式で ファイル へ追記する 送り先 です >
+
+    .. note::
+        1行 = 1つ の 計測イベント です
+        {"time": UNIX時間, "kind": ..., "name": ..., "duration": 秒, "widgets": ...}
+    """
+
+    def __init__(self, filename, threshold = 0.0):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param str filename: 追記する ファイル の絶対パス
+        :param float threshold: この秒数 未満 の 計測イベント は書き込みません
+        """
+        self.filename = filename
+        self.threshold = threshold
+        self._lock = Lock()
+        self._file = open(filename, 'a')
+
+    def __call__(self, event):
+        if event.duration < self.threshold:
+            return
+        record = OrderedDict([('time', time())])
+        record.update(event._asdict())
+        line = json.dumps(record, ensure_ascii = False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()  # Maya が落ちても、それまでの 計測イベント が残るように
+
+    # ファイル を閉じる 関数
+    def close(self):
+        u""" < ファイル を閉じる 関数 です > """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+# 一時的に 送り先 を設定する コンテキストマネージャー
+@contextmanager
+def profiling(sink):
+    u""" < with ブロック内だけ、計測イベント の送り先を設定する コンテキストマネージャー です >
+
+    抜けた時には、以前の送り先へ戻します(close() を持つ送り先は閉じます)
+
+    :param Callable[[ProfileEvent], None] sink: 送り先
+    """
+    previous = set_profile_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_profile_sink(previous)
+        close = getattr(sink, 'close', None)
+        if close is not None:
+            close()
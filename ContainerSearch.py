@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerSearch.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.1-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    ContainerGroup の全ての Container を、タイトル と content 内のラベル で絞り込む 検索
+        - 通称: コンテナサーチ(ContainerSearch)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    セクションの多いツールでは、目的のコントロールを探す為に Container を 1つずつ 開閉していました。
+    ContainerSearch は、
+        - Header のタイトル と content 内の ラベル・ボタン の文字列を、
+            casefold() 済みの 索引(インデックス) として事前に作成しておき、
+        - 入力の度に、索引だけを調べて(ウィジェットには触れずに)一致する Container を求め、
+        - 一致しない Container を隠し、content 内で一致した Container だけを開く処理を、
+            ContainerGroup.batch() で 1回 の更新にまとめます。
+    content 以下(入れ子のレイアウト・グループボックス の中も含みます)への 子供Widget の追加・削除
+        (ChildAdded / ChildRemoved)は イベントフィルター で検知し、Header のタイトルの変更は 検索の時に比べて、
+        変化した Container の索引だけを、次の検索の時に作り直します。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from ContainerSearch import ContainerSearch
+
+        # 以下 e.g.):
+        ############################################################
+        search = ContainerSearch(group, parent = window)
+        search_field.textChanged.connect(search.filter)  # QLineEdit
+
+        search.filter('radius')  # ['contA_QWid'] 一致したキー群
+        search.clear()  # 全て表示し、検索前の 折り畳みの状況 へ戻します
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        - 変換箇所1(-/+)
+            - 概要: 入れ子の子供Widget の追加・タイトルの変更 を検知し、開閉の度に 索引を作り直さない為
+            - 詳細:
+                ::
+
+                    -   _DIRTY_EVENTS = (QEvent.ChildAdded, QEvent.ChildRemoved, QEvent.LayoutRequest)
+                    +   _DIRTY_EVENTS = (QEvent.ChildAdded, QEvent.ChildRemoved)
+                    -   content.installEventFilter(self)  # content のみ
+                    +   self._watch(content)  # content 以下の全て、追加された子供Widget にも設置します
+                    +   self._titles = {}  # 索引を作成した時のタイトル(検索の時に比べます)
+
+        version = '-1.1-'
+
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import weakref
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject, QEvent, Signal
+from PySide2.QtWidgets import QLabel, QAbstractButton, QGroupBox
+
+# ローカルで作成したモジュール
+from WidgetHandlers import walk_widgets
+
+
+# 索引を作り直す必要がある、content 以下のウィジェットのイベントの種類
+# 変換箇所1: LayoutRequest は 開閉・リサイズ でも届き、索引が ほぼ再利用されない為、除外します
+_DIRTY_EVENTS = (QEvent.ChildAdded, QEvent.ChildRemoved)
+
+
+# 検索用に 文字列 を正規化する 関数
+def fold(text):
+    u""" < 検索用に 文字列 を正規化する 関数 です >
+
+    大文字・小文字を区別せず(casefold)、ボタンのニーモニック(&)を取り除きます
+
+    :param str text: 正規化する文字列
+    :rtype: str
+    """
+    return text.replace('&', '').casefold()
+
+
+# content 内の ラベル・ボタン の文字列 群を返す 関数
+def field_texts(root):
+    u""" < content 内の ラベル・ボタン・グループボックス の文字列 群を返す 関数 です >
+
+    :param QWidget root: content widget
+    :rtype: List[str]
+    """
+    texts = []
+    for widget in walk_widgets(root):
+        if isinstance(widget, QLabel):
+            text = widget.text()
+        elif isinstance(widget, QAbstractButton):
+            text = widget.text()
+        elif isinstance(widget, QGroupBox):
+            text = widget.title()
+        else:
+            continue
+        if text:
+            texts.append(text)
+    return texts
+
+
+class ContainerSearch(QObject):
+    u""" < ContainerGroup の全ての Container を、タイトル と content 内のラベル で絞り込む クラス です >
+
+    .. note::
+        複数の語(空白区切り)は、全てを含む Container に一致します
+        content_factory の content が未作成の Container は、タイトルだけで検索します
+        filtered(list) は、絞り込みの度に 一致したキー群 を発信します
+            (Container を隠すと window の高さが変わる為、ContainerAutoFit.refit() などに使用します)
+    """
+    # カスタムシグナルの定義
+    filtered = Signal(list)
+
+    def __init__(self, group, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param ContainerGroup group: 検索する Container を登録した グループ
+        :param QObject parent: 親オブジェクト
+        """
+        super(ContainerSearch, self).__init__(parent)
+        self._group = group
+        self._index = {}  # key: キー, value: (タイトル, content 内の文字列) casefold() 済み
+        self._titles = {}  # key: キー, value: 索引を作成した時のタイトル(変換箇所1)
+        self._keys = weakref.WeakKeyDictionary()  # key: content widget, value: キー
+        self._dirty = set()
+        self._text = ''
+        self._saved_states = None  # 検索前の 折り畳みの状況
+
+    # 現在の検索文字列を返す 関数
+    def text(self):
+        u""" < 現在の検索文字列を返す 関数 です >
+
+        :rtype: str
+        """
+        return self._text
+
+    # 索引を作り直す予約をする 関数
+    def invalidate(self, key = None):
+        u""" < 索引を作り直す予約をする 関数 です >
+
+        content 内の ラベル・ボタン の文字列の変更など、イベントでは検知できない変化の後に呼んでください
+        (子供Widget の追加・削除 と Header のタイトルの変更 は、自動で検知します)
+
+        :param str key: キー(None の場合は全て)
+        """
+        if key is None:
+            self._dirty.update(self._index)
+        else:
+            self._dirty.add(key)
+
+    # 一致する Container を求める 関数
+    def find(self, text):
+        u""" < 一致する Container を、索引だけを調べて求める 関数 です >
+
+        :param str text: 検索文字列
+        :return: {キー: content 内で一致したかどうか}(タイトルだけの一致は False)
+        :rtype: Dict[str, bool]
+        """
+        self._update_index()
+        terms = fold(text).split()
+        if not terms:
+            return dict.fromkeys(self._index, False)
+        found = {}
+        for key, (title, fields) in self._index.items():
+            if all(term in title or term in fields for term in terms):
+                found[key] = any(term in fields for term in terms)
+        return found
+
+    # 絞り込む 関数
+    def filter(self, text):
+        u""" < 一致しない Container を隠し、content 内で一致した Container を開く 関数 です >
+
+        空の文字列の場合は clear() と同じです
+
+        :param str text: 検索文字列
+        :return: 一致したキー群(登録順)
+        :rtype: List[str]
+        """
+        if not text.strip():
+            self.clear()
+            return self._group.keys()
+        if self._saved_states is None:
+            self._saved_states = self._group.states()
+        self._text = text
+        found = self.find(text)
+        # 変化する Container だけを集め、変化が無い場合は batch() も行いません
+        changes = []
+        for key, container in zip(self._group.keys(), self._group.containers()):
+            visible = key in found
+            expand = visible and found[key] and not container.is_expanded()
+            if container.isHidden() == visible or expand:
+                changes.append((container, visible, expand))
+        if changes:
+            with self._group.batch():
+                for container, visible, expand in changes:
+                    container.setVisible(visible)
+                    if expand:
+                        container.expand()
+        keys = [key for key in self._group.keys() if key in found]
+        self.filtered.emit(keys)
+        return keys
+
+    # 絞り込みを解除する 関数
+    def clear(self):
+        u""" < 絞り込みを解除し、全て表示して 検索前の 折り畳みの状況 へ戻す 関数 です > """
+        self._text = ''
+        saved, self._saved_states = self._saved_states, None
+        with self._group.batch():
+            for container in self._group.containers():
+                if container.isHidden():
+                    container.setVisible(True)
+            if saved is not None:
+                self._group.set_states(saved)
+        self.filtered.emit(self._group.keys())
+
+    # 索引を更新する 関数
+    def _update_index(self):
+        keys = self._group.keys()
+        if len(keys) != len(self._index) or any(key not in self._index for key in keys):
+            self._sync_keys(keys)
+        # 変換箇所1: タイトルの変更は イベントで届かない為、索引を作成した時のタイトルと比べます
+        for key, container in zip(keys, self._group.containers()):
+            if container.title() != self._titles.get(key):
+                self._dirty.add(key)
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty:
+            if key in self._index:
+                container = self._group.container(key)
+                self._titles[key] = container.title()
+                self._index[key] = self._build_entry(container)
+
+    # ContainerGroup の登録・解除に合わせる 関数
+    def _sync_keys(self, keys):
+        current = set(keys)
+        for key in list(self._index):
+            if key not in current:
+                del self._index[key]
+                self._titles.pop(key, None)
+        for content, key in list(self._keys.items()):
+            if key not in current:
+                del self._keys[content]
+                try:
+                    self._unwatch(content)
+                except RuntimeError:  # C++ オブジェクトは破棄済み
+                    pass
+        for key in keys:
+            if key not in self._index:
+                content = self._group.container(key).contentWidget
+                self._keys[content] = key
+                self._watch(content)
+                self._index[key] = None
+                self._dirty.add(key)
+
+    # 1つ の Container の索引を作成する 関数
+    @staticmethod
+    def _build_entry(container):
+        fields = field_texts(container.contentWidget) if container.is_materialized() else []
+        return fold(container.title()), fold('\n'.join(fields))
+
+    # 変換箇所1
+    # widget 以下の全てに イベントフィルター を設置する 関数
+    def _watch(self, widget):
+        for child in walk_widgets(widget):
+            child.installEventFilter(self)
+
+    # 変換箇所1
+    # widget 以下の全てから イベントフィルター を外す 関数
+    def _unwatch(self, widget):
+        for child in walk_widgets(widget):
+            child.removeEventFilter(self)
+
+    # 変換箇所1
+    # content 以下のウィジェットから、キー 群を返す 関数
+    def _keys_for(self, widget):
+        # 入れ子の Container の場合は、外側の Container の索引も 内側の文字列を含む為、全ての キー を返します
+        keys = []
+        while widget is not None:
+            key = self._keys.get(widget)
+            if key is not None:
+                keys.append(key)
+            widget = widget.parentWidget()
+        return keys
+
+    def eventFilter(self, watched, event):
+        # 変換箇所1: content 以下の全てに設置する為、破棄中のウィジェットのイベントも届きます(何もせず通します)
+        if event.type() in _DIRTY_EVENTS:
+            try:
+                keys = self._keys_for(watched)
+            except RuntimeError:  # C++ オブジェクトは破棄済み
+                return False
+            if keys:
+                self._dirty.update(keys)
+                child = event.child()
+                # 変換箇所1: 追加された子供Widget(とその子孫)の 追加・削除 も検知します
+                if event.type() == QEvent.ChildAdded and child.isWidgetType():
+                    self._watch(child)
+        return False
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+u"""
+ContainerTree.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    入れ子にした Container の 親子関係 を知っている ContainerGroup
+        - 通称: コンテナツリー(ContainerTree)
+        - 型: ContainerGroup の派生クラス(サブクラス)
+詳細(details):
+    他の Container の contentWidget の中に入れた Container は、toggle の度に
+        親の Container を辿って window まで レイアウトの無効化が連鎖し、
+        パスを開くと 1段ずつ 波打つように表示されていました。
+    ContainerTree は、登録した Container の親子関係を(親ウィジェットを辿って)求め、
+        - expand_to_depth(n): 深さ n 未満を開き、それより深いものを閉じる
+        - expand_path(...): 指定した Container と、その祖先を全て開く
+        - collapse_subtree(...): 指定した Container と、その子孫を全て閉じる
+    を、ContainerGroup.batch() で 1回 のレイアウトにまとめて行います。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from ContainerTree import ContainerTree
+
+        # 以下 e.g.):
+        ############################################################
+        tree = ContainerTree(window)
+        tree.add(scene_container, 'scene')
+        tree.add(mesh_container, 'mesh')  # scene_container.contentWidget の中の Container
+        tree.add(uv_container, 'uv')  # mesh_container.contentWidget の中の Container
+
+        tree.parent_key('uv')  # 'mesh'
+        tree.expand_path('uv')  # 'scene', 'mesh', 'uv' を 1回 のレイアウトで開きます
+        tree.expand_to_depth(1)  # 'scene' だけを開きます
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+from collections import OrderedDict
+
+# ローカルで作成したモジュール
+from ContainerGroup import ContainerGroup
+
+
+class ContainerTree(ContainerGroup):
+    u""" < 入れ子にした Container の 親子関係 を知っている ContainerGroup です >
+
+    .. note::
+        親子関係は、親ウィジェットを辿って 最初に見つかった 登録済みの Container を親とします
+        Container の登録・解除の後に求め直します
+        登録後に Container を別の親へ移した場合は、invalidate() を呼んでください
+    """
+
+    def __init__(self, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param QObject parent: 親オブジェクト
+        """
+        super(ContainerTree, self).__init__(parent)
+        self._parents = None  # key: キー, value: 親のキー(最上位は None)
+        self._children = None  # key: キー(最上位は None), value: 子のキー群(登録順)
+
+    def add(self, container, key = None):
+        u""" < Container を登録する 関数 です(ContainerGroup.add() と同じです) > """
+        key = super(ContainerTree, self).add(container, key)
+        self.invalidate()
+        return key
+
+    def remove(self, key):
+        u""" < Container の登録を解除する 関数 です(ContainerGroup.remove() と同じです) > """
+        super(ContainerTree, self).remove(key)
+        self.invalidate()
+
+    # 親子関係を求め直す予約をする 関数
+    def invalidate(self):
+        u""" < 親子関係を、次に使用する時に求め直す予約をする 関数 です > """
+        self._parents = None
+        self._children = None
+
+    # 親のキーを返す 関数
+    def parent_key(self, key):
+        u""" < 親の Container のキーを返す 関数 です >
+
+        :param str key: 登録時のキー
+        :return: 最上位の場合は None
+        :rtype: str | None
+        """
+        return self._relations()[0][key]
+
+    # 子のキー群を返す 関数
+    def child_keys(self, key = None):
+        u""" < 子の Container のキー群を、登録順に返す 関数 です >
+
+        :param str key: 登録時のキー(None の場合は 最上位の Container 群)
+        :rtype: List[str]
+        """
+        return list(self._relations()[1].get(key, ()))
+
+    # 最上位のキー群を返す 関数
+    def root_keys(self):
+        u""" < 最上位の Container のキー群を、登録順に返す 関数 です >
+
+        :rtype: List[str]
+        """
+        return self.child_keys(None)
+
+    # 祖先のキー群を返す 関数
+    def ancestor_keys(self, key):
+        u""" < 祖先の Container のキー群を、最上位から順に返す 関数 です >
+
+        :param str key: 登録時のキー
+        :rtype: List[str]
+        """
+        parents = self._relations()[0]
+        ancestors = []
+        parent = parents[key]
+        while parent is not None:
+            ancestors.append(parent)
+            parent = parents[parent]
+        ancestors.reverse()
+        return ancestors
+
+    # 子孫のキー群を返す 関数
+    def descendant_keys(self, key):
+        u""" < 子孫の Container のキー群を、親から子の順(深さ優先)に返す 関数 です >
+
+        :param str key: 登録時のキー
+        :rtype: List[str]
+        """
+        children = self._relations()[1]
+        descendants = []
+        stack = list(reversed(children.get(key, ())))
+        while stack:
+            child = stack.pop()
+            descendants.append(child)
+            stack.extend(reversed(children.get(child, ())))
+        return descendants
+
+    # 深さを返す 関数
+    def depth(self, key):
+        u""" < 深さを返す 関数 です >
+
+        :param str key: 登録時のキー
+        :return: 最上位は 0
+        :rtype: int
+        """
+        return len(self.ancestor_keys(key))
+
+    def set_states(self, mapping):
+        u""" < 複数の Container の折り畳みの状況を、まとめて設定する 関数 です >
+
+        ContainerGroup.set_states() と同じですが、
+            - 閉じる Container は 浅い順 に(親を先に閉じ、隠れた子孫は レイアウト無しで閉じます)
+            - 開く Container は 深い順 に(子孫を隠れたまま開き、最後に親を開いて 1回 で表示します)
+        処理し、入れ子の Container の レイアウト が 1段ずつ 波打たないようにします
+
+        :param Dict[str, bool] mapping: {キー: True(-expand-) / False(-collapse-)}
+            未登録のキーは無視します
+        """
+        parents = self._relations()[0]
+        depths = {key: self.depth(key) for key in mapping if key in parents}
+        collapses = sorted((key for key in depths if not mapping[key]), key = depths.get)
+        expands = sorted((key for key in depths if mapping[key]), key = depths.get, reverse = True)
+        ordered = [(key, False) for key in collapses] + [(key, True) for key in expands]
+        super(ContainerTree, self).set_states(OrderedDict(ordered))
+
+    # 深さ n 未満を開く 関数
+    def expand_to_depth(self, depth):
+        u""" < 深さ depth 未満の Container を開き、それより深い Container を閉じる 関数 です >
+
+        1回 のレイアウトで行います
+
+        :param int depth: 開く深さ(0 の場合は全て閉じます)
+        """
+        children = self._relations()[1]
+        states = {}
+        level = 0
+        keys = list(children.get(None, ()))
+        while keys:
+            next_keys = []
+            for key in keys:
+                states[key] = level < depth
+                next_keys.extend(children.get(key, ()))
+            keys = next_keys
+            level += 1
+        self.set_states(states)
+
+    # パスを開く 関数
+    def expand_path(self, path):
+        u""" < パス上の Container を全て開く 関数 です >
+
+        1回 のレイアウトで行います
+
+        :param str | Iterable[str] path: キー(その祖先も全て開きます)、もしくは キー群
+        """
+        if isinstance(path, str):
+            keys = self.ancestor_keys(path) + [path]
+        else:
+            keys = []
+            for key in path:
+                keys.extend(self.ancestor_keys(key) + [key])
+        self.set_states(dict.fromkeys(keys, True))
+
+    # 子孫ごと閉じる 関数
+    def collapse_subtree(self, key):
+        u""" < Container と、その子孫を全て閉じる 関数 です >
+
+        1回 のレイアウトで行います
+
+        :param str key: 登録時のキー
+        """
+        self.set_states(dict.fromkeys([key] + self.descendant_keys(key), False))
+
+    # 親子関係を返す 関数
+    def _relations(self):
+        if self._parents is None:
+            parents = {}
+            children = {}
+            for key, container in zip(self.keys(), self.containers()):
+                parent_key = None
+                widget = container.parentWidget()
+                while widget is not None:
+                    parent_key = self._keys.get(widget)
+                    if parent_key is not None:
+                        break
+                    widget = widget.parentWidget()
+                parents[key] = parent_key
+                children.setdefault(parent_key, []).append(key)
+            self._parents, self._children = parents, children
+        return self._parents, self._children
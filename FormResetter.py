@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+u"""
+FormResetter.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.1-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    入力フィールドを持つ 子供Widget を、一括で 初期状態へ戻す リセットエンジン
+        - 通称: フォームリセッター(FormResetter)
+詳細(details):
+    findChildren(QWidget) は既に再帰的な為、その結果を更に再帰すると、
+        深さ d のウィジェットは 約 2^(d-1) 回 処理されてしまいます。
+    FormResetter は 子供を1段ずつ辿り、全ての子孫を ちょうど 1回 だけ訪れます。
+        - 型毎の処理は ハンドラー として登録し、差し替え・追加ができます
+        - Container の Header など、触れたくない部分は スキップルール で明示的に除外します
+        (登録と走査は FormState と共通の HandlerRegistry です)
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from FormResetter import FormResetter
+
+        # 以下 e.g.):
+        ############################################################
+        resetter = FormResetter()
+        resetter.register(MyColorField, lambda widget: widget.set_color(None))
+        touched = resetter.reset(central_wid)  # リセットしたウィジェット数
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        - 変換箇所1(-/+)
+            - 概要: QScrollBar(QAbstractSlider の派生クラス)を 入力フィールド として扱わない為
+                (スクロールエリア・ContainerList・QTextEdit の スクロール位置 まで 最小値へ戻していました)
+            - 詳細:
+                ::
+
+                    -   (QAbstractSlider, _reset_range)
+                    +   (QSlider, _reset_range) / (QDial, _reset_range)
+
+        version = '-1.1-'
+
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# サードパーティライブラリ
+from PySide2.QtWidgets import (QLineEdit, QTextEdit, QPlainTextEdit, QAbstractButton,
+                               QComboBox, QSpinBox, QDoubleSpinBox, QSlider, QDial
+                               )
+
+# ローカルで作成したモジュール
+from WidgetHandlers import HandlerRegistry, is_container_internal
+
+
+# 以下、型毎のリセット用 ハンドラー 関数 群
+def _reset_text(widget):
+    widget.clear()
+
+
+def _reset_button(widget):
+    if not widget.isCheckable():
+        return False  # 通常のボタンには、リセットする値がありません
+    widget.setChecked(False)
+
+
+def _reset_combo_box(widget):
+    widget.setCurrentIndex(-1)
+    if widget.isEditable():
+        widget.clearEditText()
+
+
+def _reset_range(widget):
+    widget.setValue(widget.minimum())
+
+
+class FormResetter(HandlerRegistry):
+    u""" < 入力フィールドを持つ 子供Widget を、一括で 初期状態へ戻す リセットエンジン です >
+
+    .. note::
+        ハンドラー・スキップルール の登録と走査は HandlerRegistry と同じです
+        ハンドラーが False を返した場合は、リセットしなかったものとして数えません
+    """
+    # 既定の ハンドラー 群
+    default_handlers = ((QLineEdit, _reset_text),
+                        (QTextEdit, _reset_text),
+                        (QPlainTextEdit, _reset_text),
+                        (QAbstractButton, _reset_button),
+                        (QComboBox, _reset_combo_box),
+                        (QSpinBox, _reset_range),
+                        (QDoubleSpinBox, _reset_range),
+                        (QSlider, _reset_range),
+                        (QDial, _reset_range),
+                        )
+
+    def __init__(self, use_default_handlers = True):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param bool use_default_handlers: 既定の ハンドラー と スキップルール を登録するかどうか
+        """
+        super(FormResetter, self).__init__()
+        if use_default_handlers:
+            for widget_type, handler in self.default_handlers:
+                self.register(widget_type, handler)
+            self.add_skip_rule(is_container_internal)
+
+    # root 以下の入力フィールドを、一括で リセット する 関数
+    def reset(self, root):
+        u""" < root 以下の入力フィールドを、一括で リセット する 関数 です >
+
+        :param QWidget root: 起点となるウィジェット(ここでは セントラルウィジェット などに相当します)
+        :return: リセットしたウィジェット数
+        :rtype: int
+        """
+        touched = 0
+        for widget in self.walk(root):
+            handler = self.handler_for(type(widget))
+            if handler is not None and handler(widget) is not False:
+                touched += 1
+        return touched
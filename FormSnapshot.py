@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+u"""
+FormSnapshot.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    全ての Container の content 内の入力フィールドの値を、1つ の スナップショット として 取得・復元する
+        - 通称: フォームスナップショット(FormSnapshot)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    入力フィールドの一括操作は クリアー(clearAllValue_toAllWidget)だけで、保存されるのは 折り畳みの状況だけでした。
+    プリセットを切り替える度に 300 の入力フィールドへ 1つずつ 値を設定すると、
+        300 回分の 変更シグナル が Maya のコールバックへ流れます。
+    FormSnapshot は、
+        - ContainerGroup のキー と content からの フィールドパス(FormState)をキーにして、
+            全ての入力フィールドの値を、バージョン付きの 辞書 として取得し、
+        - 復元時は ContainerGroup.batch() で window の更新を止め、シグナルを止めて 1回 で値を戻します。
+    content_factory の content が未作成の Container の値は保持しておき、初めて開いた時に戻します。
+    スナップショット は JSON に変換できます(to_json / from_json)。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from FormSnapshot import FormSnapshot, to_json, from_json
+
+        # 以下 e.g.):
+        ############################################################
+        snapshot = FormSnapshot(group, parent = window)
+        preset = snapshot.capture(host = central_widget)
+        # {'version': 1, 'host': {...}, 'containers': {'contA_QWid': {'QLineEdit[0]': 'abc', ...}}}
+        text = to_json(preset)
+
+        snapshot.restore(from_json(text), host = central_widget)
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import json
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject
+
+# ローカルで作成したモジュール
+from FormState import FormState
+
+
+# スナップショット の形式のバージョン
+SNAPSHOT_VERSION = 1
+
+
+# スナップショット を JSON の文字列にする 関数
+def to_json(snapshot):
+    u""" < スナップショット を、短い JSON の文字列にする 関数 です >
+
+    :param Dict[str, Any] snapshot: FormSnapshot.capture() の戻り値
+    :rtype: str
+    """
+    return json.dumps(snapshot, ensure_ascii = False, sort_keys = True, separators = (',', ':'))
+
+
+# JSON の文字列から スナップショット を返す 関数
+def from_json(text):
+    u""" < JSON の文字列から スナップショット を返す 関数 です >
+
+    :param str text: to_json() の戻り値
+    :rtype: Dict[str, Any]
+    """
+    return json.loads(text)
+
+
+class FormSnapshot(QObject):
+    u""" < 全ての Container の content 内の入力フィールドの値を、1つ の スナップショット として 取得・復元する クラス です >
+
+    .. note::
+        スナップショット は {'version': SNAPSHOT_VERSION, 'host': {フィールドパス: 値},
+            'containers': {キー: {フィールドパス: 値}}} の辞書です(空の項目は含みません)
+        Container の中の 登録済みの Container(入れ子)は、その Container のキーで別に保持します
+        JSON を経由すると タプル(QComboBox の値)は リスト になりますが、そのまま復元できます
+    """
+
+    def __init__(self, group, form_state = None, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param ContainerGroup group: 値を 取得・復元 する Container を登録した グループ
+        :param FormState form_state: 入力フィールドの値の 取得・復元 に使用します(省略時は既定の FormState)
+        :param QObject parent: 親オブジェクト
+        """
+        super(FormSnapshot, self).__init__(parent)
+        self._group = group
+        self.form_state = form_state if form_state is not None else FormState()
+        self._pending = {}  # key: content が未作成の Container のキー, value: 初めて開いた時に戻す値
+
+    # スナップショット を取得する 関数
+    def capture(self, host = None):
+        u""" < 全ての Container の入力フィールドの値を、スナップショット として取得する 関数 です >
+
+        :param QWidget host: Container の外の入力フィールドも取得する場合の 起点となるウィジェット
+            (セントラルウィジェット など)
+        :return: スナップショット
+        :rtype: Dict[str, Any]
+        """
+        skip = self._container_rule()
+        containers = {}
+        for key, container in zip(self._group.keys(), self._group.containers()):
+            if container.is_materialized():
+                values = self.form_state.capture(container.contentWidget, skip)
+            else:
+                values = self._pending.get(key)  # 未作成の content は、戻す予定の値のままです
+            if values:
+                containers[key] = values
+        snapshot = {'version': SNAPSHOT_VERSION}
+        if host is not None:
+            values = self.form_state.capture(host, skip)
+            if values:
+                snapshot['host'] = values
+        if containers:
+            snapshot['containers'] = containers
+        return snapshot
+
+    # スナップショット を復元する 関数
+    def restore(self, snapshot, host = None):
+        u""" < スナップショット の値を、1回 の更新で 全ての入力フィールドへ戻す 関数 です >
+
+        ContainerGroup.batch() で window の更新を止め、入力フィールドのシグナルを止めて値を戻します
+        content が未作成の Container の値は、初めて開いた時に戻します
+
+        :param Dict[str, Any] snapshot: capture() の戻り値
+        :param QWidget host: capture() の時と同じ 起点となるウィジェット
+        :raises ValueError: スナップショット の形式のバージョンが異なる場合
+        :return: 値を戻したウィジェット数(未作成の content の分は含みません)
+        :rtype: int
+        """
+        version = snapshot.get('version')
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(u'unsupported snapshot version: {} (expected {})'.format(version, SNAPSHOT_VERSION))
+        skip = self._container_rule()
+        values_by_key = snapshot.get('containers', {})
+        restored = 0
+        with self._group.batch():
+            if host is not None:
+                restored += self.form_state.restore(host, snapshot.get('host'), skip)
+            for key, container in zip(self._group.keys(), self._group.containers()):
+                values = values_by_key.get(key)
+                if container.is_materialized():
+                    restored += self.form_state.restore(container.contentWidget, values, skip)
+                else:
+                    self._set_pending(key, container, values)
+        return restored
+
+    # Container(入れ子)を除外する スキップ判定 を返す 関数
+    def _container_rule(self):
+        containers = set(self._group.containers())
+        return lambda widget: widget in containers
+
+    # 初めて開いた時に戻す値を設定する 関数
+    def _set_pending(self, key, container, values):
+        if values:
+            if key not in self._pending:
+                container.header.aboutToExpand.connect(self._on_about_to_expand)
+            self._pending[key] = values
+        elif self._pending.pop(key, None) is not None:
+            container.header.aboutToExpand.disconnect(self._on_about_to_expand)
+
+    # Container が開く直前の 関数
+    def _on_about_to_expand(self):
+        # Container 自身の materialize() が先に接続されている為、content は作成された後です
+        header = self.sender()
+        header.aboutToExpand.disconnect(self._on_about_to_expand)
+        container = header.parent()
+        try:
+            key = self._group.key(container)
+        except KeyError:
+            return  # 登録が解除されています
+        values = self._pending.pop(key, None)
+        if values:
+            self.form_state.restore(container.contentWidget, values, self._container_rule())
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+u"""
+FormState.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.1-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    入力フィールドの値を、フィールドパス 毎に 取得・復元する
+        - 通称: フォームステート(FormState)
+詳細(details):
+    Container の content を破棄して 作り直す(content_factory)と、入力フィールドの値は初期値に戻ります。
+    FormState は、root からの フィールドパス をキーにして 値を取得し、
+        同じ構造で作り直した content へ、シグナルを止めて 値を戻します。
+    フィールドパス は、root からの 子供Widget の並びです。
+        - objectName がある場合は、その objectName
+        - 無い場合は、同じ親の中での 型名[同じ型の中での番号]  e.g.): 'QLineEdit[0]/QSpinBox[1]'
+    型毎の処理は FormResetter と同じく ハンドラー(取得, 設定)として登録し、差し替え・追加ができます(HandlerRegistry)。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from FormState import FormState
+
+        # 以下 e.g.):
+        ############################################################
+        form_state = FormState()
+        values = form_state.capture(container.contentWidget)  # {'QLineEdit[0]': 'abc', ...}
+        container.discard_content()
+        container.materialize()
+        form_state.restore(container.contentWidget, values)
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        - 変換箇所1(-/+)
+            - 概要: QScrollBar(QAbstractSlider の派生クラス)を 入力フィールド として扱わない為
+                (スクロールエリア・ContainerList・QTextEdit の スクロール位置 まで 入力値 として取得・復元していました)
+            - 詳細:
+                ::
+
+                    -   (QAbstractSlider, QAbstractSlider.value, QAbstractSlider.setValue)
+                    +   (QSlider, QSlider.value, QSlider.setValue) / (QDial, QDial.value, QDial.setValue)
+
+        version = '-1.1-'
+
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# サードパーティライブラリ
+from PySide2.QtWidgets import (QLineEdit, QTextEdit, QPlainTextEdit, QAbstractButton,
+                               QComboBox, QSpinBox, QDoubleSpinBox, QSlider, QDial
+                               )
+
+# ローカルで作成したモジュール
+from WidgetHandlers import HandlerRegistry, is_container_internal
+
+
+# 以下、型毎の 取得・設定 用 ハンドラー 関数 群
+def _get_button(widget):
+    if not widget.isCheckable():
+        return None  # 通常のボタンには、保存する値がありません
+    return widget.isChecked()
+
+
+def _get_combo_box(widget):
+    return widget.currentIndex(), widget.currentText()
+
+
+def _set_combo_box(widget, value):
+    index, text = value
+    widget.setCurrentIndex(index)
+    if widget.isEditable():
+        widget.setEditText(text)
+
+
+class FormState(HandlerRegistry):
+    u""" < 入力フィールドの値を、フィールドパス 毎に 取得・復元する クラス です >
+
+    .. note::
+        ハンドラー・スキップルール の登録と走査は HandlerRegistry と同じです
+        取得のハンドラーが None を返した場合は、値が無いものとして扱います
+    """
+    # 既定の ハンドラー 群: (ウィジェットの型, 取得, 設定)
+    default_handlers = ((QLineEdit, QLineEdit.text, QLineEdit.setText),
+                        (QTextEdit, QTextEdit.toPlainText, QTextEdit.setPlainText),
+                        (QPlainTextEdit, QPlainTextEdit.toPlainText, QPlainTextEdit.setPlainText),
+                        (QAbstractButton, _get_button, QAbstractButton.setChecked),
+                        (QComboBox, _get_combo_box, _set_combo_box),
+                        (QSpinBox, QSpinBox.value, QSpinBox.setValue),
+                        (QDoubleSpinBox, QDoubleSpinBox.value, QDoubleSpinBox.setValue),
+                        (QSlider, QSlider.value, QSlider.setValue),
+                        (QDial, QDial.value, QDial.setValue),
+                        )
+
+    def __init__(self, use_default_handlers = True):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param bool use_default_handlers: 既定の ハンドラー と スキップルール を登録するかどうか
+        """
+        super(FormState, self).__init__()
+        if use_default_handlers:
+            for widget_type, getter, setter in self.default_handlers:
+                self.register(widget_type, getter, setter)
+            self.add_skip_rule(is_container_internal)
+
+    # 型毎の ハンドラー を登録する 関数
+    def register(self, widget_type, getter, setter):
+        u""" < 型毎の ハンドラー を登録する 関数 です >
+
+        :param type widget_type: 対象のウィジェットの型(派生クラスにも適用されます)
+        :param Callable[[QWidget], Any] getter: 値を返す関数
+        :param Callable[[QWidget, Any], None] setter: 値を設定する関数
+        """
+        super(FormState, self).register(widget_type, (getter, setter))
+
+    # root 以下の入力フィールドと フィールドパス を返す ジェネレーター 関数
+    def fields(self, root, skip = None):
+        u""" < root 以下の ハンドラー のある入力フィールドと、その フィールドパス を返す ジェネレーター 関数 です >
+
+        :param QWidget root: 起点となるウィジェット(root 自身は含みません)
+        :param Callable[[QWidget], bool] skip: この呼び出しだけの 追加の スキップ判定(root には適用しません)
+        :rtype: Iterator[Tuple[str, QWidget]]
+        """
+        paths = {root: ''}
+        counters = {}  # key: (親の フィールドパス, 型), value: 次の番号
+        for widget in self.walk(root, skip):
+            if widget is root:
+                continue
+            parent_path = paths[widget.parentWidget()]
+            name = widget.objectName()
+            if not name:
+                # 子供は 並び順 に訪れる為、同じ型の中での番号を 数えながら 決められます
+                key = (parent_path, type(widget))
+                index = counters.get(key, 0)
+                counters[key] = index + 1
+                name = '{}[{}]'.format(type(widget).__name__, index)
+            path = paths[widget] = '{}/{}'.format(parent_path, name) if parent_path else name
+            if self.handler_for(type(widget)) is not None:
+                yield path, widget
+
+    # root 以下の入力フィールドの値を取得する 関数
+    def capture(self, root, skip = None):
+        u""" < root 以下の入力フィールドの値を、フィールドパス 毎に取得する 関数 です >
+
+        :param QWidget root: 起点となるウィジェット
+        :param Callable[[QWidget], bool] skip: 追加の スキップ判定(fields() と同じです)
+        :return: {フィールドパス: 値}
+        :rtype: Dict[str, Any]
+        """
+        values = {}
+        for path, widget in self.fields(root, skip):
+            value = self.handler_for(type(widget))[0](widget)
+            if value is not None:
+                values[path] = value
+        return values
+
+    # root 以下の入力フィールドへ値を戻す 関数
+    def restore(self, root, values, skip = None):
+        u""" < root 以下の入力フィールドへ、シグナルを止めて 値を戻す 関数 です >
+
+        :param QWidget root: 起点となるウィジェット(capture() の時と同じ構造)
+        :param Dict[str, Any] values: capture() の戻り値
+        :param Callable[[QWidget], bool] skip: 追加の スキップ判定(capture() の時と同じもの)
+        :return: 値を戻したウィジェット数
+        :rtype: int
+        """
+        if not values:
+            return 0
+        restored = 0
+        for path, widget in self.fields(root, skip):
+            if path not in values:
+                continue
+            setter = self.handler_for(type(widget))[1]
+            blocked = widget.blockSignals(True)
+            try:
+                setter(widget, values[path])
+            finally:
+                widget.blockSignals(blocked)
+            restored += 1
+        return restored
@@ -0,0 +1,533 @@
+# -*- coding: utf-8 -*-
+
+u"""
+PanelBuilder.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.1-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    セクション・入力フィールド・入れ子 を定義した 辞書(JSON)から、Container 群のパネルを まとめて作成する
+        - 通称: パネルビルダー(PanelBuilder)
+詳細(details):
+    以前は MainWindow.createUI で、Container 毎に QGridLayout を作成し、ボタンを 1つずつ 追加していました。
+        Header や content widget は 親無しで作成されてから 付け替えられる為、その度に ポリッシュ が発生し、
+        数百の入力フィールドを持つ アトリビュートエディター では、作成時間が一番のコストでした。
+    PanelBuilder は、
+        - 定義(spec)を 1回 だけ 解析・検証して テンプレート(PanelTemplate)にし、
+            オプションの値・シグナル名 も 作成の前に検証し(作成の途中では失敗しません)、
+        - window の更新を止めた状態で、全ての Container・入力フィールド を 作成時に親を設定して 作成します。
+    入力フィールドの型は FormState と同じく、型名 毎の 作成関数 として登録し、差し替え・追加ができます。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from PanelBuilder import PanelBuilder
+
+        # 以下 e.g.):
+        ############################################################
+        spec = {'sections': [
+            {'key': 'contA_QWid', 'title': 'GroupA', 'columns': 2,
+             'fields': [{'type': 'button', 'name': 'btnA', 'text': 'ButtonA'},
+                        {'type': 'button', 'name': 'btnB', 'text': 'ButtonB', 'connect': {'clicked': 'run'}},
+                        ],
+             'sections': [{'key': 'advanced', 'title': 'Advanced', 'lazy': True, 'layout': 'form',
+                           'fields': [{'type': 'spin_box', 'name': 'count', 'label': 'Count', 'maximum': 10}],
+                           }],
+             },
+            ]}
+        builder = PanelBuilder()
+        template = builder.compile(spec)  # 同じ定義から何度も作成する場合は、テンプレートを使い回します
+        panel = builder.build(template, layout, group = group, parent = central_widget,
+                              handlers = {'run': run}, states = {'contA_QWid': False}
+                              )
+        panel.container('contA_QWid')
+        panel.field('contA_QWid', 'btnA')
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        - 変換箇所1(-/+)
+            - 概要: 使用法の通り 辞書 を渡した場合も、テンプレートを キャッシュ から返す為
+            - 詳細:
+                ::
+
+                    -   return self._compile_spec(spec)  # 辞書は 呼ぶ度に 解析・検証
+                    +   key = json.dumps(spec, sort_keys = True)  # 辞書も 内容 をキーにして キャッシュ します
+
+        version = '-1.1-'
+
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import json
+from collections import namedtuple
+
+# サードパーティライブラリ
+from PySide2.QtCore import Signal
+from PySide2.QtWidgets import (QGridLayout, QFormLayout, QVBoxLayout, QLabel, QPushButton, QLineEdit,
+                               QCheckBox, QComboBox, QSpinBox, QDoubleSpinBox
+                               )
+
+# ローカルで作成したモジュール
+from Container import Container
+
+
+class SpecError(ValueError):
+    u""" < パネルの定義(spec)が正しくない場合の 例外 です(メッセージに 定義内の場所 を含みます) > """
+
+
+# 以下、型毎の 入力フィールド の作成用 関数 群
+def _create_button(field, parent):
+    return QPushButton(field.get('text', ''), parent)
+
+
+def _create_label(field, parent):
+    return QLabel(field.get('text', ''), parent)
+
+
+def _create_line_edit(field, parent):
+    widget = QLineEdit(parent)
+    widget.setText(field.get('value', ''))
+    return widget
+
+
+def _create_check_box(field, parent):
+    widget = QCheckBox(field.get('text', ''), parent)
+    widget.setChecked(field.get('value', False))
+    return widget
+
+
+def _create_combo_box(field, parent):
+    widget = QComboBox(parent)
+    widget.addItems(field.get('items', []))
+    widget.setCurrentIndex(field.get('value', 0))
+    return widget
+
+
+def _create_spin_box(field, parent):
+    widget = QSpinBox(parent)
+    widget.setRange(field.get('minimum', 0), field.get('maximum', 99))
+    widget.setValue(field.get('value', 0))
+    return widget
+
+
+def _create_double_spin_box(field, parent):
+    widget = QDoubleSpinBox(parent)
+    widget.setRange(field.get('minimum', 0.0), field.get('maximum', 99.99))
+    widget.setDecimals(field.get('decimals', 2))
+    widget.setValue(field.get('value', 0.0))
+    return widget
+
+
+# 以下、型毎の オプションの値 の検証用 関数 群(正しくない場合は メッセージ を返します)
+def _validate_combo_box(options):
+    items = options.get('items', [])
+    if not all(isinstance(item, str) for item in items):
+        return u'"items" must be a list of str'
+    value = options.get('value', 0)
+    if items and not 0 <= value < len(items):
+        return u'"value" {} is out of range for {} items'.format(value, len(items))
+    return None
+
+
+def _validate_range(options):
+    if 'minimum' in options and 'maximum' in options and options['minimum'] > options['maximum']:
+        return u'"minimum" must not be greater than "maximum"'
+    return None
+
+
+# 入力フィールドの型(登録内容)
+#   create: 作成関数, widget_type: 作成するウィジェットの型(シグナル名の検証用)
+#   options: {オプション名: 値の型}(None の場合は検証しません), validate: オプションの値の検証関数
+_FieldType = namedtuple('_FieldType', ['create', 'widget_type', 'options', 'validate'])
+
+# テンプレート(解析・検証 済みの定義)
+#   section: key, title, expanded, animated, lazy, color_background, layout, columns, fields, sections
+#   field: name, label, row, column, options(作成関数へ渡す 辞書), create(作成関数), connect((シグナル名, ハンドラー名) 群),
+#          where(定義内の場所)
+_SectionTemplate = namedtuple('_SectionTemplate', ['key', 'title', 'expanded', 'animated', 'lazy', 'color_background',
+                                                   'layout', 'columns', 'fields', 'sections'
+                                                   ])
+_FieldTemplate = namedtuple('_FieldTemplate', ['name', 'label', 'row', 'column', 'options', 'create', 'connect',
+                                               'where'
+                                               ])
+
+# 定義で使用できる キー と、その型
+_SECTION_KEYS = {'key': str, 'title': str, 'expanded': bool, 'animated': bool, 'lazy': bool,
+                 'color_background': bool, 'layout': str, 'columns': int, 'fields': list, 'sections': list,
+                 }
+_FIELD_KEYS = {'type': str, 'name': str, 'label': str, 'row': int, 'column': int, 'connect': dict}
+_LAYOUTS = ('grid', 'form', 'vbox')
+_NUMBER = (int, float)
+
+
+class PanelTemplate(object):
+    u""" < compile() で 解析・検証 済みの定義(テンプレート)です >
+
+    .. note::
+        build() へ渡すと、解析・検証 を行わずに作成します
+        同じ定義から 何度も作成する場合は、compile() の戻り値を保持して 使い回してください
+    """
+    __slots__ = ('sections', 'handler_names')
+
+    def __init__(self, sections, handler_names):
+        self.sections = sections  # 最上位の _SectionTemplate 群
+        self.handler_names = handler_names  # 'connect' で使用している ハンドラー名 群
+
+
+class Panel(object):
+    u""" < PanelBuilder.build() で作成した パネル です >
+
+    .. note::
+        lazy のセクションの入力フィールドは、初めて開いた時に field() で引けるようになります
+    """
+
+    def __init__(self):
+        self.containers = {}  # key: セクションのキー, value: Container (作成順、親が先)
+        self.fields = {}  # key: (セクションのキー, 入力フィールドの名前), value: 入力フィールド
+
+    # セクションの Container を返す 関数
+    def container(self, key):
+        u""" < セクションの Container を返す 関数 です >
+
+        :param str key: セクションのキー
+        :rtype: Container
+        """
+        return self.containers[key]
+
+    # 入力フィールドを返す 関数
+    def field(self, key, name):
+        u""" < 入力フィールドを返す 関数 です >
+
+        :param str key: セクションのキー
+        :param str name: 入力フィールドの名前
+        :rtype: QWidget
+        """
+        return self.fields[(key, name)]
+
+
+class PanelBuilder(object):
+    u""" < パネルの定義(spec)を テンプレート にし、Container 群を まとめて作成する クラス です >
+
+    .. note::
+        定義の検証(オプションの値・シグナル名 を含みます)は、テンプレートの作成時に 1回 だけ行います(SpecError)
+        入力フィールドの 名前(name)は、objectName にも設定します(FormState のフィールドパス が安定します)
+        ハンドラーは 作成の度に渡す為、テンプレートは 異なる window で共有できます
+    """
+    # 既定の 入力フィールド の型: (型名, 作成関数(定義の辞書, 親ウィジェット) -> QWidget, ウィジェットの型,
+    #                             {オプション名: 値の型}, オプションの値の検証関数)
+    default_field_types = (('button', _create_button, QPushButton, {'text': str}, None),
+                           ('label', _create_label, QLabel, {'text': str}, None),
+                           ('line_edit', _create_line_edit, QLineEdit, {'value': str}, None),
+                           ('check_box', _create_check_box, QCheckBox, {'text': str, 'value': bool}, None),
+                           ('combo_box', _create_combo_box, QComboBox, {'items': list, 'value': int},
+                            _validate_combo_box),
+                           ('spin_box', _create_spin_box, QSpinBox,
+                            {'minimum': int, 'maximum': int, 'value': int}, _validate_range),
+                           ('double_spin_box', _create_double_spin_box, QDoubleSpinBox,
+                            {'minimum': _NUMBER, 'maximum': _NUMBER, 'decimals': int, 'value': _NUMBER},
+                            _validate_range),
+                           )
+
+    def __init__(self, use_default_field_types = True):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param bool use_default_field_types: 既定の 入力フィールド の型 を登録するかどうか
+        """
+        self._field_types = {}  # key: 型名, value: _FieldType
+        self._templates = {}  # key: 定義の JSON の文字列(辞書は sort_keys で変換), value: PanelTemplate
+        if use_default_field_types:
+            for type_name, create, widget_type, options, validate in self.default_field_types:
+                self.register(type_name, create, widget_type, options, validate)
+
+    # 入力フィールドの型を登録する 関数
+    def register(self, type_name, create, widget_type = None, options = None, validate = None):
+        u""" < 入力フィールドの型を登録する 関数 です >
+
+        登録し直すと、テンプレートの キャッシュ は破棄されます
+
+        :param str type_name: 定義の 'type' に書く 型名
+        :param Callable[[Dict[str, Any], QWidget], QWidget] create: 定義の辞書 と 親ウィジェット から 作成する関数
+        :param type widget_type: 作成するウィジェットの型('connect' のシグナル名を compile() で検証します)
+        :param Dict[str, type | Tuple[type, ...]] options: 使用できる オプション名 と 値の型
+            (None の場合は、オプションを検証しません)
+        :param Callable[[Dict[str, Any]], str | None] validate: オプションの値を検証し、
+            正しくない場合は メッセージ を返す関数
+        """
+        self._field_types[type_name] = _FieldType(create, widget_type, options, validate)
+        self._templates.clear()
+
+    # 定義を テンプレート にする 関数
+    def compile(self, spec):
+        u""" < 定義を 解析・検証 して テンプレート にする 関数 です >
+
+        JSON の文字列 と 辞書 は、同じ内容の場合は キャッシュ から返します
+            (辞書は json.dumps(sort_keys = True) の文字列で比べます、JSON に変換できない辞書は 呼ぶ度に 解析・検証 します)
+
+        :param Dict[str, Any] | str | PanelTemplate spec: 定義の辞書、JSON の文字列、もしくは テンプレート
+        :raises SpecError: 定義が正しくない場合
+        :rtype: PanelTemplate
+        """
+        if isinstance(spec, PanelTemplate):
+            return spec
+        if isinstance(spec, str):
+            template = self._templates.get(spec)
+            if template is None:
+                try:
+                    parsed = json.loads(spec)
+                except ValueError as error:
+                    raise SpecError(u'spec: invalid JSON: {}'.format(error))
+                template = self._templates[spec] = self._compile_spec(parsed)
+            return template
+        try:
+            key = json.dumps(spec, sort_keys = True)
+        except (TypeError, ValueError):  # JSON に変換できない値(関数 など)を含む辞書
+            return self._compile_spec(spec)
+        template = self._templates.get(key)
+        if template is None:
+            # 文字列から作り直した 複製 で作成し、呼び出し側が 後から辞書を変更しても キャッシュ に影響しないようにします
+            template = self._templates[key] = self._compile_spec(json.loads(key))
+        return template
+
+    # パネルを作成する 関数
+    def build(self, spec, layout, group = None, parent = None, handlers = None, states = None):
+        u""" < 定義から Container 群を作成し、layout の末尾へ追加する 関数 です >
+
+        window の更新を止めた状態で、全てのウィジェットを 作成時に親を設定して 作成します
+        作成の途中で失敗した場合は、作成した Container を破棄し、group の登録を解除してから 例外を送出します
+
+        :param Dict[str, Any] | str | PanelTemplate spec: 定義の辞書、JSON の文字列、もしくは compile() の戻り値
+        :param QBoxLayout layout: 最上位の Container を追加するレイアウト
+        :param ContainerGroup group: Container を セクションのキー で登録する グループ(省略可)
+        :param QWidget parent: 最上位の Container の親(省略時は layout の親ウィジェット)
+        :param Dict[str, Callable] handlers: 定義の 'connect' に書く ハンドラー名 と 関数
+        :param Dict[str, bool] states: セクションのキー毎の 初期の折り畳みの状況(定義の 'expanded' より優先します)
+            StateSchema.load() の戻り値をそのまま渡せます
+        :raises SpecError: 定義が正しくない、もしくは ハンドラー が無い場合
+        :rtype: Panel
+        """
+        template = self.compile(spec)
+        handlers = handlers or {}
+        # 作成を始める前に、ハンドラーが揃っているかを調べます
+        missing = sorted(template.handler_names - set(handlers))
+        if missing:
+            raise SpecError(u'handlers: missing {}'.format(', '.join(missing)))
+        if parent is None:
+            parent = layout.parentWidget()
+        panel = Panel()
+        context = (panel, group, handlers, states or {})
+        window = parent.window() if parent is not None else None
+        updates = window is not None and window.updatesEnabled()
+        if updates:
+            window.setUpdatesEnabled(False)
+        try:
+            for section in template.sections:
+                layout.addWidget(self._build_section(section, parent, context))
+        except Exception:
+            self._discard(panel, group)
+            raise
+        finally:
+            if updates:
+                window.setUpdatesEnabled(True)
+        return panel
+
+    # 定義の辞書を テンプレート にする 関数
+    def _compile_spec(self, spec):
+        if not isinstance(spec, dict) or not isinstance(spec.get('sections'), list):
+            raise SpecError(u'spec: expected a dict with a "sections" list')
+        keys = set()
+        sections = tuple(self._compile_section(section, u'sections[{}]'.format(index), keys)
+                         for index, section in enumerate(spec['sections'])
+                         )
+        return PanelTemplate(sections, frozenset(self._handler_names(sections)))
+
+    # セクションの定義を テンプレート にする 関数
+    def _compile_section(self, section, where, keys):
+        self._check_keys(section, _SECTION_KEYS, where)
+        if 'title' not in section:
+            raise SpecError(u'{}: "title" is required'.format(where))
+        key = section.get('key', section['title'])
+        if key in keys:
+            raise SpecError(u'{}: duplicate section key "{}"'.format(where, key))
+        keys.add(key)
+        layout = section.get('layout', 'grid')
+        if layout not in _LAYOUTS:
+            raise SpecError(u'{}: unknown layout "{}" (expected one of {})'.format(where, layout, ', '.join(_LAYOUTS)))
+        columns = section.get('columns', 1)
+        if columns < 1:
+            raise SpecError(u'{}: "columns" must be 1 or more'.format(where))
+        names = set()
+        fields = []
+        for index, field in enumerate(section.get('fields', [])):
+            fields.append(self._compile_field(field, index, layout, columns,
+                                              u'{}.fields[{}]'.format(where, index), names
+                                              ))
+        sections = tuple(self._compile_section(child, u'{}.sections[{}]'.format(where, index), keys)
+                         for index, child in enumerate(section.get('sections', []))
+                         )
+        return _SectionTemplate(key, section['title'], section.get('expanded'), section.get('animated', False),
+                                section.get('lazy', False), section.get('color_background', False),
+                                layout, columns, tuple(fields), sections
+                                )
+
+    # 入力フィールドの定義を テンプレート にする 関数
+    def _compile_field(self, field, index, layout, columns, where, names):
+        if not isinstance(field, dict):
+            raise SpecError(u'{}: expected a dict'.format(where))
+        common = {option: value for option, value in field.items() if option in _FIELD_KEYS}
+        options = {option: value for option, value in field.items() if option not in _FIELD_KEYS}
+        self._check_keys(common, _FIELD_KEYS, where)
+        type_name = field.get('type')
+        field_type = self._field_types.get(type_name)
+        if field_type is None:
+            raise SpecError(u'{}: unknown field type "{}" (registered: {})'.format(
+                where, type_name, ', '.join(sorted(self._field_types))))
+        if field_type.options is not None:
+            self._check_keys(options, field_type.options, where)
+        if field_type.validate is not None:
+            message = field_type.validate(options)
+            if message:
+                raise SpecError(u'{}: {}'.format(where, message))
+        if 'label' in field and layout != 'form':
+            raise SpecError(u'{}: "label" is only used with layout "form" (got "{}")'.format(where, layout))
+        name = field.get('name', '')
+        if name:
+            if name in names:
+                raise SpecError(u'{}: duplicate field name "{}"'.format(where, name))
+            names.add(name)
+        connect = []
+        for signal_name, handler_name in sorted(field.get('connect', {}).items()):
+            if not isinstance(handler_name, str):
+                raise SpecError(u'{}: handler name for "{}" must be str'.format(where, signal_name))
+            if field_type.widget_type is not None and \
+                    not isinstance(getattr(field_type.widget_type, signal_name, None), Signal):
+                raise SpecError(u'{}: {} has no signal "{}"'.format(
+                    where, field_type.widget_type.__name__, signal_name))
+            connect.append((signal_name, handler_name))
+        # 位置の指定が無い場合は、columns 列で 行優先 に並べます
+        row = field.get('row', index // columns)
+        column = field.get('column', index % columns)
+        return _FieldTemplate(name, field.get('label', ''), row, column, options, field_type.create,
+                              tuple(connect), where
+                              )
+
+    # テンプレートで使用している ハンドラー名 群を返す 関数
+    @classmethod
+    def _handler_names(cls, sections):
+        names = set()
+        for section in sections:
+            for field in section.fields:
+                names.update(handler_name for signal_name, handler_name in field.connect)
+            names.update(cls._handler_names(section.sections))
+        return names
+
+    # 使用できないキー と 型 を調べる 関数
+    @staticmethod
+    def _check_keys(spec, allowed, where):
+        if not isinstance(spec, dict):
+            raise SpecError(u'{}: expected a dict'.format(where))
+        for option, value in spec.items():
+            value_type = allowed.get(option)
+            if value_type is None:
+                raise SpecError(u'{}: unknown key "{}"'.format(where, option))
+            value_types = value_type if isinstance(value_type, tuple) else (value_type,)
+            # bool は int の派生クラスの為、bool を許可していない場合は 別に除外します
+            if not isinstance(value, value_types) or (isinstance(value, bool) and bool not in value_types):
+                raise SpecError(u'{}: "{}" must be {}'.format(
+                    where, option, ' or '.join(value_type.__name__ for value_type in value_types)))
+
+    # 作成の途中で失敗した Container 群を破棄する 関数
+    @staticmethod
+    def _discard(panel, group):
+        for key, container in reversed(list(panel.containers.items())):
+            if group is not None:
+                group.remove(key)
+            container.setParent(None)
+            container.deleteLater()
+        panel.containers.clear()
+        panel.fields.clear()
+
+    # セクションの Container を作成する 関数
+    def _build_section(self, section, parent, context):
+        panel, group, handlers, states = context
+        expanded = states.get(section.key, section.expanded)
+
+        def build_content(content_widget):
+            self._build_content(section, content_widget, context)
+
+        if section.lazy:
+            container = Container(section.title, section.color_background, content_factory = build_content,
+                                  animated = section.animated, expanded = expanded, parent = parent
+                                  )
+        else:
+            container = Container(section.title, section.color_background, animated = section.animated,
+                                  expanded = True if expanded is None else expanded, parent = parent
+                                  )
+        # 入れ子のセクションより先に 親のセクションを登録します
+        if group is not None:
+            try:
+                group.add(container, section.key)
+            except ValueError:
+                container.setParent(None)
+                container.deleteLater()
+                raise
+        panel.containers[section.key] = container
+        if not section.lazy:
+            build_content(container.contentWidget)
+        return container
+
+    # content の 入力フィールド と 入れ子のセクション を作成する 関数
+    def _build_content(self, section, content_widget, context):
+        panel, group, handlers, states = context
+        if section.layout == 'grid':
+            layout = QGridLayout(content_widget)
+        elif section.layout == 'form':
+            layout = QFormLayout(content_widget)
+        else:
+            layout = QVBoxLayout(content_widget)
+        for field in section.fields:
+            widget = field.create(field.options, content_widget)
+            if field.name:
+                widget.setObjectName(field.name)
+                panel.fields[(section.key, field.name)] = widget
+            for signal_name, handler_name in field.connect:
+                signal = getattr(widget, signal_name, None)
+                if not hasattr(signal, 'connect'):  # widget_type を登録していない型は、ここで検証します
+                    raise SpecError(u'{}: {} has no signal "{}"'.format(
+                        field.where, type(widget).__name__, signal_name))
+                signal.connect(handlers[handler_name])
+            if section.layout == 'grid':
+                layout.addWidget(widget, field.row, field.column)
+            elif section.layout == 'form':
+                layout.addRow(field.label, widget)
+            else:
+                layout.addWidget(widget)
+        # 入れ子のセクションは、入力フィールドの後に 縦に並べます
+        if section.sections:
+            if section.layout == 'grid':
+                row = max(field.row for field in section.fields) + 1 if section.fields else 0
+                for index, child in enumerate(section.sections):
+                    layout.addWidget(self._build_section(child, content_widget, context),
+                                     row + index, 0, 1, section.columns
+                                     )
+            else:
+                for child in section.sections:
+                    child_container = self._build_section(child, content_widget, context)
+                    if section.layout == 'form':
+                        layout.addRow(child_container)
+                    else:
+                        layout.addWidget(child_container)
@@ -0,0 +1,571 @@
+# -*- coding: utf-8 -*-
+
+u"""
+SettingsStore.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    Container を使用した 全てのツール で共有する、プロセス内の 設定ファイル のキャッシュ
+        - 通称: セッティングストア(SettingsStore)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    以前は MainWindow の派生クラス毎に、_iniFileSetting で QSettings の .iniファイル を作成していた為、
+        - ツール毎・セッション毎に ファイルを開いて、解析して、書き込み、
+        - 同時に起動した Maya(ファーム投入ツールの ヘッドレス Maya など)が、同じファイルを 奪い合っていました。
+    SettingsStore は、
+        - ファイル毎に 1つ だけ作成され(shared_store)、最初の 1回 だけ読み込んで、以降はメモリから返し、
+        - 書き込みは 一定時間 まとめてから(sync())、
+            他のプロセスとの ファイルロック(fcntl / msvcrt)の中で、
+            ディスク上の最新の値 に 自身の変更だけを重ねて、一時ファイルから os.replace() で置き換えます。
+    保存形式(バックエンド)は、拡張子で選びます(.ini: IniBackend / .json: JsonBackend / .sqlite, .db: SqliteBackend)。
+    value() / setValue() / remove() / contains() / allKeys() / sync() は QSettings と同じ名前の為、
+        StateSchema.load() などへ、QSettings の代わりにそのまま渡せます。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from SettingsStore import shared_store
+
+        # 以下 e.g.):
+        ############################################################
+        settings = shared_store(filename)  # 同じ filename では、同じ SettingsStore を返します
+        geometry = settings.value('geometry')  # メモリから返します
+        settings.setValue('contA_QWid_isExpand', False)  # flush_delay 後に まとめて書き込みます
+        settings.sync()  # 直ちに書き込みます
+
+        # StatePersister の書き込みも、共有の SettingsStore 経由にできます
+        persister = StatePersister(window, group, filename, store = settings)
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import atexit
+import base64
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+try:
+    import fcntl  # POSIX
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject, QTimer, QSettings, QByteArray, QCoreApplication, QThread
+
+
+# JSON / SQLite で、QByteArray(saveGeometry() など)を保存する為の 変換 関数
+def _encode(value):
+    if isinstance(value, (QByteArray, bytes)):
+        return {'__bytes__': base64.b64encode(bytes(value)).decode('ascii')}
+    return value
+
+
+# JSON / SQLite から読み込んだ値を、元の型へ戻す 関数
+def _decode(value):
+    if isinstance(value, dict) and list(value) == ['__bytes__']:
+        return QByteArray(base64.b64decode(value['__bytes__']))
+    return value
+
+
+class FileLock(object):
+    u""" < 他のプロセスとの間で、設定ファイル の書き込みを 1つ ずつにする ファイルロック です >
+
+    POSIX では fcntl.flock、Windows では msvcrt.locking を使用します
+
+    .. note::
+        with 文で使用します
+    """
+
+    def __init__(self, path, timeout = 10.0, interval = 0.05):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param str path: ロックファイル の絶対パス(無い場合は作成します)
+        :param float timeout: ロックを待つ最大の時間(秒)
+        :param float interval: ロックを再度 試すまでの時間(秒)
+        """
+        self.path = path
+        self.timeout = timeout
+        self.interval = interval
+        self._file = None
+
+    def acquire(self):
+        u""" < ロックを取得する 関数 です >
+
+        :raises TimeoutError: timeout 秒 待っても取得できない場合
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+        self._file = open(self.path, 'a+b')
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._lock(self._file)
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    self._file.close()
+                    self._file = None
+                    raise TimeoutError(u'could not lock "{}" within {} seconds'.format(self.path, self.timeout))
+                time.sleep(self.interval)
+
+    def release(self):
+        u""" < ロックを解放する 関数 です > """
+        if self._file is None:
+            return
+        try:
+            self._unlock(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    # ロックを試す 関数(取得できない場合は OSError)
+    @staticmethod
+    def _lock(file_object):
+        if fcntl is not None:
+            fcntl.flock(file_object.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            file_object.seek(0)
+            msvcrt.locking(file_object.fileno(), msvcrt.LK_NBLCK, 1)
+
+    @staticmethod
+    def _unlock(file_object):
+        if fcntl is not None:
+            fcntl.flock(file_object.fileno(), fcntl.LOCK_UN)
+        else:
+            file_object.seek(0)
+            msvcrt.locking(file_object.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# 一時ファイルへ書き込み、os.replace() で置き換える 関数
+def atomic_replace(path, dump, retries = 5):
+    u""" < 同じフォルダの 一時ファイル へ書き込み、os.replace() で置き換える 関数 です >
+
+    読み込む側が、書き込み途中のファイルを見ることはありません
+
+    :param str path: 置き換える ファイル の絶対パス
+    :param Callable[[str], None] dump: 一時ファイル の絶対パス を受け取り、そこへ書き込む関数
+    :param int retries: Windows で 他のプロセスが開いている為に 置き換えられない場合に、再度 試す回数
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok = True)
+    handle, temp_path = tempfile.mkstemp(prefix = os.path.basename(path) + '.', suffix = '.tmp', dir = directory)
+    os.close(handle)
+    try:
+        dump(temp_path)
+        with open(temp_path, 'rb+') as file_object:
+            os.fsync(file_object.fileno())
+        for attempt in range(retries + 1):
+            try:
+                os.replace(temp_path, path)
+                break
+            except PermissionError:
+                if attempt == retries:
+                    raise
+                time.sleep(0.05)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class IniBackend(object):
+    u""" < QSettings の .iniファイル(IniFormat, utf-8)の バックエンド です >
+
+    MainWindow._iniFileSetting が作成していた .iniファイル を、そのまま読み書きできます
+    """
+
+    def read(self, path):
+        u""" < ファイルの全ての値を返す 関数 です >
+
+        :param str path: ファイルの絶対パス(無い場合は 空)
+        :rtype: Dict[str, Any]
+        """
+        if not os.path.exists(path):
+            return {}
+        settings = self._settings(path)
+        return {key: settings.value(key) for key in settings.allKeys()}
+
+    def write(self, path, changes, removed):
+        u""" < ディスク上の最新の値に 変更を重ねて、ファイルを置き換える 関数 です >
+
+        ファイルロック の中で呼ばれます
+
+        :param str path: ファイルの絶対パス
+        :param Dict[str, Any] changes: 設定した値
+        :param Set[str] removed: 削除したキー群
+        :return: 書き込んだ 全ての値
+        :rtype: Dict[str, Any]
+        """
+        values = self.read(path)
+        values.update(changes)
+        for key in removed:
+            values.pop(key, None)
+        atomic_replace(path, lambda temp_path: self._dump(temp_path, values))
+        return values
+
+    def _dump(self, temp_path, values):
+        settings = self._settings(temp_path)
+        for key, value in values.items():
+            settings.setValue(key, value)
+        settings.sync()
+        if settings.status() != QSettings.NoError:
+            raise IOError(u'could not write "{}"'.format(temp_path))
+
+    @staticmethod
+    def _settings(path):
+        settings = QSettings(path, QSettings.IniFormat)
+        settings.setIniCodec('utf-8')
+        return settings
+
+
+class JsonBackend(IniBackend):
+    u""" < .json ファイルの バックエンド です >
+
+    値の型(bool / int など)を保ったまま保存します(QByteArray は base64 で保存します)
+    """
+
+    def read(self, path):
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r', encoding = 'utf-8') as file_object:
+            data = json.load(file_object)
+        return {key: _decode(value) for key, value in data.items()}
+
+    def _dump(self, temp_path, values):
+        data = {key: _encode(value) for key, value in values.items()}
+        with open(temp_path, 'w', encoding = 'utf-8') as file_object:
+            json.dump(data, file_object, ensure_ascii = False, indent = 1, sort_keys = True)
+
+
+class SqliteBackend(object):
+    u""" < SQLite の バックエンド です >
+
+    変更したキーだけを、1つ のトランザクションで書き込みます(ファイルの置き換えはしません)
+    値は JsonBackend と同じく JSON で保存します
+    """
+
+    def read(self, path):
+        if not os.path.exists(path):
+            return {}
+        connection = self._connect(path)
+        try:
+            rows = connection.execute('SELECT key, value FROM settings').fetchall()
+        finally:
+            connection.close()
+        return {key: _decode(json.loads(value)) for key, value in rows}
+
+    def write(self, path, changes, removed):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        connection = self._connect(path)
+        try:
+            with connection:  # 1つ のトランザクション
+                connection.executemany('INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
+                                       [(key, json.dumps(_encode(value))) for key, value in changes.items()]
+                                       )
+                connection.executemany('DELETE FROM settings WHERE key = ?', [(key,) for key in removed])
+        finally:
+            connection.close()
+        return self.read(path)
+
+    @staticmethod
+    def _connect(path):
+        connection = sqlite3.connect(path, timeout = 30)
+        connection.execute('CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        return connection
+
+
+# 拡張子毎の バックエンド
+backends = {'.ini': IniBackend,
+            '.json': JsonBackend,
+            '.sqlite': SqliteBackend,
+            '.db': SqliteBackend,
+            }
+
+
+# 拡張子から バックエンド を返す 関数
+def backend_for(path):
+    u""" < 拡張子から バックエンド を返す 関数 です >
+
+    :param str path: ファイルの絶対パス
+    :return: 未登録の拡張子の場合は IniBackend
+    :rtype: IniBackend | JsonBackend | SqliteBackend
+    """
+    extension = os.path.splitext(path)[1].lower()
+    return backends.get(extension, IniBackend)()
+
+
+class SettingsStore(QObject):
+    u""" < 設定ファイル を 1回 だけ読み込み、書き込みを まとめて行う キャッシュ です >
+
+    .. note::
+        読み込みは メモリから返します(他のプロセスの書き込みは、sync() / reload() の時に取り込みます)
+        setValue() は flush_delay(ms)の間 まとめてから、自身の 別スレッド で書き込みます(sync_async())
+            GUIスレッド は ファイルロック を待ちません
+            イベントループが無い場合(ヘッドレス など)は、sync() を呼ぶか、終了時(close())に書き込まれます
+        sync() は 別スレッド からも呼べます
+    """
+
+    def __init__(self, path, backend = None, flush_delay = 500, parent = None):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        通常は shared_store() を使用してください
+
+        :param str path: 設定ファイル の絶対パス
+        :param backend: IniBackend / JsonBackend / SqliteBackend など(省略時は拡張子から選びます)
+        :param int flush_delay: setValue() から書き込むまでの時間(ms)
+        :param QObject parent: 親オブジェクト
+        """
+        super(SettingsStore, self).__init__(parent)
+        self.path = os.path.abspath(path)
+        self.backend = backend if backend is not None else backend_for(path)
+        self._values = None  # 読み込み前は None
+        self._changes = {}  # key: 書き込み待ちのキー, value: 値
+        self._removed = set()  # 書き込み待ちの 削除したキー群
+        self._lock = Lock()  # 値と 書き込み待ち を守ります(短時間のみ)
+        self._write_lock = Lock()  # ファイルへの書き込みを 1つ ずつにします
+        self._loads = 0
+        self._writes = 0
+        self._executor = None  # 書き込み用の 別スレッド(初回の sync_async() で作成します)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_delay)
+        self._timer.timeout.connect(self._on_timeout)
+
+    # 値を返す 関数
+    def value(self, key, defaultValue = None):
+        u""" < 値を返す 関数 です(QSettings.value と同じです) >
+
+        :param str key: キー
+        :param defaultValue: キーが無い場合に返す値
+        """
+        with self._lock:
+            return self._loaded().get(key, defaultValue)
+
+    # 値を設定する 関数
+    def setValue(self, key, value):
+        u""" < 値を設定する 関数 です(QSettings.setValue と同じです) >
+
+        :param str key: キー
+        :param value: 値
+        """
+        with self._lock:
+            self._loaded()[key] = value
+            self._changes[key] = value
+            self._removed.discard(key)
+        self._schedule()
+
+    # キーを削除する 関数
+    def remove(self, key):
+        u""" < キーを削除する 関数 です(QSettings.remove と同じです) >
+
+        :param str key: キー
+        """
+        with self._lock:
+            self._loaded().pop(key, None)
+            self._changes.pop(key, None)
+            self._removed.add(key)
+        self._schedule()
+
+    # キーが在るかどうかを返す 関数
+    def contains(self, key):
+        u""" < キーが在るかどうかを返す 関数 です >
+
+        :rtype: bool
+        """
+        with self._lock:
+            return key in self._loaded()
+
+    # 全てのキーを返す 関数
+    def allKeys(self):
+        u""" < 全てのキーを返す 関数 です >
+
+        :rtype: List[str]
+        """
+        with self._lock:
+            return list(self._loaded())
+
+    # 書き込み待ちが在るかどうかを返す 関数
+    def is_dirty(self):
+        u""" < 書き込み待ちの変更が在るかどうかを返す 関数 です >
+
+        :rtype: bool
+        """
+        with self._lock:
+            return bool(self._changes or self._removed)
+
+    # 書き込む 関数
+    def sync(self):
+        u""" < 書き込み待ちの変更を、ファイルロック の中で ディスク上の最新の値に重ねて書き込む 関数 です >
+
+        書き込み後は、他のプロセスが書き込んだ値も メモリへ取り込まれます
+
+        :raises TimeoutError: ファイルロック が取得できない場合(変更は 書き込み待ち に戻ります)
+        """
+        with self._write_lock:
+            with self._lock:
+                changes, self._changes = self._changes, {}
+                removed, self._removed = self._removed, set()
+            if not changes and not removed:
+                return
+            try:
+                with FileLock(self.path + '.lock'):
+                    values = self.backend.write(self.path, changes, removed)
+            except BaseException:
+                with self._lock:
+                    # 書き込み中に 設定し直された値 を優先して、書き込み待ちへ戻します
+                    for key, value in changes.items():
+                        if key not in self._changes and key not in self._removed:
+                            self._changes[key] = value
+                    self._removed.update(key for key in removed if key not in self._changes)
+                raise
+            with self._lock:
+                self._writes += 1
+                self._values = self._merge_pending(values)
+
+    # 別スレッド で書き込む 関数
+    def sync_async(self):
+        u""" < 書き込み待ちの変更を、別スレッド で書き込む予約をする 関数 です >
+
+        ファイルロック が取得できない場合は、変更を 書き込み待ち に戻し、次回の書き込みで再度 試みます
+
+        :return: 書き込みの Future(書き込んだ場合は True、ファイルロック が取得できなかった場合は False)
+        :rtype: concurrent.futures.Future
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers = 1)  # 書き込みは 1つ ずつ順番に行います
+            return self._executor.submit(self._sync_quietly)
+
+    # 書き込みを終え、別スレッド を終了する 関数
+    def close(self):
+        u""" < 書き込み待ちの変更を書き込み、別スレッド を終了する 関数 です >
+
+        window を閉じる時や、終了時に使用します(以降の sync_async() では、別スレッド を作成し直します)
+
+        :return: 書き込んだかどうか(ファイルロック が取得できなかった場合は False)
+        :rtype: bool
+        """
+        if QCoreApplication.instance() is not None and QThread.currentThread() is self.thread():
+            self._timer.stop()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait = True)
+        return self._sync_quietly()
+
+    # 読み込み直す 関数
+    def reload(self):
+        u""" < 他のプロセスが書き込んだ値を取り込む為に、ファイルを読み込み直す 関数 です >
+
+        書き込み待ちの変更は、そのまま残ります
+        """
+        values = self.backend.read(self.path)
+        with self._lock:
+            self._loads += 1
+            self._values = self._merge_pending(values)
+
+    # 統計を返す 関数
+    def stats(self):
+        u""" < 統計を返す 関数 です >
+
+        :return: {'loads': ファイルを読み込んだ回数, 'writes': ファイルへ書き込んだ回数}
+        :rtype: Dict[str, int]
+        """
+        return {'loads': self._loads, 'writes': self._writes}
+
+    # 読み込み済みの値を返す 関数(初回のみ 読み込みます)
+    def _loaded(self):
+        if self._values is None:
+            self._loads += 1
+            self._values = self.backend.read(self.path)
+        return self._values
+
+    # ディスク上の値に、書き込み待ちの変更を重ねる 関数
+    def _merge_pending(self, values):
+        values.update(self._changes)
+        for key in self._removed:
+            values.pop(key, None)
+        return values
+
+    # ファイルロック の 待ち時間切れ を送出せずに書き込む 関数
+    def _sync_quietly(self):
+        try:
+            self.sync()
+        except TimeoutError:
+            return False  # 変更は 書き込み待ち に戻っています
+        return True
+
+    # 書き込みの予約時間になった時の 関数(GUIスレッド)
+    def _on_timeout(self):
+        if self.is_dirty():
+            self.sync_async()
+
+    # 書き込みの予約をする 関数
+    def _schedule(self):
+        # タイマーは、イベントループの在る 自身のスレッド でのみ使用できます
+        if QCoreApplication.instance() is not None and QThread.currentThread() is self.thread():
+            self._timer.start()
+
+
+# 共有の SettingsStore 群
+#   key: 正規化したファイルの絶対パス, value: SettingsStore
+_shared_stores = {}
+
+
+# 共有の SettingsStore を返す 関数
+def shared_store(path, backend = None):
+    u""" < ファイル毎に 共有の SettingsStore を返す 関数 です >
+
+    同じファイルでは、全ての Container を使用したツール window で、同じ SettingsStore を使用します
+
+    :param str path: 設定ファイル の絶対パス
+    :param backend: 初回の作成時のみ使用します(省略時は拡張子から選びます)
+    :rtype: SettingsStore
+    """
+    key = os.path.normcase(os.path.abspath(path))
+    store = _shared_stores.get(key)
+    if store is None:
+        store = _shared_stores[key] = SettingsStore(path, backend)
+    return store
+
+
+# 全ての 共有の SettingsStore を書き込み、別スレッド を終了する 関数(終了時)
+@atexit.register
+def _sync_shared_stores():
+    for store in list(_shared_stores.values()):
+        try:
+            store.close()
+        except Exception:  # 終了時の書き込み失敗で、他の SettingsStore の書き込みを止めません
+            pass
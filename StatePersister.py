@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+u"""
+StatePersister.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    Container の折り畳みの状況と window の位置・大きさを、変化した分だけ .iniファイル へ保存する
+        - 通称: ステートパーシスター(StatePersister)
+        - 型: QObject の派生クラス(サブクラス)
+詳細(details):
+    以前は closeEvent や Reset の時にだけ、全ての項目を GUIスレッド で同期的に保存していました。
+        - ネットワーク上のホームディレクトリでは、.iniファイル の書き込みで UI が固まります
+        - クラッシュすると、window を開いてからの変化が全て失われます
+    StatePersister は、
+        - 変化した Container の状況(と window の位置・大きさ)だけを記録し、
+        - 一定時間 変化が止まるのを待ってから(デバウンス)、
+        - 別スレッドで .iniファイル へ書き込みます。
+    window の close 時には、残っている変化を同期的に書き込みます。
+    共有の SettingsStore を渡した場合は、値を SettingsStore へ設定し、書き込みは SettingsStore.sync() で行います
+        (他の ツール・プロセス の書き込みと まとめられ、ファイルロック の中で置き換えられます)。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from StatePersister import StatePersister
+        from SettingsStore import shared_store
+
+        # 以下 e.g.):
+        ############################################################
+        # group: window 内の Container を登録した ContainerGroup
+        persister = StatePersister(window, group, filename)
+        # 以降、collapse/expand の度に 自動で保存されます
+
+        # or 共有の SettingsStore 経由で保存します
+        persister = StatePersister(window, group, filename, store = shared_store(filename))
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
+
+# サードパーティライブラリ
+from PySide2.QtCore import QObject, QTimer, QEvent, QSettings
+
+
+class StatePersister(QObject):
+    u""" < Container の折り畳みの状況と window の位置・大きさを、変化した分だけ保存する クラス です >
+
+    .. note::
+        .iniファイル のキーは、
+            - Container: key_format.format(ContainerGroup のキー)  e.g.): 'contA_QWid_isExpand'
+            - window の位置・大きさ: geometry_key
+        です
+    """
+
+    def __init__(self, window, group, filename, key_format = '{}_isExpand',
+                 geometry_key = 'geometry', debounce = 500, store = None
+                 ):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param QWidget window: Container を持つ window(close 時に同期的に保存します)
+        :param ContainerGroup group: 保存する Container を登録した グループ
+        :param str filename: 保存先の .iniファイル の絶対パス
+        :param str key_format: Container の状況を保存する .iniファイル のキーの書式
+        :param str geometry_key: window の位置・大きさを保存する .iniファイル のキー
+            None の場合は保存しません
+        :param int debounce: 変化が止まってから書き込むまでの時間(ms)
+        :param SettingsStore store: 書き込みに使用する 共有の SettingsStore(省略時は QSettings で直接書き込みます)
+            書き込みは SettingsStore の 別スレッド(sync_async())で行います
+        """
+        super(StatePersister, self).__init__(window)
+        self._window = window
+        self._group = group
+        self.filename = filename
+        self.key_format = key_format
+        self.geometry_key = geometry_key
+        self._store = store
+
+        self._dirty = {}  # key: .iniファイル のキー, value: 保存する値
+        self._geometry_dirty = False
+        self._futures = []
+        self._lock = Lock()  # 書き込み中の .iniファイル を、他の書き込みから守ります
+        self._executor = None  # 書き込みは 1つ ずつ順番に行います(初回の書き込みで作成し、close 時に終了します)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce)
+        self._timer.timeout.connect(self.flush)
+
+        group.statesChanged.connect(self._on_states_changed)
+        window.installEventFilter(self)
+
+    # 変化が残っているかどうかを返す 関数
+    def is_dirty(self):
+        u""" < 保存されていない変化が残っているかどうかを返す 関数 です >
+
+        :rtype: bool
+        """
+        return bool(self._dirty) or self._geometry_dirty
+
+    # 全ての Container の状況を、変化として記録する 関数
+    def mark_all_dirty(self):
+        u""" < 全ての Container の状況と window の位置・大きさを、変化として記録する 関数 です >
+
+        Reset 後など、全ての項目を保存し直したい時に使用します
+        """
+        self._on_states_changed(self._group.states())
+        self._geometry_dirty = self.geometry_key is not None
+
+    # 変化を 別スレッド で書き込む 関数
+    def flush(self, wait_for_write = False):
+        u""" < 記録している変化を、別スレッド で .iniファイル へ書き込む 関数 です >
+
+        :param bool wait_for_write: True の場合は、書き込みが終わるまで待ちます(同期的な保存)
+        """
+        self._timer.stop()
+        values, self._dirty = self._dirty, {}
+        if self._geometry_dirty:
+            # window の情報は GUIスレッド で取得し、書き込みだけを 別スレッド で行います
+            values[self.geometry_key] = self._window.saveGeometry()
+            self._geometry_dirty = False
+        if values:
+            self._futures = [future for future in self._futures if not future.done()]
+            if self._store is not None:
+                # SettingsStore の値は GUIスレッド で設定し、ファイルへの書き込みは SettingsStore の 別スレッド で行います
+                for key, value in values.items():
+                    self._store.setValue(key, value)
+                self._futures.append(self._store.sync_async())
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers = 1)
+                self._futures.append(self._executor.submit(self._write, values))
+        if wait_for_write:
+            wait(self._futures)
+            self._futures = []
+
+    # 書き込みを終え、別スレッド を終了する 関数
+    def close(self):
+        u""" < 記録している変化を書き込み、別スレッド を終了する 関数 です >
+
+        window の close 時に自動で呼ばれます(再度 表示された場合は、次回の書き込みで 別スレッド を作成し直します)
+        """
+        self.flush(wait_for_write = True)
+        if self._executor is not None:
+            self._executor.shutdown(wait = True)
+            self._executor = None
+
+    # .iniファイル へ書き込む 関数(別スレッド で実行されます)
+    def _write(self, values):
+        with self._lock:
+            # QSettings はスレッド毎に作成します
+            settings = QSettings(self.filename, QSettings.IniFormat)
+            settings.setIniCodec('utf-8')
+            for key, value in values.items():
+                settings.setValue(key, value)
+            settings.sync()
+
+    # Container の状況の変化を記録し、デバウンスのタイマーを開始する 関数
+    def _on_states_changed(self, states):
+        for key, expanded in states.items():
+            self._dirty[self.key_format.format(key)] = expanded
+        self._timer.start()
+
+    def eventFilter(self, watched, event):
+        if watched is self._window:
+            event_type = event.type()
+            if event_type in (QEvent.Move, QEvent.Resize) and self.geometry_key is not None:
+                self._geometry_dirty = True
+                self._timer.start()
+            elif event_type == QEvent.Close:
+                self.close()
+        return super(StatePersister, self).eventFilter(watched, event)
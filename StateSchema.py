@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+u"""
+StateSchema.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    保存・復元する状況の、型付きの定義(スキーマ)
+        - 通称: ステートスキーマ(StateSchema)
+詳細(details):
+    以前は、
+        - 全ての Container を展開した状態で作成してから、show() 内で 1つずつ collapse/expand していた為、
+            window を開く度に 既定の状況 と 復元した状況 の 2回 レイアウトが走り、
+        - QSettings.value(...) の 文字列 を `is True` で比較していた為、
+            展開した状況が 一度も 復元されていませんでした。
+    StateSchema は、キー毎の 型 と 既定値 を定義し、
+        .iniファイル から 1回 で読み込み、型変換したマッピングを返します。
+    その値を Container(expanded=...) へ渡すことで、最初のレイアウトが そのまま 最終的なレイアウトになります。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from StateSchema import StateSchema
+
+        # 以下 e.g.):
+        ############################################################
+        schema = StateSchema()
+        schema.add('contA_QWid', default = True)
+        schema.add('contB_QWid', default = False)
+        states = schema.load(settings)  # {'contA_QWid': True, 'contB_QWid': False}
+
+        container_a = Container("GroupA", expanded = states['contA_QWid'])
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+from collections import OrderedDict, namedtuple
+
+
+# QSettings(.iniファイル)から読み込んだ値を bool へ変換する 関数
+def to_bool(value):
+    u""" < QSettings(.iniファイル)から読み込んだ値を bool へ変換する 関数 です >
+
+    .iniファイル から読み込んだ値は、'true' / 'false' などの 文字列 になる為、
+        `is True` や bool('false') では正しく判定できません
+
+    :param value: 変換する値(bool, int, str)
+    :rtype: bool
+    :raises ValueError: bool として解釈できない文字列の場合
+    """
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ('true', '1', 'yes', 'on'):
+            return True
+        if lowered in ('false', '0', 'no', 'off', ''):
+            return False
+        raise ValueError(u'cannot convert "{}" to bool'.format(value))
+    return bool(value)
+
+
+# 型毎の変換 関数
+_CONVERTERS = {bool: to_bool,
+               int: int,
+               float: float,
+               str: str,
+               }
+
+# スキーマの 1項目 の定義
+StateField = namedtuple('StateField', ['key', 'type', 'default'])
+
+
+class StateSchema(object):
+    u""" < 保存・復元する状況の、型付きの定義(スキーマ) です >
+
+    .. note::
+        .iniファイル のキーは key_format.format(キー) です(StatePersister と同じ書式)
+        値が無い、もしくは型変換できない場合は、既定値を使用します
+    """
+
+    def __init__(self, key_format = '{}_isExpand'):
+        u""" < initialize(初期化関数)コンストラクタ です >
+
+        :param str key_format: .iniファイル のキーの書式
+        """
+        self.key_format = key_format
+        self._fields = OrderedDict()  # key: キー, value: StateField
+
+    # 項目を追加する 関数
+    def add(self, key, default = True, value_type = bool):
+        u""" < 項目を追加する 関数 です >
+
+        :param str key: ContainerGroup のキー
+        :param default: 既定値(Container の場合は 初期の折り畳みの状況)
+        :param type value_type: 値の型(bool, int, float, str)
+        """
+        if value_type not in _CONVERTERS:
+            raise TypeError(u'unsupported value type: {}'.format(value_type))
+        self._fields[key] = StateField(key, value_type, default)
+
+    # 登録済みの キー群 を返す 関数
+    def keys(self):
+        u""" < 登録済みの キー群 を、追加順に返す 関数 です >
+
+        :rtype: List[str]
+        """
+        return list(self._fields)
+
+    # 全ての既定値を返す 関数
+    def defaults(self):
+        u""" < 全ての既定値を返す 関数 です >
+
+        :rtype: Dict[str, Any]
+        """
+        return {key: field.default for key, field in self._fields.items()}
+
+    # 値を型変換する 関数
+    def convert(self, key, value):
+        u""" < 値を、キーの型へ変換する 関数 です >
+
+        :param str key: 登録済みのキー
+        :param value: 変換する値(None の場合は既定値)
+        :return: 型変換した値(変換できない場合は既定値)
+        """
+        field = self._fields[key]
+        if value is None:
+            return field.default
+        try:
+            return _CONVERTERS[field.type](value)
+        except (TypeError, ValueError):
+            return field.default
+
+    # QSettings から全ての値を読み込む 関数
+    def load(self, settings):
+        u""" < QSettings から全ての値を、1回 で読み込む 関数 です >
+
+        :param QSettings settings: 読み込み元
+        :return: {キー: 型変換した値}
+        :rtype: Dict[str, Any]
+        """
+        return {key: self.convert(key, settings.value(self.key_format.format(key)))
+                for key in self._fields
+                }
+
+    # 値を QSettings へ書き込む 関数
+    def save(self, settings, states):
+        u""" < 値を QSettings へ書き込む 関数 です >
+
+        :param QSettings settings: 書き込み先
+        :param Dict[str, Any] states: {キー: 値} 未登録のキーは無視します
+        """
+        for key, value in states.items():
+            if key in self._fields:
+                settings.setValue(self.key_format.format(key), self.convert(key, value))
+
+    # ContainerGroup の全ての Container へ、まとめて適用する 関数
+    def apply(self, group, states):
+        u""" < 読み込んだ値を ContainerGroup へ、1回 のレイアウトで適用する 関数 です >
+
+        表示後に適用し直す場合に使用します
+        表示前は、Container(expanded=...) へ渡す方が、レイアウトが 1回 で済みます
+
+        :param ContainerGroup group: 適用先
+        :param Dict[str, bool] states: {キー: True(-expand-) / False(-collapse-)}
+        """
+        group.set_states({key: value for key, value in states.items()
+                          if key in self._fields and self._fields[key].type is bool
+                          })
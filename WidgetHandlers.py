@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+u"""
+WidgetHandlers.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    入力フィールドの 型毎の ハンドラー と スキップルール の登録、及び 子孫ウィジェットの走査
+        - 通称: ウィジェットハンドラー(HandlerRegistry / walk_widgets)
+詳細(details):
+    FormResetter(リセット)と FormState(取得・復元)は、どちらも
+        - 型毎の処理を ハンドラー として登録し、MRO を辿って 最も近い型のもの を使い、
+        - Container の Header など、触れたくない部分を スキップルール で除外し、
+        - ハンドラーのあるウィジェットの内部(QSpinBox の QLineEdit など)には入らない
+    という同じ走査を行います。当モジュールは その共通部分 です。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from WidgetHandlers import HandlerRegistry, walk_widgets
+
+        # 以下 e.g.):
+        ############################################################
+        class MyVisitor(HandlerRegistry):
+            def visit(self, root):
+                for widget in self.walk(root):
+                    handler = self.handler_for(type(widget))
+                    if handler is not None:
+                        handler(widget)
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成(FormResetter / FormState から共通部分を移動)
+
+        version = '-1.0-'
+"""
+
+# ローカルで作成したモジュール
+from Container import HeaderBase
+
+
+# 子孫ウィジェットを、それぞれ 1回 だけ 返す ジェネレーター 関数
+def walk_widgets(root, skip = None, descend = None):
+    u""" < 子孫ウィジェットを、それぞれ 1回 だけ 返す ジェネレーター 関数 です >
+
+    root 自身を含め、親から子の順(深さ優先)に返します
+
+    :param QWidget root: 起点となるウィジェット
+    :param Callable[[QWidget], bool] skip: True を返したウィジェットは、その子孫ごと除外します
+    :param Callable[[QWidget], bool] descend: False を返したウィジェットは返しますが、その子孫には入りません
+        (入力フィールドの内部(QSpinBox の QLineEdit など)を除外する場合に使用します)
+    :rtype: Iterator[QWidget]
+    """
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        if skip is not None and skip(widget):
+            continue
+        yield widget
+        if descend is not None and not descend(widget):
+            continue
+        children = [child for child in widget.children() if child.isWidgetType()]
+        children.reverse()  # pop() で元の並び順になるように
+        stack.extend(children)
+
+
+# Container の内部(Header)かどうかを返す スキップルール 関数
+def is_container_internal(widget):
+    u""" < Container の内部(Header)かどうかを返す スキップルール 関数 です >
+
+    Header には QLabel などが在りますが、入力フィールドでは無い為、除外します
+
+    :param QWidget widget: 判定するウィジェット
+    :rtype: bool
+    """
+    return isinstance(widget, HeaderBase)
+
+
+class HandlerRegistry(object):
+    u""" < 型毎の ハンドラー と スキップルール を登録し、子孫ウィジェットを走査する クラス です >
+
+    .. note::
+        ハンドラーは、ウィジェットの型の MRO を辿り、最も近い型に登録されたものが使われます
+        ハンドラーのあるウィジェットの内部(QSpinBox の QLineEdit、QTextEdit の QScrollBar など)には入りません
+    """
+
+    def __init__(self):
+        u""" < initialize(初期化関数)コンストラクタ です > """
+        self._handlers = {}  # key: ウィジェットの型, value: ハンドラー
+        self._resolved = {}  # key: ウィジェットの型, value: MRO から解決したハンドラー(キャッシュ)
+        self._skip_rules = []
+
+    # 型毎の ハンドラー を登録する 関数
+    def register(self, widget_type, handler):
+        u""" < 型毎の ハンドラー を登録する 関数 です >
+
+        :param type widget_type: 対象のウィジェットの型(派生クラスにも適用されます)
+        :param handler: ハンドラー(派生クラス毎の形式)
+        """
+        self._handlers[widget_type] = handler
+        self._resolved.clear()
+
+    # 型毎の ハンドラー の登録を解除する 関数
+    def unregister(self, widget_type):
+        u""" < 型毎の ハンドラー の登録を解除する 関数 です >
+
+        :param type widget_type: 登録時のウィジェットの型
+        """
+        self._handlers.pop(widget_type, None)
+        self._resolved.clear()
+
+    # スキップルール を追加する 関数
+    def add_skip_rule(self, rule):
+        u""" < スキップルール を追加する 関数 です >
+
+        :param Callable[[QWidget], bool] rule: True を返したウィジェットは、その子孫ごと除外します
+        """
+        self._skip_rules.append(rule)
+
+    # ウィジェットの型に対応する ハンドラー を返す 関数
+    def handler_for(self, widget_type):
+        u""" < ウィジェットの型に対応する ハンドラー を返す 関数 です >
+
+        :param type widget_type: ウィジェットの型
+        :return: 未登録の場合は None
+        """
+        try:
+            return self._resolved[widget_type]
+        except KeyError:
+            pass
+        handler = None
+        for base in widget_type.__mro__:
+            if base in self._handlers:
+                handler = self._handlers[base]
+                break
+        self._resolved[widget_type] = handler
+        return handler
+
+    # スキップルール に該当するかどうかを返す 関数
+    def is_skipped(self, widget):
+        u""" < スキップルール に該当するかどうかを返す 関数 です >
+
+        :param QWidget widget: 判定するウィジェット
+        :rtype: bool
+        """
+        return any(rule(widget) for rule in self._skip_rules)
+
+    # 子孫へ入るかどうかを返す 関数
+    def is_descended(self, widget):
+        u""" < 子孫へ入るかどうか(ハンドラーが無いかどうか)を返す 関数 です >
+
+        :param QWidget widget: 判定するウィジェット
+        :rtype: bool
+        """
+        return self.handler_for(type(widget)) is None
+
+    # root 以下のウィジェットを返す ジェネレーター 関数
+    def walk(self, root, skip = None):
+        u""" < root 以下のウィジェットを、スキップルール を適用して 親から子の順に返す ジェネレーター 関数 です >
+
+        :param QWidget root: 起点となるウィジェット(root 自身も返します)
+        :param Callable[[QWidget], bool] skip: この呼び出しだけの 追加の スキップ判定(root には適用しません)
+        :rtype: Iterator[QWidget]
+        """
+        def skip_widget(widget):
+            if skip is not None and widget is not root and skip(widget):
+                return True
+            return self.is_skipped(widget)
+
+        return walk_widgets(root, skip_widget, self.is_descended)
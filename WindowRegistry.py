@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+u"""
+WindowRegistry.py
+
+:Author:
+    oki yoshihiro
+    okiyoshihiro.job@gmail.com
+:Version: -1.0-
+:Date: 2026/10/18
+
+.. note:: 当コード記述時の環境
+
+    - Maya2022 python3系
+    - Python version: 3.7.7
+    - PySide2 version: 5.15.2
+
+概要(overview):
+    表示中のツール window を、window name (objectName) で引ける 登録簿
+        - 通称: ウィンドウレジストリ(WindowRegistry)
+詳細(details):
+    以前は、UIの 重複表示の回避 の為に QApplication.allWidgets() を全て調べ、
+        objectName() を比較していました。
+    シーンを読み込んだ Maya では、数万のウィジェットのラッパーを作ることになります。
+    WindowRegistry は、window を 弱参照 で保持し、
+        - window name から 1回 の辞書引きで見つけられ、
+        - window が破棄(destroyed)されると、自動で登録が解除されます。
+    window を生かし続けることはありません(参照を持つのは呼び出し側です)。
+使用法(usage):
+    ::
+
+        # ローカルで作成したモジュール
+        from WindowRegistry import shared_registry
+
+        # 以下 e.g.):
+        ############################################################
+        registry = shared_registry()
+        registry.close_existing('MainWindow_ui')  # UIの 重複表示の回避
+        window.setObjectName('MainWindow_ui')
+        registry.register(window)
+
+        registry.names()  # ['MainWindow_ui']
+        ##############################
+
+-リマインダ-
+    done: 2026/10/18
+        新規作成
+
+        version = '-1.0-'
+"""
+
+# 標準ライブラリ
+import weakref
+
+
+class WindowRegistry(object):
+    u""" < 表示中のツール window を、window name (objectName) で引ける 登録簿 です >
+
+    .. note::
+        同じ window name で登録し直した場合は、新しい window に置き換わります
+    """
+
+    def __init__(self):
+        u""" < initialize(初期化関数)コンストラクタ です > """
+        self._windows = {}  # key: window name, value: weakref.ref(window)
+
+    # window を登録する 関数
+    def register(self, window, name = None):
+        u""" < window を登録する 関数 です >
+
+        :param QWidget window: 登録する window
+        :param str name: window name(省略時は window.objectName())
+        :return: 登録した window name
+        :rtype: str
+        """
+        if name is None:
+            name = window.objectName()
+        if not name:
+            raise ValueError(u'window name (objectName) is empty')
+        ref = weakref.ref(window)
+        self._windows[name] = ref
+        # window を強参照しないよう、名前と弱参照だけを捕まえます
+        window.destroyed.connect(lambda *args: self._discard(name, ref))
+        return name
+
+    # window の登録を解除する 関数
+    def unregister(self, name):
+        u""" < window の登録を解除する 関数 です >
+
+        :param str name: window name
+        """
+        self._windows.pop(name, None)
+
+    # window name から window を返す 関数
+    def get(self, name):
+        u""" < window name から window を返す 関数 です >
+
+        :param str name: window name
+        :return: 未登録、もしくは破棄済みの場合は None
+        :rtype: QWidget | None
+        """
+        ref = self._windows.get(name)
+        if ref is None:
+            return None
+        window = ref()
+        if window is None or not self._is_alive(window):
+            self._discard(name, ref)
+            return None
+        return window
+
+    # 登録済みの window name 群を返す 関数
+    def names(self):
+        u""" < 表示中(登録済み)の window name 群を返す 関数 です >
+
+        :rtype: List[str]
+        """
+        return [name for name in list(self._windows) if self.get(name) is not None]
+
+    # 登録済みの window 群を返す 関数
+    def instances(self):
+        u""" < 表示中(登録済み)の window 群を返す 関数 です >
+
+        QApplication.allWidgets() には触れません
+
+        :rtype: List[QWidget]
+        """
+        windows = (self.get(name) for name in list(self._windows))
+        return [window for window in windows if window is not None]
+
+    # 同じ window name の window を破棄する 関数
+    def close_existing(self, name):
+        u""" < 同じ window name の window を破棄する 関数 です >
+
+        UIの 重複表示の回避 に使用します
+
+        :param str name: window name
+        :return: 破棄した window が在ったかどうか
+        :rtype: bool
+        """
+        window = self.get(name)
+        if window is None:
+            return False
+        self.unregister(name)
+        window.deleteLater()
+        return True
+
+    # 登録を解除する 関数(destroyed 時)
+    def _discard(self, name, ref):
+        # 同じ名前で新しい window が登録し直されている場合は、解除しません
+        if self._windows.get(name) is ref:
+            del self._windows[name]
+
+    # window の C++ オブジェクトが生きているかどうかを返す 関数
+    @staticmethod
+    def _is_alive(window):
+        try:
+            window.objectName()
+        except RuntimeError:  # C++ オブジェクトは破棄済み
+            return False
+        return True
+
+
+# 共有の WindowRegistry
+_shared_registry = None
+
+
+# 共有の WindowRegistry を返す 関数
+def shared_registry():
+    u""" < 共有の WindowRegistry を返す 関数 です >
+
+    全ての Container を使用したツール window で、同じ登録簿を使用します
+
+    :rtype: WindowRegistry
+    """
+    global _shared_registry
+    if _shared_registry is None:
+        _shared_registry = WindowRegistry()
+    return _shared_registry
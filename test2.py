@@ -9,25 +9,34 @@ https://github.com/aronamao/PySide2-Collapsible-Widget
 """
 
 # 標準ライブラリ
-from importlib import reload
-from functools import partial
+import os
+from typing import Tuple
 
 # サードパーティライブラリ
 from PySide2.QtWidgets import (QMainWindow, QWidget, QGridLayout,
-                               QVBoxLayout, QPushButton, QApplication,
-                               QComboBox, QSizePolicy, QSpacerItem
+                               QVBoxLayout, QPushButton,
+                               QSizePolicy, QSpacerItem
                                )
-from PySide2.QtCore import Qt, QSettings
-from maya import OpenMayaUI
-from shiboken2 import wrapInstance
+from PySide2.QtCore import Qt
 
 # ローカルで作成したモジュール
-import Container
-reload(Container)
+# Note: reload(Container) はしません
+#       Container のクラスが作り直され、他のモジュールが持つ Container / Header と別物になる為です
 from Container import Container
+from ContainerGroup import ContainerGroup
+from FormResetter import FormResetter
+from ContainerAutoFit import ContainerAutoFit
+from StatePersister import StatePersister
+from StateSchema import StateSchema
+from WindowRegistry import shared_registry
+from SettingsStore import shared_store
 
 
 def maya_main_window():
+    # Maya 専用のモジュールは、window の作成時まで読み込みません(当モジュールの import を軽くする為)
+    from maya import OpenMayaUI
+    from shiboken2 import wrapInstance
+
     main_window_ptr = OpenMayaUI.MQtUtil.mainWindow()
     return wrapInstance(int(main_window_ptr), QMainWindow)
 
@@ -131,15 +140,22 @@ class MainWindow(QMainWindow):
 
         # .iniファイルのパラメーター設定 ##################################### start
         self.iniFileParam = {'geo_iFP': 'geometry',
-                             'contA_wid_expStat_iFP': 'contA_QWid_isExpand',
-                             'contB_wid_expStat_iFP': 'contB_QWid_isExpand',
                              }
         # self.od = OrderedDict(self.iniFileParam)  # 順序付き辞書 定義
+        # Container の状況は、StateSchema で 型 と 既定値 を定義します
+        #   .iniファイル のキー: f'{containerGroup のキー}_isExpand' e.g.): 'contA_QWid_isExpand'
+        self.stateSchema = StateSchema()
+        self.stateSchema.add('contA_QWid', default = True)
+        self.stateSchema.add('contB_QWid', default = True)
+        # 表示前に 1回 で読み込み、Container の作成時に渡します(最初のレイアウトが最終的なレイアウトになります)
+        self.initialStates = self.stateSchema.load(self.__settings)
         # .iniファイルのパラメーター設定 ##################################### end
 
-        # 作成された コンテナウィジェット の高さを辞書登録
-        self.container_heights = {}
-        self.containers = []
+        # Container 群を まとめて 操作する グループ
+        #   Container は弱参照で登録され、破棄されると自動で解除されます(別途 リスト で保持しません)
+        self.containerGroup = ContainerGroup(self)
+        # 入力フィールドの一括クリアー用 リセットエンジン
+        self.formResetter = FormResetter()
 
     # オリジナルメソッド
     # .iniファイルの設定 関数
@@ -170,10 +186,10 @@ class MainWindow(QMainWindow):
               f'{self.filename}\n'
               f'Note: It has not been saved yet.'
               )
-        # QSettingsで、ファイル名 と、フォーマット を指定してインスタンスを作成
-        self.__settings = QSettings(self.filename, QSettings.IniFormat)
-        # 「setIniCodec」を使って文字コードを「utf-8」で指定すると、日本語にも威力発揮
-        self.__settings.setIniCodec('utf-8')
+        # 共有の SettingsStore を取得(同じファイルは、セッション内で 1回 だけ読み込まれます)
+        #   .iniファイル は従来通り QSettings の IniFormat(utf-8)で、
+        #   書き込みは ファイルロック の中で、一時ファイルからの置き換えで行われます
+        self.__settings = shared_store(self.filename)
 
     # オリジナルメソッド
     # 重複ウィンドウの回避関数
@@ -181,12 +197,17 @@ class MainWindow(QMainWindow):
         u""" < 重複ウィンドウの回避関数 です >
 
         オリジナルメソッド
+
+        .. note::
+            以前は QApplication.allWidgets() の全てのウィジェットの objectName() を比較していました
+            現在は 共有の WindowRegistry から、window name で直接引いています
         """
-        widgets = QApplication.allWidgets()
-        for w in widgets:
-            if w.objectName() == winName:
-                # w.close()
-                w.deleteLater()
+        # widgets = QApplication.allWidgets()
+        # for w in widgets:
+        #     if w.objectName() == winName:
+        #         # w.close()
+        #         w.deleteLater()
+        shared_registry().close_existing(winName)
 
     # オリジナルメソッド
     # Window基本設定
@@ -255,6 +276,7 @@ class MainWindow(QMainWindow):
         # UIの window name (objectName) 設定 ########################################## start
         # set window name
         self.setObjectName(self.win)  # <- window へobjectName 設定
+        shared_registry().register(self)  # <- 重複ウィンドウの回避用に、window name で登録(破棄時に自動で解除)
         # UIの window name (objectName) 設定 ########################################## end
 
         # <UI要素 4>.
@@ -299,19 +321,12 @@ class MainWindow(QMainWindow):
         # ######################################################################################
         # ウィジェット(コンテナA用)
         # を作成 ###################################### 作成しただけでは表示されません -Widget-
-        self.contA_wid = Container("GroupA")  # ウィジェット(コンテナA用)
-        self.containers.append(self.contA_wid)
-        # シグナルとスロットを接続
-        contA_clickableHeaderWid = self.contA_wid.contentHeader.clickableHeaderWidget
-        contA_clickableHeaderWid.clicked.connect(partial(self.cal_alwaysHeight_containerAll
-                                                         , self.contA_wid
-                                                         )
-                                                 )
+        self.contA_wid = Container("GroupA", expanded = self.initialStates['contA_QWid'])  # ウィジェット(コンテナA用)
+        self.containerGroup.add(self.contA_wid, key = 'contA_QWid')
+        # Note: collapse/expand 時の window の高さ調整は、self.autoFit が containerGroup 経由で行います
         # doCollapseA
         # self.contA_wid.expand()  # initial operate expand/collapse
 
-        # Save the initial height of the self.contA_wid
-        # self.container_heights[self.contA_wid] = self.contA_wid.geometry().height()
         # 縦のレイアウト(コンテナA用)
         # を作成 ###################################### 作成しただけでは表示されません -Layout-
         self.contentA_gLay = QGridLayout(self.contA_wid.contentWidget
@@ -344,19 +359,12 @@ class MainWindow(QMainWindow):
         # ######################################################################################
         # ウィジェット(コンテナB用)
         # を作成 ###################################### 作成しただけでは表示されません -Widget-
-        self.contB_wid = Container("GroupB")  # ウィジェット(コンテナA用)
-        self.containers.append(self.contB_wid)
-        # シグナルとスロットを接続
-        contB_clickableHeaderWid = self.contB_wid.contentHeader.clickableHeaderWidget
-        contB_clickableHeaderWid.clicked.connect(partial(self.cal_alwaysHeight_containerAll
-                                                         , self.contB_wid
-                                                         )
-                                                 )
+        self.contB_wid = Container("GroupB", expanded = self.initialStates['contB_QWid'])  # ウィジェット(コンテナA用)
+        self.containerGroup.add(self.contB_wid, key = 'contB_QWid')
+        # Note: collapse/expand 時の window の高さ調整は、self.autoFit が containerGroup 経由で行います
         # doCollapseB
         # self.contB_wid.expand()  # initial operate expand/collapse
 
-        # Save the initial height of the self.contA_wid
-        # self.container_heights[self.contB_wid] = self.contB_wid.geometry().height()
         # 縦のレイアウト(コンテナA用)
         # を作成 ###################################### 作成しただけでは表示されません -Layout-
         self.contentB_gLay = QGridLayout(self.contB_wid.contentWidget
@@ -393,13 +401,23 @@ class MainWindow(QMainWindow):
         # Reset ボタン のテスト
         btnE_reset_pbtnWid = QPushButton('Reset')
         self.contAll_vbxLay.addWidget(btnE_reset_pbtnWid)
-        btnE_reset_pbtnWid.clicked.connect(partial(self.resetSettings, self.central_wid))
+        # functools.partial で self.central_wid を捕まえず、メソッドへ接続します
+        btnE_reset_pbtnWid.clicked.connect(self.onResetClicked)
+
+        # collapse/expand に合わせて、window の高さを自動でフィットさせます
+        # 同じイベントループ内の変化は 1回 にまとめられ、sizeHint から計算した高さで 1回 だけ resize します
+        self.autoFit = ContainerAutoFit(self, self.containerGroup)
+        # Container の状況 と window の位置・大きさ を、変化した分だけ 別スレッド で保存します
+        # .iniファイル のキー: f'{containerGroup のキー}_isExpand' e.g.): 'contA_QWid_isExpand'
+        self.statePersister = StatePersister(self, self.containerGroup, self.filename,
+                                             geometry_key = self.iniFileParam['geo_iFP'],
+                                             store = self.__settings
+                                             )
 
         self.show()
         # window の高さ編集をしてアップデートしてあげる
-        self.cal_alwaysHeight_window()
+        self.autoFit.refit()
         # print(self.geometry())
-        # print(self.container_heights.values())
 
     # オーバーライド
     # show メソッド 組み込み関数
@@ -418,99 +436,33 @@ class MainWindow(QMainWindow):
         self.restore()  # 復元用のオリジナルメソッド
         super(MainWindow, self).show()
 
-    def cal_alwaysHeight_window(self):
-        # x, y, width, height: Tuple[int, int, int, int]
-        # 初期： QMainWindow のサイズ
-        start_size = list(self.geometry().getRect())  # タプルをリストに変換
-
-        # 縦のみの合計サイズを抽出
-        # Calculate the total height of all containers
-        total_height = sum(self.container_heights.values())
-        # Set the new height
-        start_size[3] = total_height
-        # アップデート： 全ての コンテナー が解放されている時、ぴったりと QMainWindow の最低限必要なサイズにフィットさせるサイズ
-        upDate_size = tuple(start_size)  # リストをタプルに変換
-        self.setGeometry(*upDate_size)
-
-    def cal_alwaysHeight_containerAll(self, container_geo_name):
-        # x, y, width, height: Tuple[int, int, int, int]
-
-        # # check
-        # # current： container_geo_name のサイズ
-        # print(f'I am \n\t{container_geo_name}')
-        # print(f'type is \n\t{type(container_geo_name)}')
-        currentSize_frame_list = list(container_geo_name.geometry().getRect())  # タプルをリストに変換
-        currentHeight_frame_ = currentSize_frame_list[3]
-        # print(f'currentFrame_currentHeight: {currentHeight_frame_}')
-
-        # Save the new height of the frame
-        self.container_heights[container_geo_name] = currentHeight_frame_
-        # print(self.container_heights)
-
-        # Calculate the total height of all frames
-        total_height = sum(self.container_heights.values())
-        # print(f'total_height: {total_height}')
-
-        # temp
-        # Get the current width size of the window
-        current_width = self.geometry().width()
-        # Set the new height
-        temp_height = total_height
-        # Resize the window, keeping the current width and changing the height
-        self.resize(current_width, temp_height)
-        # temp_size = list(self.geometry().getRect())  # タプルをリストに変換
-        # print(f'temp_size: {temp_size}')
-
-        # final
-        # 一旦フィットさせる。但し、全体的にフィットしてしまうので、ここで終わりにはしない！
-        self.adjustSize()
-        # Get the final height size of the window
-        final_height = self.geometry().height()
-        adjust = 20
-        self.resize(current_width, final_height - adjust)
-        # final_size = list(self.geometry().getRect())  # タプルをリストに変換
-        # print(f'final_size: {final_size}')
-
     # 1. UI-1. メニュー コマンド群 ###################################################### start
     # メモ: (PyMel版)Model: editMenuSaveSettingsCmd に相当
     # オリジナルメソッド
     # 基本となるUI構成で不可欠となる要素 8つ の内、以下 1つ を実行しています
     # <UI要素 4>. UI設定の 保存 の機能
     # UI設定の保存用 関数
-    def saveSettings(self):
+    def saveSettings(self, wait_for_write = False):
         u""" < UI設定の保存用 関数 です >
 
         オリジナルメソッド
 
         基本となるUI構成で不可欠となる要素 8つ の内、以下 1つ を実行しています
             <UI要素 4>. UI設定の 保存 の機能
+
+        .. note::
+            保存は self.statePersister が行います
+                - 変化した Container の状況 と window の位置・大きさ のみを、
+                - 別スレッド で .iniファイル へ書き込みます
+            collapse/expand の度に自動で保存される為、ここでは残っている変化を直ちに書き込むだけです
+
+        :param bool wait_for_write: True の場合は、書き込みが終わるまで待ちます(同期的な保存)
         """
         print('###' * 10)
         print(f'Save...'
-              f'\nNote: always overwriting save.. mode'
+              f'\nNote: only changed values are saved'
               )
-        # サイズ の情報を 保存
-        self.__settings.setValue(self.iniFileParam['geo_iFP'], self.saveGeometry())  # ウインドウの位置と大きさを 可変byte配列 で 取得 し、iniFile へ 可変byte配列 を セット
-        # print(f'\tSave a \n\t\t'
-        #       f'{self.iniFileParam["geo_iFP"]} \n\t\t\t'
-        #       f'param: {...}'
-        #       )
-
-        # ウィジェット(コンテナA用) の情報を 保存
-        contA_wid_isExpand, _ = self.contA_wid.contentHeader.outPut_content_status()
-        self.__settings.setValue(self.iniFileParam['contA_wid_expStat_iFP'], contA_wid_isExpand)
-        # print(f'\tSave a \n\t\t'
-        #       f'{self.iniFileParam["contA_wid_expStat_iFP"]} \n\t\t\t'
-        #       f'param: {contA_wid_isExpand}'
-        #       )
-
-        # ウィジェット(コンテナB用) の情報を 保存
-        contB_wid_isExpand, _ = self.contB_wid.contentHeader.outPut_content_status()
-        self.__settings.setValue(self.iniFileParam['contB_wid_expStat_iFP'], contB_wid_isExpand)
-        # print(f'\tSave a \n\t\t'
-        #       f'{self.iniFileParam["contB_wid_expStat_iFP"]} \n\t\t\t'
-        #       f'param: {contB_wid_isExpand}'
-        #       )
+        self.statePersister.flush(wait_for_write)
         print(f'\tSave a .INI file, at \n\t\t{self.filename}')
 
     # Reset 実行 関数 #####################################
@@ -541,13 +493,23 @@ class MainWindow(QMainWindow):
         # 入力フィールドを持つ子供Widgetのみのカレントの情報一括クリアー 関数 実行
         self.clearAllValue_toAllWidget(mainWidObjName)
         # Containerを使用した特殊なケース時に使用 #################################
-        for eachCont in self.containers:
-            eachCont.collapse()  # 一遍に全てのContainerを閉じます
-            self.cal_alwaysHeight_containerAll(eachCont)
-            self.cal_alwaysHeight_containerAll(eachCont)
+        # 一遍に全てのContainerを閉じます
+        # ContainerGroup が 1回 のレイアウトで閉じ、window のリサイズも self.autoFit が 1回 で行います
+        self.containerGroup.collapse_all()
         # Containerを使用した特殊なケース時に使用 #################################
         self.saveSettings()  # UI設定の保存用 関数 実行
 
+    # オリジナルメソッド
+    # Reset ボタン 用 関数
+    def onResetClicked(self, *args):
+        u""" < Reset ボタン 用 関数 です >
+
+        オリジナルメソッド
+
+        セントラルウィジェット を対象に、Reset 実行 関数 を呼びます
+        """
+        self.resetSettings(self.central_wid)
+
     # オリジナルメソッド
     # 入力フィールドを持つ子供Widgetのみのカレントの情報一括クリアー 関数
     def clearAllValue_toAllWidget(self, mainWidObjName):
@@ -555,45 +517,12 @@ class MainWindow(QMainWindow):
 
         オリジナルメソッド
 
-        .. note:: 情報一括クリアー には以下の条件を満たす必要があります
-
-            1.
-                渡された mainWidObjName が clear メソッド を持ち、
-                    かつそれが呼び出し可能である場合、clear メソッド を呼び出しています。
-                これは、ウィジェットがテキストを表示するための メソッド で、
-                    テキストをクリアする役割が期待されています。
-
-            ↓
-
-            1'. 特殊ケースに変更
-                b.c.): Container の Header には、
-                    QWidget, QLabel, QFont が在り、入力フィールドを持っているため
-                        一括クリアーの実行には含めたく無い からです
-
-                mainWidObjName が clearメソッド を持ち、
-                    かつ呼び出し可能である場合に、
-                        かつ mainWidObjName が Container でないか、
-                            もしくは Container である場合でも
-                QWidget、QLabel、QFontを全て持っている場合は
-                    何もせずに終了します（pass文が実行されます）。
-                それ以外の場合は mainWidObjName.clear() を実行します。
-
-            2.
-                渡された mainWidObjName が setChecke メソッド を持ち、
-                    かつそれが呼び出し可能である場合、setChecked(False) を呼び出しています。
-                これは、チェックボックスの状態を非選択に設定するためのメソッドです。
-
-            3.
-                もし mainWidObjName が QComboBox の インスタンス である場合、
-                    setCurrentIndex(-1) を呼び出しています。
-                これは、コンボボックス の現在の選択をクリアし、
-                    何も選択されていない状態にします。
-
-            4.
-                最後に、mainWidObjName にぶら下がっている全ての子供の ウィジェット に対して
-                    再帰的に同じ処理を行います。
-                これにより、メインウィジェット の階層構造全体に対して
-                    再帰的に クリア が行われます。
+        .. note::
+            以前は findChildren(QWidget)(既に再帰的) の結果を更に再帰していた為、
+                深い階層のウィジェットほど、何度もクリアーされていました
+            現在は FormResetter により、全ての子孫を ちょうど 1回 だけ訪れます
+                - 型毎のクリアー処理: FormResetter.register で追加・差し替えが出来ます
+                - Container の Header: スキップルール で除外されます
 
         メインとなる Widget(mainWidget) にぶら下がっている、
             入力フィールドを持つ 子供の Widget のみ、に特化しています
@@ -601,36 +530,10 @@ class MainWindow(QMainWindow):
             メソッドとなります
 
         :param mainWidObjName: central_wid # ここでは セントラルウィジェット に相当します
+        :return: クリアーしたウィジェット数
+        :rtype: int
         """
-        # 1.
-        # Container を使用した特殊なケース時に使用 ############################ start
-        # b.c.): Container の Header には、
-        #       QWidget, QLabel, QFont が在り、入力フィールドを持っているため
-        if (hasattr(mainWidObjName, 'clear')
-                and callable(getattr(mainWidObjName, 'clear')))\
-                :
-            if (not isinstance(mainWidObjName, Container)
-                    or all(hasattr(mainWidObjName, attr)
-                           for attr in ['QWidget', 'QLabel', 'QFont']))\
-                    :
-                pass
-            else:
-                mainWidObjName.clear()
-        # Container を使用した特殊なケース時に使用 ############################ end
-        # # 通常は ########################################################## start
-        # if hasattr(mainWidObjName, 'clear') and callable(getattr(mainWidObjName, 'clear')):
-        #     mainWidObjName.clear()
-        # # 通常は ########################################################## start
-
-        # 2.
-        if hasattr(mainWidObjName, 'setChecked') and callable(getattr(mainWidObjName, 'setChecked')):
-            mainWidObjName.setChecked(False)
-        # 3.
-        if isinstance(mainWidObjName, QComboBox):
-            mainWidObjName.setCurrentIndex(-1)
-        # 4.
-        for child in mainWidObjName.findChildren(QWidget):
-            self.clearAllValue_toAllWidget(child)
+        return self.formResetter.reset(mainWidObjName)
 
     # Help 実行 関数 #####################################
 
@@ -654,7 +557,7 @@ class MainWindow(QMainWindow):
             #. 次に、閉じる要求を受信したときにトップレベル ウィンドウに対してのみ呼び出されます
         """
         # print(event)
-        self.saveSettings()  # UI設定の保存用オリジナルメソッド
+        self.saveSettings(wait_for_write = True)  # UI設定の保存用オリジナルメソッド(close 時は同期的に保存)
         # super(MainWindow, self).closeEvent(event)  # ここは無くても上手く発動するようです
     # 1. UI-1. メニュー コマンド群 ######################################################## end
 
@@ -680,54 +583,32 @@ class MainWindow(QMainWindow):
             - 継承することを前提に考えると、「__init__」で復元するのは好ましくありません
             - self.__settings.value から取得するデータは、
                 restoreGeometry以外は、型が string です！！
+                Container の状況は StateSchema で bool へ型変換し、作成時に復元しています
         """
         print('###' * 10)
         print(f'Restore...')
 
         # サイズの情報を 復元
-        self.restoreGeometry(self.__settings.value(self.iniFileParam['geo_iFP']))  # iniFile から 可変byte配列 を ゲット し、サイズの情報 を 復元操作
+        geometry = self.__settings.value(self.iniFileParam['geo_iFP'])  # iniFile から 可変byte配列 を ゲット
+        if geometry is not None:  # 初回は未保存です
+            self.restoreGeometry(geometry)  # サイズの情報 を 復元操作
         # print(f'\tRestore a \n\t\t'
         #       f'{self.iniFileParam["geo_iFP"]} \n\t\t\t'
         #       f'param: {...}'
         #       )
 
-        # ウィジェット(コンテナA用) の情報を 復元
-        contA_wid_isExpand: str = self.__settings.value(self.iniFileParam['contA_wid_expStat_iFP'])  # iniFile から isChecked を ゲット
-        if contA_wid_isExpand is True:
-            self.contA_wid.expand()
-        else:
-            self.contA_wid.collapse()
-        # print(f'\tRestore a \n\t\t'
-        #       f'{self.iniFileParam["contA_wid_expStat_iFP"]} \n\t\t\t'
-        #       f'param: {contA_wid_isExpand}'
-        #       )
-
-        # ウィジェット(コンテナB用) の情報を 復元
-        contB_wid_isExpand: str = self.__settings.value(self.iniFileParam['contB_wid_expStat_iFP'])  # iniFile から isChecked を ゲット
-        if contB_wid_isExpand is True:
-            self.contB_wid.expand()
-        else:
-            self.contB_wid.collapse()
-        # print(f'\tRestore a \n\t\t'
-        #       f'{self.iniFileParam["contB_wid_expStat_iFP"]} \n\t\t\t'
-        #       f'param: {contB_wid_isExpand}'
-        #       )
+        # Container の状況は、createUI での作成時に self.initialStates から復元済みです
 
         print(f'\tRestore a .INI file, from \n\t\t{self.filename}')
     # 4. UI-4. OptionVar を利用したパラメータ管理 コマンド群 ################################# end
 
 
 if __name__ == '__main__':
-    print(u'{}.py: loaded as script file'.format(__name__))
     test = MainWindow()
     test.createUI()
-else:
-    print(u'{}.py: loaded as module file'.format(__name__))
-    print('{}'.format(__file__))  # 実行したモジュールフルパスを表示する
+# Note: import 時には何も出力しません(Maya の Script Editor への出力は遅い為)
 # pprint.pprint(RT4_UI_PyMel.mro())  # メソッドを呼び出す順番が解ります
 
-print(u'モジュール名:{}\n'.format(__name__))  # 実行したモジュール名を表示する
-
 
 # 0): QMainWindow
 # |
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+u"""
+test_container_search.py
+
+ContainerSearch の索引が、content の変化に合わせて 作り直されることを確かめる テスト です
+
+    python -m unittest discover -s tests
+"""
+
+# 標準ライブラリ
+import os
+import sys
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# サードパーティライブラリ
+from PySide2.QtWidgets import QApplication, QWidget, QVBoxLayout, QGroupBox, QLabel
+
+# ローカルで作成したモジュール
+from Container import Container
+from ContainerGroup import ContainerGroup
+from ContainerSearch import ContainerSearch
+
+app = QApplication.instance() or QApplication([])
+
+
+class ContainerSearchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.window = QWidget()
+        layout = QVBoxLayout(self.window)
+        self.group = ContainerGroup(parent = self.window)
+        self.container = Container('GroupA', parent = self.window)
+        layout.addWidget(self.container)
+        self.group.add(self.container, 'contA')
+        content_layout = QVBoxLayout(self.container.contentWidget)
+        self.box = QGroupBox('Options', self.container.contentWidget)
+        content_layout.addWidget(self.box)
+        self.box_layout = QVBoxLayout(self.box)
+        self.search = ContainerSearch(self.group, parent = self.window)
+        self.window.show()
+        app.processEvents()
+
+    def tearDown(self):
+        self.window.deleteLater()
+        app.processEvents()
+
+    def test_nested_widget_added_after_search(self):
+        self.assertEqual(self.search.find('radius'), {})
+        self.box_layout.addWidget(QLabel('Radius', self.box))
+        app.processEvents()
+        self.assertEqual(self.search.find('radius'), {'contA': True})
+
+    def test_widget_in_nested_widget_added_after_search(self):
+        inner = QWidget(self.box)
+        self.box_layout.addWidget(inner)
+        self.assertEqual(self.search.find('radius'), {})
+        QVBoxLayout(inner).addWidget(QLabel('Radius', inner))
+        app.processEvents()
+        self.assertEqual(self.search.find('radius'), {'contA': True})
+
+    def test_title_change(self):
+        self.assertEqual(self.search.find('renamed'), {})
+        self.container.set_title('Renamed')
+        self.assertEqual(self.search.find('renamed'), {'contA': False})
+
+    def test_toggle_keeps_index(self):
+        self.search.find('options')
+        self.container.collapse()
+        self.container.expand()
+        app.processEvents()
+        self.assertFalse(self.search._dirty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+u"""
+test_form_handlers.py
+
+FormResetter / FormState が、入力フィールドだけを扱うことを確かめる テスト です
+
+    python -m unittest discover -s tests
+"""
+
+# 標準ライブラリ
+import os
+import sys
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# サードパーティライブラリ
+from PySide2.QtCore import Qt
+from PySide2.QtWidgets import QApplication, QWidget, QVBoxLayout, QScrollArea, QSlider, QSpinBox
+
+# ローカルで作成したモジュール
+from FormResetter import FormResetter
+from FormState import FormState
+
+app = QApplication.instance() or QApplication([])
+
+
+# スクロールエリアの中に SpinBox と Slider を持つ フォーム を作成する 関数
+def _create_form():
+    root = QWidget()
+    scroll = QScrollArea(root)
+    inner = QWidget()
+    layout = QVBoxLayout(inner)
+    spin_box = QSpinBox(inner)
+    spin_box.setValue(5)
+    slider = QSlider(Qt.Horizontal, inner)
+    slider.setValue(30)
+    layout.addWidget(spin_box)
+    layout.addWidget(slider)
+    scroll.setWidget(inner)
+    scroll.verticalScrollBar().setRange(0, 100)
+    scroll.verticalScrollBar().setValue(40)
+    return root, scroll, spin_box, slider
+
+
+class FormResetterTest(unittest.TestCase):
+
+    def test_reset_keeps_scroll_position(self):
+        root, scroll, spin_box, slider = _create_form()
+        self.assertEqual(FormResetter().reset(root), 2)
+        self.assertEqual(spin_box.value(), 0)
+        self.assertEqual(slider.value(), 0)
+        self.assertEqual(scroll.verticalScrollBar().value(), 40)
+
+
+class FormStateTest(unittest.TestCase):
+
+    def test_capture_ignores_scroll_bars(self):
+        root, scroll, spin_box, slider = _create_form()
+        widgets = [widget for path, widget in FormState().fields(root)]
+        self.assertEqual(widgets, [spin_box, slider])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+u"""
+test_painted_header.py
+
+PaintedHeader の作成と、sizeHint が Header と同じであることを確かめる テスト です
+
+    python -m unittest discover -s tests
+"""
+
+# 標準ライブラリ
+import os
+import sys
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# サードパーティライブラリ
+from PySide2.QtWidgets import QApplication, QWidget
+
+# ローカルで作成したモジュール
+from Container import Container, Header, PaintedHeader
+
+app = QApplication.instance() or QApplication([])
+
+
+class PaintedHeaderTest(unittest.TestCase):
+
+    def test_construct(self):
+        first = PaintedHeader('Group', QWidget())
+        second = PaintedHeader('Group', QWidget())
+        self.assertTrue(first.font().bold())
+        self.assertTrue(second.font().bold())
+
+    def test_size_hint_matches_header(self):
+        for title in ('Group', 'GroupA', 'A much longer title with spaces', '', 'Wj'):
+            header = Header(title, QWidget())
+            painted = PaintedHeader(title, QWidget())
+            self.assertEqual(painted.sizeHint(), header.sizeHint(), repr(title))
+
+    def test_size_hint_follows_title(self):
+        header = Header('Group', QWidget())
+        painted = PaintedHeader('Group', QWidget())
+        header.set_title('A longer title')
+        painted.set_title('A longer title')
+        self.assertEqual(painted.sizeHint(), header.sizeHint())
+
+    def test_container_size_hint_matches(self):
+        for title in ('Group', ''):
+            default = Container(title, header_class = Header)
+            painted = Container(title, header_class = PaintedHeader)
+            self.assertEqual(painted.sizeHint(), default.sizeHint(), repr(title))
+
+
+if __name__ == '__main__':
+    unittest.main()